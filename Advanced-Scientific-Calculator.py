@@ -1,22 +1,46 @@
+from startup_profiler import lazy_import, preload, profiler
+from memory_tracker import callback_size, deep_size, tracker
+import kivy
 from kivy.app import App
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.uix.scrollview import ScrollView
+from kivy.uix.modalview import ModalView
 from kivy.uix.popup import Popup
+from kivy.uix.spinner import Spinner
+profiler.checkpoint("import kivy")
 from kivy.core.window import Window
+profiler.checkpoint("create window")
+from kivy.uix.textinput import TextInput
 from kivy.graphics import Color, Rectangle, RoundedRectangle
 from kivy.clock import Clock
 from kivy.animation import Animation
 from kivy.properties import StringProperty, BooleanProperty, NumericProperty
 import math
+import os
+import sys
+import threading
 from typing import Optional, Callable, Dict, List, Tuple
 from enum import Enum
+from calculator_engine import (AngleMode, CalculatorEngine, check_expression, expression_error_message,
+                               function_error_message)
+from input_recorder import RECORD_ENV, EventRecorder
+from instrumentation import counts_errors, instrumented, metrics
+from session_store import SessionSnapshot, SessionState, SessionStore
+from variables_engine import DependencyGraph
 
-class AngleMode(Enum):
-    DEGREES = 'deg'
-    RADIANS = 'rad'
+np = lazy_import('numpy')
+complex_engine = lazy_import('complex_engine')
+matrix_engine = lazy_import('matrix_engine')
+precision_engine = lazy_import('precision_engine')
+programmer_engine = lazy_import('programmer_engine')
+result_cache = lazy_import('result_cache')
+series_engine = lazy_import('series_engine')
+stats_engine = lazy_import('stats_engine')
+unit_engine = lazy_import('unit_engine')
+profiler.checkpoint("import modules")
 
 class Theme(Enum):
     DARK = 'dark'
@@ -92,21 +116,33 @@ class CalculatorButton(Button):
         self.original_color = color
         self.background_color = color
 
-class Calculator(BoxLayout):
+class Calculator(BoxLayout, CalculatorEngine):
     display_text = StringProperty("0")
     history_text = StringProperty("")
     error_state = BooleanProperty(False)
     
-    MAX_DIGITS = 15
     MAX_HISTORY = 100
+    AUTOSAVE_INTERVAL = 30
     OPERATIONS = {"/": "÷", "*": "×", "-": "−", "+": "+", "**": "^"}
+    PROGRAMMER_OPERATORS = "+-*/%&|^<>"
+    SESSION_FIELDS = frozenset({
+        'memory_value', 'has_memory', 'current_theme', 'scientific_mode', 'angle_mode', 'precision_digits',
+        'total_expression', 'current_expression', 'programmer_mode', 'programmer_base', 'word_size'
+    })
+    DEFERRED_IMPORTS = ('numpy', 'complex_engine', 'precision_engine', 'programmer_engine', 'trig_kernels',
+                        'matrix_engine', 'stats_engine', 'series_engine', 'unit_engine')
     
-    def __init__(self, **kwargs):
+    session_version = 0
+    saved_version = -1
+    
+    def __init__(self, session_store: Optional[SessionStore] = None,
+                 result_cache: Optional['result_cache.ResultCache'] = None, **kwargs):
         super().__init__(orientation='vertical', **kwargs)
         
         self.total_expression = ""
         self.current_expression = ""
         self.last_result: Optional[float] = None
+        self.history_snapshot: Optional[SessionSnapshot] = None
         self.calculation_history: List[str] = []
         
         self.memory_value = 0.0
@@ -114,16 +150,128 @@ class Calculator(BoxLayout):
         
         self.scientific_mode = False
         self.angle_mode = AngleMode.DEGREES
+        self.precision_digits: Optional[int] = None
+        self.complex_mode = False
+        self.complex_display: Optional[str] = None
         self.pending_function: Optional[str] = None
         self.custom_root_mode = False
         self.root_power_value: Optional[float] = None
         
+        self.stats_mode = False
+        self.stats: Optional[RunningStats] = None
+        
+        self.programmer_mode = False
+        self.programmer_base = 'DEC'
+        self.word_size: Optional[int] = 64
+        self.unit_selection: Tuple[str, str, str] = ('length', 'm', 'ft')
+        self.series_selection: Tuple[str, str, str] = ('', '1', 'inf')
+        
+        self.matrix_mode = False
+        self.matrix_x: Optional[np.ndarray] = None
+        self.matrix_y: Optional[np.ndarray] = None
+        
+        self._variables: Optional[DependencyGraph] = None
+        
         self.current_theme = Theme.DARK
         self.btns_dict: Dict[str, CalculatorButton] = {}
+        self.button_panels: Dict[str, BoxLayout] = {}
+        self.menu_buttons: List[CalculatorButton] = []
+        self.help_layout: Optional[BoxLayout] = None
+        
+        self.session_store = session_store
+        self.result_cache = result_cache
+        self.recorder: Optional[EventRecorder] = None
+        restored = self._restore_session()
         
         self._setup_canvas()
         self._create_ui()
-        self._setup_keyboard()
+        if restored:
+            self._update_total_label()
+            self._update_label()
+            self._update_memory_display()
+        Window.bind(on_key_down=self._on_keyboard_down)
+        Window.bind(on_flip=self._on_first_frame)
+        if tracker.enabled:
+            self._track_memory()
+    
+    def _track_memory(self):
+        history = tracker.register('history', measure=lambda: deep_size(self._history),
+                                   evict=self._trim_history)
+        history.add_source(SessionSnapshot)
+        
+        caches = tracker.register('caches', measure=self._cache_size, evict=self._evict_caches,
+                                  detail=self._cache_detail)
+        for source in (result_cache.ResultCache, check_expression, precision_engine.analyze, unit_engine):
+            caches.add_source(source)
+        
+        widget_tree = tracker.register('widget_tree', evict=self._drop_inactive_panels,
+                                       detail=lambda: f"{sum(1 for _ in self.walk())} widgets, "
+                                                      f"{len(self.button_panels)} cached panels")
+        widget_tree.add_source(kivy)
+        widget_tree.add_source(CalculatorButton)
+        
+        buttons = tracker.register('btns_dict', measure=self._buttons_size, evict=self._drop_inactive_panels)
+        for name, member in vars(Calculator).items():
+            code = getattr(member, '__code__', None)
+            if code is None:
+                continue
+            if name == '_create_button' or (name.startswith('_create_') and name.endswith('_buttons')):
+                buttons.add_source(member)
+            elif name.startswith('_create_') or name in ('_build_panel', '_setup_canvas'):
+                widget_tree.add_source(member)
+            elif 'calculation_history' in code.co_names:
+                history.add_source(member)
+        
+        Clock.schedule_once(lambda dt: tracker.sample(), 2)
+        Clock.schedule_interval(lambda dt: tracker.sample(), tracker.interval)
+    
+    def _trim_history(self, budget: int) -> bool:
+        history = self.calculation_history
+        size = deep_size(history)
+        count = len(history)
+        while len(history) > 1 and size > budget:
+            size -= sys.getsizeof(history.pop(0))
+        if len(history) == count:
+            return False
+        self.session_version += 1
+        return True
+    
+    def _cache_size(self) -> int:
+        if self.result_cache is None:
+            return 0
+        with self.result_cache.lock:
+            entries = list(self.result_cache.entries.items())
+        return deep_size(entries)
+    
+    def _cache_detail(self) -> str:
+        results = len(self.result_cache.entries) if self.result_cache is not None else 0
+        return (f"{results} results, {check_expression.cache_info().currsize} parsed expressions, "
+                f"{precision_engine.analyze.cache_info().currsize} precision analyses")
+    
+    def _evict_caches(self, budget: int) -> bool:
+        cached = check_expression.cache_info().currsize + precision_engine.analyze.cache_info().currsize
+        check_expression.cache_clear()
+        precision_engine.analyze.cache_clear()
+        if self.result_cache is not None:
+            cached += self.result_cache.shrink(len(self.result_cache.entries) // 2)
+        return cached > 0
+    
+    def _buttons_size(self) -> int:
+        seen = set()
+        total = 0
+        for panel in self.button_panels.values():
+            total += sys.getsizeof(panel.buttons)
+            for button in set(panel.buttons.values()):
+                for observer in button.get_property_observers('on_press'):
+                    total += callback_size(getattr(observer, 'method', observer), seen)
+        return total
+    
+    def _drop_inactive_panels(self, budget: int) -> bool:
+        active = self._current_panel()
+        inactive = [name for name in self.button_panels if name != active]
+        for panel in inactive:
+            del self.button_panels[panel]
+        return bool(inactive)
         
     def _setup_canvas(self):
         with self.canvas.before:
@@ -135,14 +283,141 @@ class Calculator(BoxLayout):
         self.bg_rect.pos = self.pos
         self.bg_rect.size = self.size
     
+    @property
+    def variables(self) -> DependencyGraph:
+        if self._variables is None:
+            self._variables = DependencyGraph(builtins={
+                name: (lambda v, name=name: self._apply_scientific_function(name, v))
+                for name in ('sin', 'cos', 'tan', 'asin', 'acos', 'atan', 'sqrt', 'ln', 'log')
+            })
+        return self._variables
+    
+    @property
+    def calculation_history(self) -> List[str]:
+        if self.history_snapshot is not None:
+            snapshot, self.history_snapshot = self.history_snapshot, None
+            try:
+                self._history = snapshot.load_history() + self._history
+            except (OSError, ValueError):
+                pass
+        return self._history
+    
+    @calculation_history.setter
+    def calculation_history(self, history: List[str]):
+        self.history_snapshot = None
+        self._history = history
+        self.session_version += 1
+    
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.SESSION_FIELDS:
+            super().__setattr__('session_version', self.session_version + 1)
+    
+    def _add_history(self, entry: str):
+        history = self.calculation_history
+        history.append(entry)
+        if len(history) > self.MAX_HISTORY:
+            history.pop(0)
+        self.session_version += 1
+    
+    def _restore_session(self) -> bool:
+        snapshot = self.session_store.load() if self.session_store is not None else None
+        if snapshot is None:
+            return False
+        
+        state = snapshot.state
+        self.memory_value = state.memory_value
+        self.has_memory = state.has_memory
+        self.scientific_mode = state.scientific_mode
+        self.total_expression = state.total_expression
+        self.current_expression = state.current_expression
+        if state.precision_digits is not None and state.precision_digits in precision_engine.PRECISION_LEVELS:
+            self.precision_digits = state.precision_digits
+        if state.theme in {theme.value for theme in Theme}:
+            self.current_theme = Theme(state.theme)
+        if state.angle_mode in {mode.value for mode in AngleMode}:
+            self.angle_mode = AngleMode(state.angle_mode)
+        if state.programmer_base is not None and state.programmer_base in programmer_engine.BASES \
+                and state.word_size in programmer_engine.WORD_SIZES:
+            self.programmer_mode = True
+            self.scientific_mode = False
+            self.programmer_base = state.programmer_base
+            self.word_size = state.word_size
+        
+        if snapshot.history_count:
+            self.history_snapshot = snapshot
+        return True
+    
+    def capture_session(self) -> SessionState:
+        return SessionState(
+            memory_value=self.memory_value,
+            has_memory=self.has_memory,
+            theme=self.current_theme.value,
+            scientific_mode=self.scientific_mode,
+            angle_mode=self.angle_mode.value,
+            precision_digits=self.precision_digits,
+            total_expression=self.total_expression,
+            current_expression=self.current_expression,
+            history=list(self._history),
+            history_base=self.history_snapshot,
+            programmer_base=self.programmer_base if self.programmer_mode else None,
+            word_size=self.word_size
+        )
+    
+    def save_session(self, background: bool = True):
+        if self.recorder is not None:
+            self.recorder.flush()
+        if self.session_store is None or self.session_version == self.saved_version:
+            return
+        self.saved_version = self.session_version
+        state = self.capture_session()
+        if background:
+            self.session_store.save_in_background(state)
+            return
+        try:
+            self.session_store.save(state)
+        except OSError:
+            pass
+    
+    def _start_autosave(self):
+        if self.session_store is not None:
+            Clock.schedule_interval(lambda dt: self.save_session(), self.AUTOSAVE_INTERVAL)
+    
     def _create_ui(self):
-        self._create_top_menu()
-        self._create_display()
-        self._create_buttons()
-        self._create_help_label()
+        with profiler.step("_create_display"):
+            self._create_display()
+        with profiler.step("_create_buttons"):
+            self._create_buttons()
+        
+        self.deferred_steps: List[Tuple[str, Callable]] = [
+            ("_create_top_menu", self._create_top_menu),
+            ("_create_help_label", self._create_help_label),
+            ("_setup_keyboard", self._setup_keyboard),
+            ("_start_autosave", self._start_autosave),
+            ("prebuild scientific panel", lambda: self._prebuild_panel('scientific'))
+        ]
+        self.deferred_steps += [(f"import {name}", lambda name=name: preload(name))
+                                for name in self.DEFERRED_IMPORTS]
+    
+    def _on_first_frame(self, *args):
+        Window.unbind(on_flip=self._on_first_frame)
+        profiler.first_frame()
+        Clock.schedule_once(self._run_deferred_step)
+    
+    def _run_deferred_step(self, dt=None):
+        if not self.deferred_steps:
+            profiler.finish()
+            return
+        name, step = self.deferred_steps.pop(0)
+        with profiler.step(name):
+            step()
+        Clock.schedule_once(self._run_deferred_step)
+    
+    def complete_startup(self):
+        while self.deferred_steps:
+            self._run_deferred_step()
     
     def _setup_keyboard(self):
-        Window.bind(on_key_down=self._on_keyboard_down)
         self._keyboard = Window.request_keyboard(lambda: None, self)
     
     def _create_top_menu(self):
@@ -156,7 +431,7 @@ class Calculator(BoxLayout):
             background_color=theme_colors['op'],
             color=theme_colors['text']
         )
-        self.history_btn.bind(on_press=lambda x: self.show_history())
+        self.history_btn.bind(on_press=lambda x: self._handle_press('History', self.show_history, menu=True))
         
         self.theme_btn = CalculatorButton(
             text="Theme",
@@ -164,7 +439,7 @@ class Calculator(BoxLayout):
             background_color=theme_colors['op'],
             color=theme_colors['text']
         )
-        self.theme_btn.bind(on_press=lambda x: self.cycle_theme())
+        self.theme_btn.bind(on_press=lambda x: self._handle_press('Theme', self.cycle_theme, menu=True))
         
         self.mode_btn = CalculatorButton(
             text="Scientific",
@@ -172,13 +447,43 @@ class Calculator(BoxLayout):
             background_color=theme_colors['op'],
             color=theme_colors['text']
         )
-        self.mode_btn.bind(on_press=lambda x: self.toggle_scientific_mode())
+        self.mode_btn.bind(on_press=lambda x: self._handle_press('Scientific', self.toggle_scientific_mode, menu=True))
+        
+        self.stats_btn = CalculatorButton(
+            text="Stats",
+            font_size='14sp',
+            background_color=theme_colors['op'],
+            color=theme_colors['text']
+        )
+        self.stats_btn.bind(on_press=lambda x: self._handle_press('Stats', self.toggle_stats_mode, menu=True))
+        
+        self.programmer_btn = CalculatorButton(
+            text="Prog",
+            font_size='14sp',
+            background_color=theme_colors['op'],
+            color=theme_colors['text']
+        )
+        self.programmer_btn.bind(on_press=lambda x: self._handle_press('Prog', self.toggle_programmer_mode, menu=True))
         
         menu_layout.add_widget(self.history_btn)
         menu_layout.add_widget(self.theme_btn)
         menu_layout.add_widget(self.mode_btn)
+        self.matrix_btn = CalculatorButton(
+            text="Matrix",
+            font_size='14sp',
+            background_color=theme_colors['op'],
+            color=theme_colors['text']
+        )
+        self.matrix_btn.bind(on_press=lambda x: self._handle_press('Matrix', self.toggle_matrix_mode, menu=True))
+        
+        menu_layout.add_widget(self.stats_btn)
+        menu_layout.add_widget(self.matrix_btn)
+        menu_layout.add_widget(self.programmer_btn)
         
-        self.add_widget(menu_layout)
+        self.menu_buttons = [self.history_btn, self.theme_btn, self.mode_btn, self.stats_btn, self.matrix_btn,
+                             self.programmer_btn]
+        self._update_menu_texts()
+        self.add_widget(menu_layout, index=len(self.children))
     
     def _create_display(self):
         display_layout = GridLayout(cols=1, rows=3, size_hint=(1, 0.24), 
@@ -242,8 +547,44 @@ class Calculator(BoxLayout):
         self.help_label.bind(size=self.help_label.setter('text_size'))
         help_layout.add_widget(self.help_label)
         self.add_widget(help_layout)
+        self.help_layout = help_layout
     
     def _create_buttons(self):
+        panel = self._current_panel()
+        btns_container = self.button_panels.get(panel)
+        if btns_container is None:
+            btns_container = self._build_panel(panel)
+        
+        self.btns_dict = btns_container.buttons
+        if btns_container.theme != self.current_theme:
+            self._theme_buttons()
+            btns_container.theme = self.current_theme
+        if 'PREC' in self.btns_dict:
+            self.btns_dict['PREC'].text = self._precision_button_text()
+        if 'CPLX' in self.btns_dict:
+            self.btns_dict['CPLX'].text = self._complex_button_text()
+        if self.programmer_mode:
+            self._update_programmer_keys()
+        
+        self.add_widget(btns_container, index=1 if self.help_layout is not None else 0)
+        self.btns_container = btns_container
+    
+    def _current_panel(self) -> str:
+        if self.matrix_mode:
+            return 'matrix'
+        if self.stats_mode:
+            return 'stats'
+        if self.programmer_mode:
+            return 'programmer'
+        if self.scientific_mode:
+            return 'scientific'
+        return 'standard'
+    
+    def _prebuild_panel(self, panel: str):
+        if panel not in self.button_panels:
+            self._build_panel(panel)
+    
+    def _build_panel(self, panel: str) -> BoxLayout:
         btns_container = BoxLayout(
             orientation='vertical', 
             size_hint=(1, 0.645), 
@@ -251,13 +592,22 @@ class Calculator(BoxLayout):
             padding=[10, 5, 10, 10]
         )
         
-        if self.scientific_mode:
-            self._create_scientific_buttons(btns_container)
-        else:
-            self._create_standard_buttons(btns_container)
+        active_buttons = self.btns_dict
+        self.btns_dict = {}
+        builders = {
+            'matrix': self._create_matrix_buttons,
+            'stats': self._create_stats_buttons,
+            'programmer': self._create_programmer_buttons,
+            'scientific': self._create_scientific_buttons,
+            'standard': self._create_standard_buttons
+        }
+        builders[panel](btns_container)
         
-        self.add_widget(btns_container)
-        self.btns_container = btns_container
+        btns_container.buttons = self.btns_dict
+        btns_container.theme = self.current_theme
+        self.btns_dict = active_buttons
+        self.button_panels[panel] = btns_container
+        return btns_container
     
     def _create_standard_buttons(self, container: BoxLayout):
         theme_colors = THEMES[self.current_theme]
@@ -370,6 +720,14 @@ class Calculator(BoxLayout):
                 ('x[sup]y[/sup]', theme_colors['op'], lambda: self.append_operator('**')),
                 ('ln', theme_colors['op'], lambda: self.scientific_function('ln')),
                 ('log', theme_colors['op'], lambda: self.scientific_function('log'))
+            ],
+            [
+                ('VAR', theme_colors['op'], self.show_variables),
+                ('PREC', theme_colors['op'], self.cycle_precision),
+                ('CPLX', theme_colors['op'], self.cycle_complex_mode),
+                ('i', theme_colors['num'], self.add_imaginary_unit),
+                ('UNIT', theme_colors['op'], self.show_unit_converter),
+                ('Σ', theme_colors['op'], self.show_series)
             ]
         ]
         
@@ -430,7 +788,272 @@ class Calculator(BoxLayout):
         self.btns_dict['-'] = self.btns_dict['−']
         
         container.add_widget(bottom_row)
+    
+    def _create_stats_buttons(self, container: BoxLayout):
+        theme_colors = THEMES[self.current_theme]
+        
+        memory_row = BoxLayout(orientation='horizontal', spacing=2, size_hint=(1, 0.1))
+        memory_btns = [
+            ('MC', theme_colors['op'], self.memory_clear),
+            ('MR', theme_colors['op'], self.memory_recall),
+            ('M+', theme_colors['op'], self.memory_add),
+            ('M-', theme_colors['op'], self.memory_subtract),
+            ('CLRΣ', theme_colors['op'], self.clear_stats)
+        ]
+        
+        for txt, clr, func in memory_btns:
+            btn = self._create_button(txt, clr, func, font_size='13sp')
+            btn.size_hint_x = 0.2
+            memory_row.add_widget(btn)
+            self.btns_dict[txt] = btn
+        
+        container.add_widget(memory_row)
+        
+        stats_rows = [
+            [
+                ('n', theme_colors['op'], lambda: self.show_statistic('n')),
+                ('Σx', theme_colors['op'], lambda: self.show_statistic('sum')),
+                ('mean', theme_colors['op'], lambda: self.show_statistic('mean')),
+                ('var', theme_colors['op'], lambda: self.show_statistic('var'))
+            ],
+            [
+                ('s', theme_colors['op'], lambda: self.show_statistic('s')),
+                ('σ', theme_colors['op'], lambda: self.show_statistic('sigma')),
+                ('min', theme_colors['op'], lambda: self.show_statistic('min')),
+                ('max', theme_colors['op'], lambda: self.show_statistic('max'))
+            ],
+            [
+                ('Q1', theme_colors['op'], lambda: self.show_statistic('q1')),
+                ('med', theme_colors['op'], lambda: self.show_statistic('median')),
+                ('Q3', theme_colors['op'], lambda: self.show_statistic('q3')),
+                ('Load', theme_colors['op'], self.show_load_data)
+            ]
+        ]
+        
+        for row_btns in stats_rows:
+            row = BoxLayout(orientation='horizontal', spacing=2, size_hint=(1, 0.1))
+            for txt, clr, func in row_btns:
+                btn = self._create_button(txt, clr, func, font_size='13sp')
+                btn.size_hint_x = 0.25
+                row.add_widget(btn)
+                self.btns_dict[txt] = btn
+            container.add_widget(row)
+        
+        main_grid = GridLayout(cols=4, spacing=2, size_hint=(1, 0.4))
+        
+        main_btns = [
+            ('C', theme_colors['op'], self.clear),
+            ('DEL', theme_colors['op'], self.backspace),
+            ('%', theme_colors['op'], self.percentage),
+            ('÷', theme_colors['op'], lambda: self.append_operator("/")),
+            ('7', theme_colors['num'], lambda: self.add_to_expression('7')),
+            ('8', theme_colors['num'], lambda: self.add_to_expression('8')),
+            ('9', theme_colors['num'], lambda: self.add_to_expression('9')),
+            ('×', theme_colors['op'], lambda: self.append_operator("*")),
+            ('4', theme_colors['num'], lambda: self.add_to_expression('4')),
+            ('5', theme_colors['num'], lambda: self.add_to_expression('5')),
+            ('6', theme_colors['num'], lambda: self.add_to_expression('6')),
+            ('−', theme_colors['op'], lambda: self.append_operator("-")),
+            ('1', theme_colors['num'], lambda: self.add_to_expression('1')),
+            ('2', theme_colors['num'], lambda: self.add_to_expression('2')),
+            ('3', theme_colors['num'], lambda: self.add_to_expression('3')),
+            ('+', theme_colors['op'], lambda: self.append_operator("+"))
+        ]
+        
+        for txt, clr, func in main_btns:
+            btn = self._create_button(txt, clr, func, font_size='18sp')
+            main_grid.add_widget(btn)
+            self.btns_dict[txt] = btn
+        
+        container.add_widget(main_grid)
+        
+        bottom_row = BoxLayout(orientation='horizontal', spacing=2, size_hint=(1, 0.1))
+        
+        buttons = [
+            ('±', theme_colors['op'], self.toggle_sign),
+            ('0', theme_colors['num'], lambda: self.add_to_expression('0')),
+            ('.', theme_colors['num'], lambda: self.add_to_expression(".")),
+            ('DATA', theme_colors['special'], self.add_data_point)
+        ]
+        
+        for txt, clr, func in buttons:
+            btn = self._create_button(txt, clr, func, font_size='18sp')
+            btn.size_hint_x = 0.25
+            bottom_row.add_widget(btn)
+            self.btns_dict[txt] = btn
+        
+        self.btns_dict['/'] = self.btns_dict['÷']
+        self.btns_dict['*'] = self.btns_dict['×']
+        self.btns_dict['-'] = self.btns_dict['−']
+        
+        container.add_widget(bottom_row)
 
+    def _create_matrix_buttons(self, container: BoxLayout):
+        theme_colors = THEMES[self.current_theme]
+        
+        memory_row = BoxLayout(orientation='horizontal', spacing=2, size_hint=(1, 0.1))
+        memory_btns = [
+            ('MC', theme_colors['op'], self.memory_clear),
+            ('MR', theme_colors['op'], self.memory_recall),
+            ('M+', theme_colors['op'], self.memory_add),
+            ('M-', theme_colors['op'], self.memory_subtract)
+        ]
+        
+        for txt, clr, func in memory_btns:
+            btn = self._create_button(txt, clr, func, font_size='13sp')
+            btn.size_hint_x = 0.25
+            memory_row.add_widget(btn)
+            self.btns_dict[txt] = btn
+        
+        container.add_widget(memory_row)
+        
+        matrix_rows = [
+            [
+                ('det', theme_colors['op'], lambda: self.matrix_function('det')),
+                ('inv', theme_colors['op'], lambda: self.matrix_function('inv')),
+                ('A[sup]T[/sup]', theme_colors['op'], lambda: self.matrix_function('transpose')),
+                ('eig', theme_colors['op'], lambda: self.matrix_function('eig'))
+            ],
+            [
+                ('solve', theme_colors['op'], lambda: self.matrix_operation('solve')),
+                ('tr', theme_colors['op'], lambda: self.matrix_function('trace')),
+                ('SWAP', theme_colors['op'], self.matrix_swap),
+                ('Load', theme_colors['op'], self.show_load_matrix)
+            ]
+        ]
+        
+        for row_btns in matrix_rows:
+            row = BoxLayout(orientation='horizontal', spacing=2, size_hint=(1, 0.1))
+            for txt, clr, func in row_btns:
+                btn = self._create_button(txt, clr, func, font_size='13sp')
+                btn.size_hint_x = 0.25
+                row.add_widget(btn)
+                self.btns_dict[txt] = btn
+            container.add_widget(row)
+        
+        main_grid = GridLayout(cols=4, spacing=2, size_hint=(1, 0.5))
+        
+        main_btns = [
+            ('C', theme_colors['op'], self.clear),
+            ('DEL', theme_colors['op'], self.backspace),
+            (',', theme_colors['op'], lambda: self.add_to_expression(',')),
+            (';', theme_colors['op'], lambda: self.add_to_expression(';')),
+            ('7', theme_colors['num'], lambda: self.add_to_expression('7')),
+            ('8', theme_colors['num'], lambda: self.add_to_expression('8')),
+            ('9', theme_colors['num'], lambda: self.add_to_expression('9')),
+            ('×', theme_colors['op'], lambda: self.append_operator("*")),
+            ('4', theme_colors['num'], lambda: self.add_to_expression('4')),
+            ('5', theme_colors['num'], lambda: self.add_to_expression('5')),
+            ('6', theme_colors['num'], lambda: self.add_to_expression('6')),
+            ('−', theme_colors['op'], lambda: self.append_operator("-")),
+            ('1', theme_colors['num'], lambda: self.add_to_expression('1')),
+            ('2', theme_colors['num'], lambda: self.add_to_expression('2')),
+            ('3', theme_colors['num'], lambda: self.add_to_expression('3')),
+            ('+', theme_colors['op'], lambda: self.append_operator("+"))
+        ]
+        
+        for txt, clr, func in main_btns:
+            btn = self._create_button(txt, clr, func, font_size='18sp')
+            main_grid.add_widget(btn)
+            self.btns_dict[txt] = btn
+        
+        container.add_widget(main_grid)
+        
+        bottom_row = BoxLayout(orientation='horizontal', spacing=2, size_hint=(1, 0.1))
+        
+        buttons = [
+            ('±', theme_colors['op'], lambda: self.add_to_expression('-')),
+            ('0', theme_colors['num'], lambda: self.add_to_expression('0')),
+            ('.', theme_colors['num'], lambda: self.add_to_expression(".")),
+            ('ENT', theme_colors['special'], self.matrix_enter)
+        ]
+        
+        for txt, clr, func in buttons:
+            btn = self._create_button(txt, clr, func, font_size='18sp')
+            btn.size_hint_x = 0.25
+            bottom_row.add_widget(btn)
+            self.btns_dict[txt] = btn
+        
+        self.btns_dict['*'] = self.btns_dict['×']
+        self.btns_dict['-'] = self.btns_dict['−']
+        
+        container.add_widget(bottom_row)
+    
+    def _create_programmer_buttons(self, container: BoxLayout):
+        theme_colors = THEMES[self.current_theme]
+        
+        programmer_rows = [
+            [
+                ('HEX', theme_colors['op'], lambda: self.set_programmer_base('HEX')),
+                ('DEC', theme_colors['op'], lambda: self.set_programmer_base('DEC')),
+                ('OCT', theme_colors['op'], lambda: self.set_programmer_base('OCT')),
+                ('BIN', theme_colors['op'], lambda: self.set_programmer_base('BIN')),
+                ('WORD', theme_colors['op'], self.cycle_word_size)
+            ],
+            [
+                ('AND', theme_colors['op'], lambda: self.append_operator('&')),
+                ('OR', theme_colors['op'], lambda: self.append_operator('|')),
+                ('XOR', theme_colors['op'], lambda: self.append_operator('^')),
+                ('NOT', theme_colors['op'], self.bitwise_not),
+                ('MOD', theme_colors['op'], lambda: self.append_operator('%'))
+            ],
+            [
+                ('<<', theme_colors['op'], lambda: self.append_operator('<<')),
+                ('>>', theme_colors['op'], lambda: self.append_operator('>>')),
+                ('A', theme_colors['num'], lambda: self.add_to_expression('A')),
+                ('B', theme_colors['num'], lambda: self.add_to_expression('B')),
+                ('C', theme_colors['num'], lambda: self.add_to_expression('C'))
+            ],
+            [
+                ('D', theme_colors['num'], lambda: self.add_to_expression('D')),
+                ('E', theme_colors['num'], lambda: self.add_to_expression('E')),
+                ('F', theme_colors['num'], lambda: self.add_to_expression('F')),
+                ('AC', theme_colors['op'], self.clear),
+                ('DEL', theme_colors['op'], self.backspace)
+            ]
+        ]
+        
+        for row_btns in programmer_rows:
+            row = BoxLayout(orientation='horizontal', spacing=2, size_hint=(1, 0.1))
+            for txt, clr, func in row_btns:
+                btn = self._create_button(txt, clr, func, font_size='13sp')
+                btn.size_hint_x = 0.2
+                row.add_widget(btn)
+                self.btns_dict[txt] = btn
+            container.add_widget(row)
+        
+        main_grid = GridLayout(cols=4, spacing=2, size_hint=(1, 0.5))
+        
+        main_btns = [
+            ('7', theme_colors['num'], lambda: self.add_to_expression('7')),
+            ('8', theme_colors['num'], lambda: self.add_to_expression('8')),
+            ('9', theme_colors['num'], lambda: self.add_to_expression('9')),
+            ('÷', theme_colors['op'], lambda: self.append_operator("/")),
+            ('4', theme_colors['num'], lambda: self.add_to_expression('4')),
+            ('5', theme_colors['num'], lambda: self.add_to_expression('5')),
+            ('6', theme_colors['num'], lambda: self.add_to_expression('6')),
+            ('×', theme_colors['op'], lambda: self.append_operator("*")),
+            ('1', theme_colors['num'], lambda: self.add_to_expression('1')),
+            ('2', theme_colors['num'], lambda: self.add_to_expression('2')),
+            ('3', theme_colors['num'], lambda: self.add_to_expression('3')),
+            ('−', theme_colors['op'], lambda: self.append_operator("-")),
+            ('±', theme_colors['op'], self.toggle_sign),
+            ('0', theme_colors['num'], lambda: self.add_to_expression('0')),
+            ('=', theme_colors['special'], self.evaluate),
+            ('+', theme_colors['op'], lambda: self.append_operator("+"))
+        ]
+        
+        for txt, clr, func in main_btns:
+            btn = self._create_button(txt, clr, func, font_size='18sp')
+            main_grid.add_widget(btn)
+            self.btns_dict[txt] = btn
+        
+        self.btns_dict['/'] = self.btns_dict['÷']
+        self.btns_dict['*'] = self.btns_dict['×']
+        self.btns_dict['-'] = self.btns_dict['−']
+        
+        container.add_widget(main_grid)
+    
     def _create_button(self, text: str, color: tuple, callback: Callable, 
                        font_size: str = '24sp') -> CalculatorButton:
         theme_colors = THEMES[self.current_theme]
@@ -440,13 +1063,26 @@ class Calculator(BoxLayout):
             background_color=color, 
             color=theme_colors['text']
         )
-        btn.bind(on_press=lambda x: callback())
+        btn.bind(on_press=lambda x: self._handle_press(text, callback))
         return btn
     
+    def _handle_press(self, label: str, callback: Callable, menu: bool = False):
+        if self.recorder is not None:
+            self.recorder.record_press(label, menu)
+        callback()
+    
     def add_to_expression(self, value: str):
         if self.error_state:
             self.clear()
         
+        if self.matrix_mode:
+            self._add_matrix_entry(value)
+            return
+        
+        if self.programmer_mode:
+            self._add_programmer_digit(value)
+            return
+        
         if value == "0" and self.current_expression == "0":
             return
         
@@ -466,7 +1102,7 @@ class Calculator(BoxLayout):
         if self.current_expression == "0" and value != ".":
             self.current_expression = value
         else:
-            if len(self.current_expression) < self.MAX_DIGITS:
+            if len(self.current_expression) < max(self.MAX_DIGITS, self.precision_digits or 0):
                 self.current_expression += value
         
         self._update_label()
@@ -476,23 +1112,40 @@ class Calculator(BoxLayout):
             self.clear()
             return
         
+        if self.matrix_mode:
+            matrix_ops = {'+': 'add', '-': 'subtract', '*': 'multiply', '/': 'solve'}
+            if operator in matrix_ops:
+                self.matrix_operation(matrix_ops[operator])
+            return
+        
         if self.current_expression:
-            self.total_expression += self.current_expression + operator
+            self.total_expression += self._operand_text(self.current_expression) + operator
             self.current_expression = ""
             self.last_result = None
             self._update_total_label()
             self._update_label()
-        elif self.total_expression and self.total_expression[-1] in ['+', '-', '*', '/', '**']:
-            self.total_expression = self.total_expression[:-1] + operator
-            if operator == '**':
-                self.total_expression = self.total_expression[:-1] + operator
+        elif self._trailing_operator():
+            self.total_expression = self.total_expression[:-len(self._trailing_operator())] + operator
             self._update_total_label()
         elif self.last_result is not None:
-            self.total_expression = str(self.last_result) + operator
+            if isinstance(self.last_result, complex):
+                self.total_expression = self._operand_text(self._format_number(self.last_result)) + operator
+            else:
+                self.total_expression = str(self.last_result) + operator
             self.current_expression = ""
             self.last_result = None
             self._update_total_label()
+    
+    def _trailing_operator(self) -> str:
+        operators = ('<<', '>>', *self.PROGRAMMER_OPERATORS) if self.programmer_mode else ('**', '+', '-', '*', '/')
+        return next((op for op in operators if self.total_expression.endswith(op)), "")
+    
+    def _operand_text(self, text: str) -> str:
+        if self.complex_mode and 'i' in text and not text.startswith('('):
+            return f"({text})"
+        return text
 
+    @instrumented
     def evaluate(self):
         if self.error_state:
             self.clear()
@@ -502,6 +1155,14 @@ class Calculator(BoxLayout):
             self._execute_pending_function()
             return
         
+        if self.matrix_mode:
+            self.matrix_enter()
+            return
+        
+        if self.programmer_mode:
+            self.programmer_evaluate()
+            return
+        
         try:
             full_expr = self.total_expression + self.current_expression
             if not full_expr or (full_expr and full_expr[-1] in ['+', '-', '*', '/', '**']):
@@ -509,40 +1170,27 @@ class Calculator(BoxLayout):
             
             display_expr = self._format_expression_for_display(full_expr)
             
-            result = eval(full_expr)
+            result_str = self.compute_expression(full_expr)
             
-            if not isinstance(result, (int, float)):
-                raise ValueError("Invalid result type")
+            self._add_history(f"{display_expr} = {result_str}")
             
-            if abs(result) > 1e15:
-                raise OverflowError("Number too large")
+            self.current_expression = result_str
+            self.last_result = self.parse_value(result_str)
+            self.total_expression = ""
             
-            result_str = self._format_number(result)
-            
-            self.calculation_history.append(f"{display_expr} = {result_str}")
-            if len(self.calculation_history) > self.MAX_HISTORY:
-                self.calculation_history.pop(0)
-            
-            self.current_expression = result_str
-            self.last_result = float(result_str)
-            self.total_expression = ""
-            
-        except ZeroDivisionError:
-            self._show_error("Cannot divide by zero")
-        except OverflowError:
-            self._show_error("Number too large")
         except Exception as e:
-            self._show_error("Error")
+            self._show_error(expression_error_message(e))
         
         self._update_total_label()
         self._update_label()
     
+    @instrumented
     def _execute_pending_function(self):
         if not self.current_expression or self.current_expression == "0":
             return
         
         try:
-            value = float(self.current_expression)
+            value = self.parse_value(self.current_expression)
             func_name = self.pending_function
             
             if func_name == 'custom_root':
@@ -556,11 +1204,7 @@ class Calculator(BoxLayout):
                     return
                 else:
                     root_power = self.root_power_value
-                    if root_power == 0:
-                        raise ValueError("Root power cannot be zero")
-                    if value < 0 and root_power % 2 == 0:
-                        raise ValueError("Cannot calculate even root of negative number")
-                    result = value ** (1 / root_power)
+                    result = self._root_safe(value, root_power)
                     display_text = f"{int(root_power)}√({value})"
                     self.root_power_value = None
                     self.custom_root_mode = False
@@ -573,20 +1217,15 @@ class Calculator(BoxLayout):
             
             result_str = self._format_number(result)
             
-            self.calculation_history.append(f"{display_text} = {result_str}")
-            if len(self.calculation_history) > self.MAX_HISTORY:
-                self.calculation_history.pop(0)
+            self._add_history(f"{display_text} = {result_str}")
             
             self.current_expression = result_str
             self.pending_function = None
             self.total_label.text = ""
             self._update_label()
             
-        except ValueError as e:
-            self._show_error(str(e))
-            self._reset_pending_function()
-        except Exception:
-            self._show_error("Math Error")
+        except Exception as e:
+            self._show_error(function_error_message(e))
             self._reset_pending_function()
     
     def _reset_pending_function(self):
@@ -595,6 +1234,7 @@ class Calculator(BoxLayout):
         self.root_power_value = None
         self.total_label.text = ""
     
+    @instrumented
     def scientific_function(self, func_name: str):
         if self.error_state:
             self.clear()
@@ -602,97 +1242,17 @@ class Calculator(BoxLayout):
         
         if self.current_expression and self.current_expression != "0":
             try:
-                value = float(self.current_expression)
-                result = self._apply_scientific_function(func_name, value)
-                
-                if abs(result) > 1e15:
-                    raise OverflowError("Number too large")
-                
-                self.current_expression = self._format_number(result)
+                value = self.parse_value(self.current_expression)
+                self.current_expression = self.compute_function(func_name, value)
                 self._update_label()
                 
-            except ValueError as e:
-                self._show_error(str(e))
-            except Exception:
-                self._show_error("Math Error")
+            except Exception as e:
+                self._show_error(function_error_message(e))
         else:
             self.pending_function = func_name
             self.current_expression = ""
             self.total_label.text = self._get_function_prompt(func_name)
     
-    def _apply_scientific_function(self, func_name: str, value: float) -> float:
-        angle_rad = math.radians(value) if self.angle_mode == AngleMode.DEGREES else value
-        
-        function_map = {
-            'sin': lambda v: math.sin(angle_rad),
-            'cos': lambda v: math.cos(angle_rad),
-            'tan': lambda v: math.tan(angle_rad),
-            'asin': lambda v: self._asin_safe(v),
-            'acos': lambda v: self._acos_safe(v),
-            'atan': lambda v: self._atan_safe(v),
-            'csc': lambda v: self._csc_safe(angle_rad),
-            'sec': lambda v: self._sec_safe(angle_rad),
-            'cot': lambda v: self._cot_safe(angle_rad),
-            'sqrt': lambda v: self._sqrt_safe(v),
-            'ln': lambda v: self._ln_safe(v),
-            'log': lambda v: self._log_safe(v),
-            'square': lambda v: v ** 2
-        }
-        
-        if func_name not in function_map:
-            raise ValueError(f"Unknown function: {func_name}")
-        
-        return function_map[func_name](value)
-    
-    def _asin_safe(self, value: float) -> float:
-        if value < -1 or value > 1:
-            raise ValueError("Domain error: arcsin requires -1 ≤ x ≤ 1")
-        result = math.asin(value)
-        return math.degrees(result) if self.angle_mode == AngleMode.DEGREES else result
-    
-    def _acos_safe(self, value: float) -> float:
-        if value < -1 or value > 1:
-            raise ValueError("Domain error: arccos requires -1 ≤ x ≤ 1")
-        result = math.acos(value)
-        return math.degrees(result) if self.angle_mode == AngleMode.DEGREES else result
-    
-    def _atan_safe(self, value: float) -> float:
-        result = math.atan(value)
-        return math.degrees(result) if self.angle_mode == AngleMode.DEGREES else result
-    
-    def _csc_safe(self, angle_rad: float) -> float:
-        sin_val = math.sin(angle_rad)
-        if abs(sin_val) < 1e-10:
-            raise ValueError("Math error: csc undefined")
-        return 1 / sin_val
-    
-    def _sec_safe(self, angle_rad: float) -> float:
-        cos_val = math.cos(angle_rad)
-        if abs(cos_val) < 1e-10:
-            raise ValueError("Math error: sec undefined")
-        return 1 / cos_val
-    
-    def _cot_safe(self, angle_rad: float) -> float:
-        tan_val = math.tan(angle_rad)
-        if abs(tan_val) < 1e-10:
-            raise ValueError("Math error: cot undefined")
-        return 1 / tan_val
-    
-    def _sqrt_safe(self, value: float) -> float:
-        if value < 0:
-            raise ValueError("Cannot calculate square root of negative number")
-        return math.sqrt(value)
-    
-    def _ln_safe(self, value: float) -> float:
-        if value <= 0:
-            raise ValueError("Cannot calculate ln of non-positive number")
-        return math.log(value)
-    
-    def _log_safe(self, value: float) -> float:
-        if value <= 0:
-            raise ValueError("Cannot calculate log of non-positive number")
-        return math.log10(value)
-    
     def _get_function_prompt(self, func_name: str) -> str:
         prompts = {
             'sqrt': '√(',
@@ -756,21 +1316,454 @@ class Calculator(BoxLayout):
             self.current_expression = constants[constant_name]
             self._update_label()
     
+    def add_data_point(self):
+        if self.error_state:
+            self.clear()
+            return
+        
+        if self.total_expression:
+            self.evaluate()
+            if self.error_state:
+                return
+        
+        if not self._is_valid_expression():
+            return
+        
+        try:
+            self.stats.add(float(self.current_expression))
+        except ValueError as e:
+            self._show_error(str(e))
+            self._update_label()
+            return
+        
+        self.current_expression = ""
+        self.last_result = None
+        self.total_label.text = f"n = {self.stats.n}"
+        self._update_label()
+    
+    def show_statistic(self, stat_name: str):
+        if self.error_state:
+            self.clear()
+        
+        getters = {
+            'n': lambda s: s.n,
+            'sum': lambda s: s.total,
+            'mean': lambda s: s.mean,
+            'var': lambda s: s.variance,
+            's': lambda s: s.std_dev,
+            'sigma': lambda s: s.population_std_dev,
+            'min': lambda s: s.minimum,
+            'max': lambda s: s.maximum,
+            'q1': lambda s: s.quantile(0.25),
+            'median': lambda s: s.quantile(0.5),
+            'q3': lambda s: s.quantile(0.75)
+        }
+        
+        try:
+            if stat_name != 'n' and self.stats.n == 0:
+                raise ValueError("No data points")
+            result = getters[stat_name](self.stats)
+            self.current_expression = self._format_number(result)
+            self.last_result = float(self.current_expression)
+            self.total_expression = ""
+            approx = "" if self.stats.is_exact_quantiles or stat_name not in ('q1', 'median', 'q3') else "≈ "
+            self.total_label.text = f"{approx}{stat_name} (n = {self.stats.n})"
+        except ValueError as e:
+            self._show_error(str(e))
+        
+        self._update_label()
+    
+    def clear_stats(self):
+        self.stats.clear()
+        self.clear()
+        self.total_label.text = "n = 0"
+    
+    def show_load_data(self):
+        self._show_path_popup(
+            "Load Data",
+            "Path to .npy, .bin/.dat (float64) or text column file",
+            self._load_data_file,
+            with_column=True
+        )
+    
+    def _show_path_popup(self, title: str, hint_text: str,
+                         on_load: Callable[[str, int], None], with_column: bool = False):
+        theme_colors = THEMES[self.current_theme]
+        content = BoxLayout(orientation='vertical', padding=10, spacing=10)
+        
+        path_input = TextInput(
+            hint_text=hint_text,
+            multiline=False,
+            size_hint=(1, 0.3)
+        )
+        column_input = TextInput(
+            text="0",
+            hint_text="Column",
+            multiline=False,
+            input_filter='int',
+            size_hint=(1, 0.3)
+        )
+        content.add_widget(path_input)
+        if with_column:
+            content.add_widget(column_input)
+        
+        btn_layout = BoxLayout(size_hint=(1, 0.4), spacing=5)
+        load_btn = Button(
+            text="Load",
+            background_color=theme_colors['special'],
+            color=theme_colors['text']
+        )
+        close_btn = Button(
+            text="Close",
+            background_color=theme_colors['op'],
+            color=theme_colors['text']
+        )
+        btn_layout.add_widget(load_btn)
+        btn_layout.add_widget(close_btn)
+        content.add_widget(btn_layout)
+        
+        popup = Popup(
+            title=title,
+            content=content,
+            size_hint=(0.9, 0.4),
+            background_color=theme_colors['bg']
+        )
+        
+        def load(*args):
+            path = path_input.text.strip()
+            if not path:
+                return
+            popup.dismiss()
+            on_load(path, int(column_input.text or 0))
+        
+        load_btn.bind(on_press=load)
+        path_input.bind(on_text_validate=load)
+        close_btn.bind(on_press=popup.dismiss)
+        popup.open()
+    
+    def _load_data_file(self, path: str, column: int):
+        self.total_label.text = "Loading data..."
+        
+        def worker():
+            loaded = stats_engine.RunningStats()
+            try:
+                loaded.add_file(path, column=column)
+            except (OSError, ValueError) as e:
+                message = str(e) if isinstance(e, ValueError) else "Cannot read data file"
+                Clock.schedule_once(lambda dt: self._on_data_load_failed(message))
+                return
+            Clock.schedule_once(lambda dt: self._on_data_loaded(loaded))
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _on_data_loaded(self, loaded: 'stats_engine.RunningStats'):
+        self.stats.merge(loaded)
+        self.total_label.text = f"n = {self.stats.n}"
+    
+    def _on_data_load_failed(self, message: str):
+        self.total_label.text = ""
+        self._show_error(message)
+        self._update_label()
+    
+    def _add_matrix_entry(self, value: str):
+        entry = self.current_expression
+        cell = entry.replace(';', ',').split(',')[-1]
+        
+        if value in (',', ';'):
+            if not cell or cell in ('-', '.'):
+                return
+        elif value == '-':
+            if cell:
+                return
+        elif value == '.':
+            if '.' in cell:
+                return
+            if not cell or cell == '-':
+                value = '0.'
+        
+        if len(entry) + len(value) > matrix_engine.MAX_ENTRY_LENGTH:
+            return
+        
+        self.current_expression = entry + value
+        self._update_label()
+    
+    def matrix_enter(self):
+        if self.error_state:
+            self.clear()
+            return
+        
+        try:
+            if self.current_expression:
+                matrix = matrix_engine.parse_matrix(self.current_expression)
+            elif self.matrix_x is not None:
+                matrix = self.matrix_x
+            else:
+                return
+        except ValueError as e:
+            self._show_error(str(e))
+            self._update_label()
+            return
+        
+        self._push_matrix(matrix)
+    
+    def matrix_swap(self):
+        if self.error_state:
+            self.clear()
+            return
+        
+        self.matrix_x, self.matrix_y = self.matrix_y, self.matrix_x
+        self._update_matrix_labels()
+    
+    def matrix_function(self, func_name: str):
+        if self.error_state:
+            self.clear()
+            return
+        
+        if self.current_expression:
+            self.matrix_enter()
+            if self.error_state:
+                return
+        
+        if self.matrix_x is None:
+            return
+        
+        function_map = {
+            'det': (matrix_engine.determinant, 'det'),
+            'inv': (matrix_engine.inverse, 'inv'),
+            'transpose': (matrix_engine.transpose, 'transpose'),
+            'trace': (matrix_engine.trace, 'tr'),
+            'eig': (matrix_engine.eigenvalues, 'eig')
+        }
+        func, label = function_map[func_name]
+        
+        try:
+            result = func(self.matrix_x)
+        except (ValueError, OverflowError) as e:
+            self._show_error(str(e))
+            self._update_label()
+            return
+        
+        self._record_matrix_result(f"{label}{matrix_engine.describe(self.matrix_x)}", result)
+        self.matrix_x = result if isinstance(result, np.ndarray) else np.array([[result]])
+        self._update_matrix_labels()
+    
+    def matrix_operation(self, op_name: str):
+        if self.error_state:
+            self.clear()
+            return
+        
+        if self.current_expression:
+            self.matrix_enter()
+            if self.error_state:
+                return
+        
+        if self.matrix_x is None or self.matrix_y is None:
+            return
+        
+        operation_map = {
+            'add': (matrix_engine.add, '+'),
+            'subtract': (matrix_engine.subtract, '−'),
+            'multiply': (matrix_engine.multiply, '×'),
+            'solve': (matrix_engine.solve, '\\')
+        }
+        func, symbol = operation_map[op_name]
+        
+        try:
+            result = func(self.matrix_y, self.matrix_x)
+        except (ValueError, OverflowError) as e:
+            self._show_error(str(e))
+            self._update_label()
+            return
+        
+        expr = f"{matrix_engine.describe(self.matrix_y)} {symbol} {matrix_engine.describe(self.matrix_x)}"
+        self._record_matrix_result(expr, result)
+        self.matrix_x = result
+        self.matrix_y = None
+        self._update_matrix_labels()
+    
+    def _push_matrix(self, matrix: 'np.ndarray'):
+        self.matrix_y = self.matrix_x
+        self.matrix_x = matrix
+        self.current_expression = ""
+        self._update_matrix_labels()
+    
+    def _record_matrix_result(self, expr: str, result):
+        if isinstance(result, np.ndarray):
+            result_str = matrix_engine.describe(result)
+        else:
+            result_str = self._format_number(complex_engine.clean(result))
+        
+        self._add_history(f"{expr} = {result_str}")
+    
+    def _update_matrix_labels(self):
+        parts = []
+        if self.matrix_y is not None:
+            parts.append(f"Y: {matrix_engine.describe(self.matrix_y)}")
+        if self.matrix_x is not None:
+            parts.append(f"X: {matrix_engine.describe(self.matrix_x)}")
+        self.total_label.text = "   ".join(parts)
+        self._update_label()
+    
+    def show_load_matrix(self):
+        self._show_path_popup(
+            "Load Matrix",
+            "Path to .npy or comma/space separated text file",
+            lambda path, column: self._load_matrix_file(path)
+        )
+    
+    def _load_matrix_file(self, path: str):
+        try:
+            matrix = matrix_engine.load_matrix(path)
+        except OSError:
+            self._show_error("Cannot read matrix file")
+            self._update_label()
+            return
+        except ValueError as e:
+            self._show_error(str(e))
+            self._update_label()
+            return
+        
+        self._push_matrix(matrix)
+    
+    def _add_programmer_digit(self, digit: str):
+        base = programmer_engine.BASES[self.programmer_base]
+        if not programmer_engine.valid_digit(digit, base):
+            return
+        
+        if self.last_result is not None and not self.total_expression:
+            self.current_expression = ""
+            self.last_result = None
+        
+        if self.current_expression in ("0", "-0"):
+            self.current_expression = self.current_expression[:-1] + digit.upper()
+        elif len(self.current_expression.lstrip('-')) < programmer_engine.max_input_digits(base, self.word_size):
+            self.current_expression += digit.upper()
+        self._update_label()
+    
+    def programmer_evaluate(self):
+        full_expr = self.total_expression + self.current_expression
+        if not full_expr or full_expr[-1] in self.PROGRAMMER_OPERATORS:
+            return
+        
+        base = programmer_engine.BASES[self.programmer_base]
+        try:
+            value = programmer_engine.evaluate(full_expr, base, self.word_size)
+            result_str = programmer_engine.format_int(value, base, self.word_size)
+        except Exception as e:
+            self._show_error(expression_error_message(e))
+            self._update_label()
+            return
+        
+        display_expr = programmer_engine.abbreviate(self._format_expression_for_display(full_expr))
+        self._add_history(
+            f"{display_expr} = {programmer_engine.abbreviate(result_str)} {self.programmer_base}")
+        
+        self.current_expression = result_str
+        self.last_result = value
+        self.total_expression = ""
+        self._update_total_label()
+        self._update_label()
+    
+    def bitwise_not(self):
+        if self.error_state:
+            self.clear()
+            return
+        self._replace_programmer_value(lambda value: ~value)
+    
+    def _replace_programmer_value(self, operation: Callable[[int], int]):
+        if not self._is_valid_expression():
+            return
+        base = programmer_engine.BASES[self.programmer_base]
+        try:
+            value = programmer_engine.parse_int(self.current_expression, base)
+            value = programmer_engine.wrap(operation(value), self.word_size)
+        except (ValueError, OverflowError) as e:
+            self._show_error(expression_error_message(e))
+            self._update_label()
+            return
+        self.current_expression = programmer_engine.format_int(value, base, self.word_size)
+        self._update_label()
+    
+    def set_programmer_base(self, name: str):
+        if self.error_state:
+            self.clear()
+        
+        old_base = programmer_engine.BASES[self.programmer_base]
+        new_base = programmer_engine.BASES[name]
+        try:
+            self.current_expression = programmer_engine.convert_expression(
+                self.current_expression, old_base, new_base, self.word_size)
+            self.total_expression = programmer_engine.convert_expression(
+                self.total_expression, old_base, new_base, self.word_size)
+        except (ValueError, OverflowError):
+            self.current_expression = ""
+            self.total_expression = ""
+        
+        self.programmer_base = name
+        self._update_programmer_keys()
+        self._update_total_label()
+        self._update_label()
+    
+    def cycle_word_size(self):
+        sizes = programmer_engine.WORD_SIZES
+        self.word_size = sizes[(sizes.index(self.word_size) + 1) % len(sizes)]
+        self._replace_programmer_value(lambda value: value)
+        self._update_programmer_keys()
+    
+    def _update_programmer_keys(self):
+        base = programmer_engine.BASES[self.programmer_base]
+        for digit in programmer_engine.DIGITS:
+            if digit in self.btns_dict:
+                self.btns_dict[digit].disabled = not programmer_engine.valid_digit(digit, base)
+        if 'WORD' in self.btns_dict:
+            self.btns_dict['WORD'].text = self._word_size_button_text()
+        self._theme_buttons()
+    
+    def _word_size_button_text(self) -> str:
+        if self.word_size is None:
+            return "BIG"
+        return f"{self.word_size}-bit"
+    
     def memory_clear(self):
         self.memory_value = 0.0
         self.has_memory = False
         self._update_memory_display()
     
     def memory_recall(self):
-        if self.has_memory:
-            self.current_expression = str(self.memory_value)
+        if not self.has_memory:
+            return
+        
+        if isinstance(self.memory_value, np.ndarray):
+            if self.matrix_mode:
+                self._push_matrix(self.memory_value)
+            else:
+                self._show_error("Matrix in memory")
+                self._update_label()
+            return
+        
+        if isinstance(self.memory_value, complex) and not self.complex_mode:
+            self._show_error("Complex number in memory")
             self._update_label()
+            return
+        
+        if self.matrix_mode:
+            self._push_matrix(np.array([[self.memory_value]]))
+            return
+        
+        self.current_expression = self._memory_text()
+        self._update_label()
     
     def memory_add(self):
+        if self.matrix_mode:
+            self._matrix_memory_update(1, "M+")
+            return
+        
         try:
             if self._is_valid_expression():
-                value = float(self.current_expression)
-                self.memory_value += value
+                value = self.parse_value(self.current_expression)
+                if isinstance(self.memory_value, np.ndarray):
+                    raise ValueError("Matrix in memory")
+                self.memory_value = complex_engine.clean(self.memory_value + value)
                 self.has_memory = True
                 self._update_memory_display()
                 self._show_memory_feedback("M+")
@@ -778,32 +1771,75 @@ class Calculator(BoxLayout):
             pass
     
     def memory_subtract(self):
+        if self.matrix_mode:
+            self._matrix_memory_update(-1, "M-")
+            return
+        
         try:
             if self._is_valid_expression():
-                value = float(self.current_expression)
-                self.memory_value -= value
+                value = self.parse_value(self.current_expression)
+                if isinstance(self.memory_value, np.ndarray):
+                    raise ValueError("Matrix in memory")
+                self.memory_value = complex_engine.clean(self.memory_value - value)
                 self.has_memory = True
                 self._update_memory_display()
                 self._show_memory_feedback("M-")
         except Exception:
             pass
     
+    def _matrix_memory_update(self, sign: int, operation: str):
+        if self.current_expression:
+            self.matrix_enter()
+            if self.error_state:
+                return
+        
+        if self.matrix_x is None:
+            return
+        
+        if not self.has_memory or not isinstance(self.memory_value, np.ndarray):
+            self.memory_value = self.matrix_x if sign > 0 else -self.matrix_x
+        else:
+            try:
+                if sign > 0:
+                    self.memory_value = matrix_engine.add(self.memory_value, self.matrix_x)
+                else:
+                    self.memory_value = matrix_engine.subtract(self.memory_value, self.matrix_x)
+            except ValueError as e:
+                self._show_error(str(e))
+                self._update_label()
+                return
+        
+        self.has_memory = True
+        self._update_memory_display()
+        self._show_memory_feedback(operation)
+    
     def _is_valid_expression(self) -> bool:
-        error_messages = ["Error", "Cannot divide by zero", "Number too large", "Math Error"]
+        error_messages = ["Error", "Cannot divide by zero", "Number too large", "Math Error", "Invalid input"]
         return self.current_expression and self.current_expression not in error_messages
     
     def _update_memory_display(self):
         if self.has_memory:
-            self.memory_label.text = f"  Memory: {self.memory_value}"
+            self.memory_label.text = f"  Memory: {self._memory_text()}"
         else:
             self.memory_label.text = ""
     
+    def _memory_text(self) -> str:
+        if isinstance(self.memory_value, np.ndarray):
+            return matrix_engine.describe(self.memory_value)
+        if isinstance(self.memory_value, complex):
+            return self._format_number(self.memory_value)
+        return str(self.memory_value)
+    
     def _show_memory_feedback(self, operation: str):
         original_text = self.memory_label.text
-        self.memory_label.text = f"  {operation}: {self.memory_value}"
+        self.memory_label.text = f"  {operation}: {self._memory_text()}"
         Clock.schedule_once(lambda dt: setattr(self.memory_label, 'text', original_text), 1.0)
     
     def clear(self):
+        if self.matrix_mode and not self.current_expression and not self.error_state:
+            self.matrix_x = None
+            self.matrix_y = None
+        
         self.current_expression = ""
         self.total_expression = ""
         self.last_result = None
@@ -830,8 +1866,17 @@ class Calculator(BoxLayout):
             self.clear()
             return
         
+        if self.programmer_mode:
+            self._replace_programmer_value(lambda value: -value)
+            return
+        
         if self.current_expression and self.current_expression not in ["0"] and self._is_valid_expression():
-            if self.current_expression.startswith("-"):
+            if 'i' in self.current_expression:
+                try:
+                    self.current_expression = self._format_number(-complex_engine.parse(self.current_expression))
+                except ValueError:
+                    pass
+            elif self.current_expression.startswith("-"):
                 self.current_expression = self.current_expression[1:]
             else:
                 self.current_expression = "-" + self.current_expression
@@ -844,13 +1889,14 @@ class Calculator(BoxLayout):
         
         try:
             if self._is_valid_expression():
-                val = float(self.current_expression)
+                val = self.parse_value(self.current_expression)
                 result = val / 100
                 self.current_expression = self._format_number(result)
                 self._update_label()
         except Exception:
             self._show_error("Error")
     
+    @counts_errors
     def _show_error(self, message: str):
         self.current_expression = message
         self.error_state = True
@@ -863,7 +1909,30 @@ class Calculator(BoxLayout):
         self.total_label.text = text
 
     def _update_label(self):
-        self.label.text = self.current_expression or "0"
+        if self.matrix_mode and not self.current_expression and self.matrix_x is not None:
+            self.label.font_size = '16sp'
+            self.label.text = matrix_engine.format_matrix(self.matrix_x)
+            return
+        
+        text = self._display_value(self.current_expression) or "0"
+        if self.programmer_mode:
+            text = programmer_engine.abbreviate(text)
+        if len(text) <= self.MAX_DIGITS:
+            self.label.font_size = '42sp'
+        else:
+            self.label.font_size = '24sp' if len(text) <= 26 else '16sp'
+        self.label.text = text
+    
+    def _display_value(self, text: str) -> str:
+        if not self.complex_mode or self.complex_display != complex_engine.POLAR or 'i' not in text:
+            return text
+        try:
+            value = complex_engine.parse(text)
+        except ValueError:
+            return text
+        if not isinstance(value, complex):
+            return text
+        return complex_engine.format_polar(value, self._format_number, self.angle_mode == AngleMode.DEGREES)
     
     def _format_expression_for_display(self, expr: str) -> str:
         text = expr
@@ -871,18 +1940,54 @@ class Calculator(BoxLayout):
             text = text.replace(op, sym)
         return text
     
-    def _format_number(self, number: float) -> str:
-        if number == int(number):
-            return str(int(number))
-        else:
-            result_str = str(round(number, 10))
-            if '.' in result_str:
-                result_str = result_str.rstrip('0').rstrip('.')
-            
-            if len(result_str) > self.MAX_DIGITS:
-                return f"{number:.6e}"
-            
-            return result_str
+    def cycle_precision(self):
+        levels = precision_engine.PRECISION_LEVELS
+        next_index = (levels.index(self.precision_digits) + 1) % len(levels)
+        self.precision_digits = levels[next_index]
+        
+        if 'PREC' in self.btns_dict:
+            self.btns_dict['PREC'].text = self._precision_button_text()
+    
+    def _precision_button_text(self) -> str:
+        if self.precision_digits is None:
+            return "PREC"
+        return f"P:{self.precision_digits}"
+    
+    def cycle_complex_mode(self):
+        if not self.complex_mode:
+            self.complex_mode = True
+            self.complex_display = complex_engine.RECTANGULAR
+        elif self.complex_display == complex_engine.RECTANGULAR:
+            self.complex_display = complex_engine.POLAR
+        else:
+            self.complex_mode = False
+            self.complex_display = None
+            if 'i' in self.current_expression or 'i' in self.total_expression:
+                self.clear()
+        
+        if 'CPLX' in self.btns_dict:
+            self.btns_dict['CPLX'].text = self._complex_button_text()
+        self._update_label()
+    
+    def _complex_button_text(self) -> str:
+        if not self.complex_mode:
+            return "CPLX"
+        if self.complex_display == complex_engine.POLAR:
+            return "r cis θ"
+        return "a+bi"
+    
+    def add_imaginary_unit(self):
+        if self.error_state:
+            self.clear()
+        if self.matrix_mode:
+            return
+        
+        if not self.complex_mode:
+            self.cycle_complex_mode()
+        
+        if 'i' in self.current_expression and self.last_result is None:
+            return
+        self.add_to_expression('i')
     
     def cycle_theme(self):
         themes = [Theme.DARK, Theme.LIGHT, Theme.BLUE]
@@ -891,6 +1996,7 @@ class Calculator(BoxLayout):
         self.current_theme = themes[next_index]
         self.apply_theme()
     
+    @instrumented
     def apply_theme(self):
         theme_colors = THEMES[self.current_theme]
         
@@ -906,48 +2012,91 @@ class Calculator(BoxLayout):
                 lbl.bg_rect = RoundedRectangle(pos=lbl.pos, size=lbl.size, radius=[10])
             lbl.color = theme_colors['text']
         
-        for btn in [self.history_btn, self.theme_btn, self.mode_btn]:
+        for btn in self.menu_buttons:
             btn.update_theme(theme_colors['op'])
             btn.color = theme_colors['text']
         
+        self._theme_buttons()
+        self.btns_container.theme = self.current_theme
+    
+    def _theme_buttons(self):
+        theme_colors = THEMES[self.current_theme]
         operator_keys = [
             'C', 'DEL', '%', '÷', '×', '−', '+', '±', 
             'MC', 'MR', 'M+', 'M-', 
             'sin', 'cos', 'tan', '√', 'x[sup]2[/sup]', 'x[sup]y[/sup]', 'ln', 'log', 
             'sin[sup]-1[/sup]', 'cos[sup]-1[/sup]', 'tan[sup]-1[/sup]',
-            '[sup]n[/sup]√', 'csc', 'sec', 'cot', 'π'
+            '[sup]n[/sup]√', 'csc', 'sec', 'cot', 'π',
+            'VAR', 'PREC', 'CPLX', 'UNIT', 'Σ', 'CLRΣ', 'n', 'Σx', 'mean', 'var', 's', 'σ', 'min', 'max',
+            'Q1', 'med', 'Q3', 'Load',
+            'HEX', 'DEC', 'OCT', 'BIN', 'WORD', 'AND', 'OR', 'XOR', 'NOT', 'MOD', '<<', '>>', 'AC',
+            ',', ';', 'det', 'inv', 'A[sup]T[/sup]', 'eig', 'solve', 'tr', 'SWAP'
         ]
         
         for key, btn in self.btns_dict.items():
-            if key in operator_keys:
-                btn.update_theme(theme_colors['op'])
-            elif key == '=':
+            if key in ('=', 'DATA', 'ENT') or (self.programmer_mode and key == self.programmer_base):
                 btn.update_theme(theme_colors['special'])
+            elif key in operator_keys and not (self.programmer_mode and key in programmer_engine.DIGITS):
+                btn.update_theme(theme_colors['op'])
             else:
                 btn.update_theme(theme_colors['num'])
             btn.color = theme_colors['text']
     
+    @instrumented
     def toggle_scientific_mode(self):
         self.scientific_mode = not self.scientific_mode
+        self.stats_mode = False
+        if self.programmer_mode or self.matrix_mode:
+            self.programmer_mode = False
+            self.matrix_mode = False
+            self.clear()
+        self._rebuild_buttons()
+    
+    def toggle_stats_mode(self):
+        self.stats_mode = not self.stats_mode
+        if self.stats_mode:
+            self.scientific_mode = False
+            if self.programmer_mode or self.matrix_mode:
+                self.programmer_mode = False
+                self.matrix_mode = False
+                self.clear()
+            if self.stats is None:
+                self.stats = stats_engine.RunningStats()
+        self._rebuild_buttons()
+    
+    def toggle_matrix_mode(self):
+        self.matrix_mode = not self.matrix_mode
+        if self.matrix_mode:
+            self.scientific_mode = False
+            self.stats_mode = False
+            self.programmer_mode = False
+        self.clear()
+        self._rebuild_buttons()
+    
+    def toggle_programmer_mode(self):
+        self.programmer_mode = not self.programmer_mode
+        if self.programmer_mode:
+            self.scientific_mode = False
+            self.stats_mode = False
+            self.matrix_mode = False
+        self.clear()
+        self._rebuild_buttons()
+    
+    def _rebuild_buttons(self):
         self.remove_widget(self.btns_container)
+        self._create_buttons()
+        self._update_menu_texts()
+        self._update_label()
         
-        btns_container = BoxLayout(
-            orientation='vertical', 
-            size_hint=(1, 0.645), 
-            spacing=2, 
-            padding=[10, 5, 10, 10]
-        )
-        
-        if self.scientific_mode:
-            self._create_scientific_buttons(btns_container)
-            self.mode_btn.text = "Standard"
-        else:
-            self._create_standard_buttons(btns_container)
-            self.mode_btn.text = "Scientific"
-        
-        self.add_widget(btns_container)
-        self.btns_container = btns_container
+    def _update_menu_texts(self):
+        if not self.menu_buttons:
+            return
+        self.mode_btn.text = "Standard" if self.scientific_mode else "Scientific"
+        self.stats_btn.text = "Standard" if self.stats_mode else "Stats"
+        self.matrix_btn.text = "Standard" if self.matrix_mode else "Matrix"
+        self.programmer_btn.text = "Standard" if self.programmer_mode else "Prog"
     
+    @instrumented
     def show_history(self):
         content = BoxLayout(orientation='vertical', padding=10, spacing=10)
         theme_colors = THEMES[self.current_theme]
@@ -1010,12 +2159,458 @@ class Calculator(BoxLayout):
         
         popup.open()
     
+    def show_diagnostics(self):
+        content = BoxLayout(orientation='vertical', padding=10, spacing=10)
+        theme_colors = THEMES[self.current_theme]
+        
+        scroll = ScrollView(size_hint=(1, 0.85))
+        report_label = Label(
+            font_name='RobotoMono-Regular',
+            font_size='11sp',
+            size_hint_y=None,
+            halign='left',
+            valign='top',
+            color=theme_colors['text']
+        )
+        report_label.bind(width=lambda lbl, w: setattr(lbl, 'text_size', (w, None)))
+        report_label.bind(texture_size=lambda lbl, size: setattr(lbl, 'height', size[1]))
+        scroll.add_widget(report_label)
+        content.add_widget(scroll)
+        
+        def refresh(*args):
+            report_label.text = self._diagnostics_text()
+        
+        refresh()
+        
+        btn_layout = BoxLayout(size_hint=(1, 0.15), spacing=5)
+        
+        reset_btn = Button(
+            text="Reset",
+            background_color=theme_colors['op'],
+            color=theme_colors['text']
+        )
+        dump_btn = Button(
+            text="Dump JSON",
+            background_color=theme_colors['special'],
+            color=theme_colors['text']
+        )
+        close_btn = Button(
+            text="Close",
+            background_color=theme_colors['op'],
+            color=theme_colors['text']
+        )
+        
+        popup = Popup(
+            title="Diagnostics",
+            content=content,
+            size_hint=(0.95, 0.85),
+            background_color=theme_colors['bg']
+        )
+        
+        refresh_event = Clock.schedule_interval(refresh, 1.0)
+        popup.bind(on_dismiss=lambda x: refresh_event.cancel())
+        reset_btn.bind(on_press=lambda x: (metrics.reset(), refresh()))
+        dump_btn.bind(on_press=lambda x: setattr(report_label, 'text', f"Saved to {self.dump_diagnostics()}"))
+        close_btn.bind(on_press=popup.dismiss)
+        
+        btn_layout.add_widget(reset_btn)
+        btn_layout.add_widget(dump_btn)
+        btn_layout.add_widget(close_btn)
+        content.add_widget(btn_layout)
+        
+        popup.open()
+    
+    def _diagnostics_text(self) -> str:
+        text = f"{metrics.report()}\n\n{profiler.format()}"
+        if self.result_cache is not None:
+            text += f"\n\n{self.result_cache.report()}"
+        return f"{text}\n\n{tracker.report()}"
+    
+    def dump_diagnostics(self) -> str:
+        directory = os.path.dirname(self.session_store.path) if self.session_store is not None else os.getcwd()
+        path = os.path.join(directory, 'diagnostics.json')
+        extra = {'startup': profiler.summary(), 'memory': tracker.summary()}
+        if self.result_cache is not None:
+            extra['result_cache'] = self.result_cache.stats()
+        metrics.dump(path, extra=extra)
+        return path
+    
     def _clear_history(self, popup: Popup):
         self.calculation_history = []
         popup.dismiss()
     
+    def show_variables(self):
+        content = BoxLayout(orientation='vertical', padding=10, spacing=10)
+        theme_colors = THEMES[self.current_theme]
+        
+        input_row = BoxLayout(size_hint=(1, 0.12), spacing=5)
+        definition_input = TextInput(
+            hint_text="a = 3   b = a^2 + 1   f(x) = x^2 + a",
+            multiline=False,
+            size_hint_x=0.75
+        )
+        define_btn = Button(
+            text="Define",
+            size_hint_x=0.25,
+            background_color=theme_colors['special'],
+            color=theme_colors['text']
+        )
+        input_row.add_widget(definition_input)
+        input_row.add_widget(define_btn)
+        content.add_widget(input_row)
+        
+        status_label = Label(
+            text="Tap a variable to use its value",
+            size_hint=(1, 0.08),
+            color=theme_colors['text'],
+            opacity=0.7
+        )
+        content.add_widget(status_label)
+        
+        scroll = ScrollView(size_hint=(1, 0.65))
+        variables_layout = GridLayout(cols=1, spacing=5, size_hint_y=None)
+        variables_layout.bind(minimum_height=variables_layout.setter('height'))
+        scroll.add_widget(variables_layout)
+        content.add_widget(scroll)
+        
+        close_btn = Button(
+            text="Close",
+            size_hint=(1, 0.15),
+            background_color=theme_colors['op'],
+            color=theme_colors['text']
+        )
+        content.add_widget(close_btn)
+        
+        popup = Popup(
+            title="Variables & Functions",
+            content=content,
+            size_hint=(0.9, 0.8),
+            background_color=theme_colors['bg']
+        )
+        
+        def refresh():
+            variables_layout.clear_widgets()
+            if not self.variables.nodes:
+                variables_layout.add_widget(Label(
+                    text="No variables defined yet",
+                    size_hint_y=None,
+                    height=40,
+                    color=theme_colors['text']
+                ))
+            for name in sorted(self.variables.nodes):
+                count = self.variables.recompute_counts.get(name, 0)
+                var_btn = Button(
+                    text=f"{self.variables.describe(name)}   [{count}×]",
+                    size_hint_y=None,
+                    height=36,
+                    halign='left',
+                    valign='middle',
+                    background_color=theme_colors['num'],
+                    color=theme_colors['text']
+                )
+                var_btn.bind(size=var_btn.setter('text_size'))
+                var_btn.bind(on_press=lambda x, name=name: self._use_variable(popup, name))
+                variables_layout.add_widget(var_btn)
+        
+        def define(*args):
+            try:
+                recomputed = self.variables.define(definition_input.text)
+            except ValueError as e:
+                status_label.text = str(e)
+                return
+            definition_input.text = ""
+            status_label.text = f"Recomputed: {', '.join(recomputed)}" if recomputed else "Defined"
+            refresh()
+        
+        define_btn.bind(on_press=define)
+        definition_input.bind(on_text_validate=define)
+        close_btn.bind(on_press=popup.dismiss)
+        
+        refresh()
+        popup.open()
+    
+    def show_unit_converter(self):
+        if not self._units_available():
+            return
+        
+        content = BoxLayout(orientation='vertical', padding=10, spacing=10)
+        theme_colors = THEMES[self.current_theme]
+        
+        category_spinner = Spinner(
+            text=self.unit_selection[0],
+            values=unit_engine.categories(),
+            size_hint=(1, 0.15),
+            background_color=theme_colors['op'],
+            color=theme_colors['text']
+        )
+        content.add_widget(category_spinner)
+        
+        units_row = BoxLayout(size_hint=(1, 0.15), spacing=5)
+        from_spinner = Spinner(
+            text=self.unit_selection[1],
+            values=unit_engine.units(self.unit_selection[0]),
+            background_color=theme_colors['num'],
+            color=theme_colors['text']
+        )
+        swap_btn = Button(
+            text="SWAP",
+            size_hint_x=0.3,
+            background_color=theme_colors['op'],
+            color=theme_colors['text']
+        )
+        to_spinner = Spinner(
+            text=self.unit_selection[2],
+            values=unit_engine.units(self.unit_selection[0]),
+            background_color=theme_colors['num'],
+            color=theme_colors['text']
+        )
+        units_row.add_widget(from_spinner)
+        units_row.add_widget(swap_btn)
+        units_row.add_widget(to_spinner)
+        content.add_widget(units_row)
+        
+        preview_label = Label(
+            text="",
+            size_hint=(1, 0.4),
+            color=theme_colors['text']
+        )
+        content.add_widget(preview_label)
+        
+        btn_layout = BoxLayout(size_hint=(1, 0.15), spacing=5)
+        convert_btn = Button(
+            text="Convert",
+            background_color=theme_colors['special'],
+            color=theme_colors['text']
+        )
+        close_btn = Button(
+            text="Close",
+            background_color=theme_colors['op'],
+            color=theme_colors['text']
+        )
+        btn_layout.add_widget(convert_btn)
+        btn_layout.add_widget(close_btn)
+        content.add_widget(btn_layout)
+        
+        popup = Popup(
+            title="Unit Conversion",
+            content=content,
+            size_hint=(0.9, 0.6),
+            background_color=theme_colors['bg']
+        )
+        
+        def refresh(*args):
+            self.unit_selection = (category_spinner.text, from_spinner.text, to_spinner.text)
+            try:
+                value = float(self.current_expression or "0")
+                result = self.compute_conversion(value, from_spinner.text, to_spinner.text)
+            except (ValueError, OverflowError) as e:
+                preview_label.text = str(e) if str(e) else "Error"
+                return
+            preview_label.text = f"{self._format_number(value)} {from_spinner.text} = {result} {to_spinner.text}"
+        
+        def select_category(spinner, category):
+            category_units = unit_engine.units(category)
+            from_spinner.values = category_units
+            to_spinner.values = category_units
+            from_spinner.text = category_units[0]
+            to_spinner.text = category_units[1]
+            refresh()
+        
+        def swap(*args):
+            from_spinner.text, to_spinner.text = to_spinner.text, from_spinner.text
+        
+        category_spinner.bind(text=select_category)
+        from_spinner.bind(text=refresh)
+        to_spinner.bind(text=refresh)
+        swap_btn.bind(on_press=swap)
+        convert_btn.bind(on_press=lambda x: self.convert_units(popup, from_spinner.text, to_spinner.text))
+        close_btn.bind(on_press=popup.dismiss)
+        
+        refresh()
+        popup.open()
+    
+    def convert_units(self, popup: Popup, from_unit: str, to_unit: str):
+        popup.dismiss()
+        if self.error_state:
+            self.clear()
+        if not self._units_available() or not self._is_valid_expression():
+            return
+        
+        try:
+            value = float(self.current_expression)
+        except ValueError:
+            self._show_error("Invalid input")
+            self._update_label()
+            return
+        
+        try:
+            result_str = self.compute_conversion(value, from_unit, to_unit)
+        except Exception as e:
+            self._show_error(function_error_message(e))
+            self._update_label()
+            return
+        
+        self._add_history(f"{self.current_expression} {from_unit} = {result_str} {to_unit}")
+        
+        self.current_expression = result_str
+        self.last_result = float(result_str)
+        self._update_label()
+    
+    def _units_available(self) -> bool:
+        if self.programmer_mode or self.matrix_mode:
+            self._show_error("Units need a decimal value")
+            self._update_label()
+            return False
+        return True
+    
+    def show_series(self):
+        content = BoxLayout(orientation='vertical', padding=10, spacing=10)
+        theme_colors = THEMES[self.current_theme]
+        
+        term_input = TextInput(
+            text=self.series_selection[0],
+            hint_text="f(k), e.g. 1/k^2",
+            multiline=False,
+            size_hint=(1, 0.2)
+        )
+        content.add_widget(term_input)
+        
+        limits_row = BoxLayout(size_hint=(1, 0.2), spacing=5)
+        start_input = TextInput(
+            text=self.series_selection[1],
+            hint_text="k from",
+            multiline=False,
+            size_hint_x=0.5
+        )
+        stop_input = TextInput(
+            text=self.series_selection[2],
+            hint_text="k to (or inf)",
+            multiline=False,
+            size_hint_x=0.5
+        )
+        limits_row.add_widget(start_input)
+        limits_row.add_widget(stop_input)
+        content.add_widget(limits_row)
+        
+        status_label = Label(
+            text="Σ adds and Π multiplies f(k) over the range",
+            size_hint=(1, 0.2),
+            color=theme_colors['text'],
+            opacity=0.7
+        )
+        content.add_widget(status_label)
+        
+        btn_layout = BoxLayout(size_hint=(1, 0.4), spacing=5)
+        for operator in series_engine.OPERATORS:
+            operator_btn = Button(
+                text=operator,
+                font_size='22sp',
+                background_color=theme_colors['special'],
+                color=theme_colors['text']
+            )
+            operator_btn.bind(on_press=lambda x, operator=operator: evaluate(operator))
+            btn_layout.add_widget(operator_btn)
+        close_btn = Button(
+            text="Close",
+            background_color=theme_colors['op'],
+            color=theme_colors['text']
+        )
+        btn_layout.add_widget(close_btn)
+        content.add_widget(btn_layout)
+        
+        popup = Popup(
+            title="Series",
+            content=content,
+            size_hint=(0.9, 0.5),
+            background_color=theme_colors['bg']
+        )
+        
+        def evaluate(operator: str):
+            try:
+                start = int(start_input.text.strip())
+                stop = series_engine.parse_limit(stop_input.text)
+            except ValueError:
+                status_label.text = "Limits must be whole numbers or inf"
+                return
+            self.series_selection = (term_input.text.strip(), start_input.text.strip(), stop_input.text.strip())
+            popup.dismiss()
+            self.evaluate_series(operator, self.series_selection[0], start, stop)
+        
+        close_btn.bind(on_press=popup.dismiss)
+        popup.open()
+    
+    def evaluate_series(self, operator: str, expr: str, start: int, stop: Optional[int]):
+        if self.error_state:
+            self.clear()
+        self.total_label.text = "Summing..." if operator == 'Σ' else "Multiplying..."
+        upper = "inf" if stop is None else stop
+        description = f"{operator}(k={start}..{upper}) {expr}"
+        
+        def worker():
+            try:
+                result_str, method = self.compute_series(operator, expr, start, stop)
+            except Exception as e:
+                message = function_error_message(e)
+                Clock.schedule_once(lambda dt: self._on_series_failed(message))
+                return
+            Clock.schedule_once(lambda dt: self._on_series_done(description, result_str, method))
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _on_series_done(self, description: str, result_str: str, method: str):
+        self._add_history(f"{description} = {result_str}")
+        
+        self.current_expression = result_str
+        self.last_result = float(result_str)
+        self.total_label.text = method
+        self._update_label()
+    
+    def _on_series_failed(self, message: str):
+        self.total_label.text = ""
+        self._show_error(message)
+        self._update_label()
+    
+    def _use_variable(self, popup: Popup, name: str):
+        if self.variables.nodes[name].is_function:
+            return
+        
+        popup.dismiss()
+        if self.error_state:
+            self.clear()
+        
+        try:
+            value = self.variables.get(name)
+        except ValueError as e:
+            self._show_error(str(e))
+            self._update_label()
+            return
+        
+        self.current_expression = self._format_number(value)
+        self._update_label()
+    
+    def _keyboard_captured(self) -> bool:
+        for child in Window.children:
+            if isinstance(child, ModalView):
+                return True
+            if child is self:
+                continue
+            for widget in child.walk(restrict=True):
+                if isinstance(widget, TextInput) and widget.focus:
+                    return True
+        return False
+    
+    @instrumented
     def _on_keyboard_down(self, window, key: int, scancode: int, 
                           codepoint: str, modifiers: List[str]) -> bool:
+        if self._keyboard_captured():
+            return False
+        
+        if self.recorder is not None:
+            self.recorder.record_key(key, scancode, codepoint, modifiers)
+        
+        if self.programmer_mode and codepoint and self._programmer_key(codepoint):
+            return True
+        
         if (48 <= key <= 57) or (256 <= key <= 265):
             if key == 56 and 'shift' in modifiers:
                 self.append_operator("*")
@@ -1056,7 +2651,11 @@ class Calculator(BoxLayout):
             elif action in ['+', '−', '*', '/']:
                 self.append_operator(action if action != '−' else '-')
             elif action == '=':
-                self.evaluate()
+                if self.stats_mode:
+                    self.add_data_point()
+                    action = 'DATA'
+                else:
+                    self.evaluate()
             elif action == 'DEL':
                 self.backspace()
             elif action == 'C':
@@ -1078,9 +2677,42 @@ class Calculator(BoxLayout):
             elif codepoint.lower() == 'h':
                 self.show_history()
                 return True
+            elif codepoint.lower() == 'i':
+                self.show_diagnostics()
+                return True
+            elif codepoint.lower() == 'u':
+                self.show_unit_converter()
+                return True
+            elif codepoint.lower() == 'j':
+                self.add_imaginary_unit()
+                if 'i' in self.btns_dict:
+                    self.btns_dict['i'].flash()
+                return True
         
         return False
 
+    def _programmer_key(self, codepoint: str) -> bool:
+        operators = {'&': ('AND', '&'), '|': ('OR', '|'), '^': ('XOR', '^'), '%': ('MOD', '%'),
+                     '<': ('<<', '<<'), '>': ('>>', '>>')}
+        digit = codepoint.upper()
+        if digit in 'ABCDEF' and len(digit) == 1:
+            if not programmer_engine.valid_digit(digit, programmer_engine.BASES[self.programmer_base]):
+                return False
+            self.add_to_expression(digit)
+            label = digit
+        elif codepoint == '~':
+            self.bitwise_not()
+            label = 'NOT'
+        elif codepoint in operators:
+            label, operator = operators[codepoint]
+            self.append_operator(operator)
+        else:
+            return False
+        
+        if label in self.btns_dict:
+            self.btns_dict[label].flash()
+        return True
+
 class CalculatorApp(App):
     def build(self):
         Window.size = (420, 680)
@@ -1088,7 +2720,32 @@ class CalculatorApp(App):
         Window.minimum_height = 600
         self.title = "Advanced Scientific Calculator"
         self.icon = ''
-        return Calculator()
+        self.session_store = SessionStore(os.path.join(self.user_data_dir, 'session.bin'))
+        self.result_cache = None
+        with profiler.step("Calculator()"):
+            self.calculator = Calculator(session_store=self.session_store)
+        self.calculator.deferred_steps.append(("open result cache", self._open_result_cache))
+        if os.environ.get(RECORD_ENV):
+            self.calculator.recorder = EventRecorder(os.environ[RECORD_ENV], self.calculator.capture_session())
+        return self.calculator
+    
+    def _open_result_cache(self):
+        cache_path = os.environ.get(result_cache.CACHE_ENV, os.path.join(self.user_data_dir, 'results.sqlite'))
+        if cache_path:
+            self.result_cache = self.calculator.result_cache = result_cache.ResultCache(cache_path)
+    
+    def on_pause(self):
+        self.calculator.save_session(background=False)
+        return True
+    
+    def on_stop(self):
+        self.calculator.save_session(background=False)
+        if self.calculator.recorder is not None:
+            self.calculator.recorder.close(self.calculator.capture_session())
+        if metrics.enabled:
+            self.calculator.dump_diagnostics()
+        if self.result_cache is not None:
+            self.result_cache.close()
 
 if __name__ == "__main__":
     CalculatorApp().run()
\ No newline at end of file
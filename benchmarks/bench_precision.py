@@ -0,0 +1,35 @@
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import precision_engine
+
+EXPRESSIONS = [
+    "7+8",
+    "12.5*4-3",
+    "1234567/89",
+    "2**20+0.75",
+    "3.14159*2.71828/1.41421"
+]
+NUMBER = 20000
+
+
+def bench(stmt, **namespace) -> float:
+    return min(timeit.repeat(stmt, globals=namespace, number=NUMBER, repeat=3)) / NUMBER * 1e9
+
+
+def main():
+    print(f"{'expression':<28}{'eval ns':>12}{'off ns':>12}{'ratio':>8}{'34 digits ns':>16}")
+    for expr in EXPRESSIONS:
+        baseline = bench("eval(expr)", expr=expr)
+        off = bench("evaluate(expr, None)", expr=expr,
+                    evaluate=precision_engine.evaluate_expression)
+        on = bench("evaluate(expr, 34)", expr=expr,
+                   evaluate=precision_engine.evaluate_expression)
+        print(f"{expr:<28}{baseline:>12.0f}{off:>12.0f}{off / baseline:>8.2f}{on:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
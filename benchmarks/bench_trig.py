@@ -0,0 +1,71 @@
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import trig_kernels
+from calculator_engine import AngleMode, HeadlessEngine
+
+SCALAR_COUNT = 200000
+ARRAY_COUNT = 5000000
+
+
+def legacy_sin(value: float) -> float:
+    return math.sin(math.radians(value))
+
+
+def legacy_engine_sin(engine: HeadlessEngine, value: float) -> float:
+    return engine._apply_scientific_function('sin', math.radians(value))
+
+
+def timed(func, *args) -> float:
+    best = math.inf
+    for _ in range(3):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_scalar(func, values):
+    for v in values:
+        func(v)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    values = rng.uniform(-720, 720, SCALAR_COUNT).tolist()
+    array = rng.uniform(-720, 720, ARRAY_COUNT)
+    multiples = np.arange(-24, 25) * 30.0
+
+    legacy = timed(run_scalar, legacy_sin, values)
+    kernel = timed(run_scalar, trig_kernels.sin_deg, values)
+    print(f"scalar sin   legacy {SCALAR_COUNT / legacy / 1e6:8.2f} M/s   "
+          f"kernel {SCALAR_COUNT / kernel / 1e6:8.2f} M/s")
+
+    radians, degrees = HeadlessEngine(AngleMode.RADIANS), HeadlessEngine(AngleMode.DEGREES)
+    legacy = timed(run_scalar, lambda v: legacy_engine_sin(radians, v), values)
+    kernel = timed(run_scalar, lambda v: degrees._apply_scientific_function('sin', v), values)
+    print(f"engine sin   legacy {SCALAR_COUNT / legacy / 1e6:8.2f} M/s   "
+          f"kernel {SCALAR_COUNT / kernel / 1e6:8.2f} M/s")
+
+    legacy = timed(lambda a: np.sin(np.radians(a)), array)
+    kernel = timed(trig_kernels.sin_deg_array, array)
+    print(f"vector sin   legacy {ARRAY_COUNT / legacy / 1e6:8.2f} M/s   "
+          f"kernel {ARRAY_COUNT / kernel / 1e6:8.2f} M/s")
+
+    table = [0.0, 0.5, trig_kernels.SQRT3_HALF, 1.0, trig_kernels.SQRT3_HALF, 0.5]
+    table += [-v for v in table]
+    expected = np.array([table[int(m // 30) % 12] for m in multiples])
+    legacy_exact = int(np.sum(np.sin(np.radians(multiples)) == expected))
+    kernel_exact = int(np.sum(trig_kernels.sin_deg_array(multiples) == expected))
+    print(f"exact sin at multiples of 30 ({multiples.size} angles): "
+          f"legacy {legacy_exact}   kernel {kernel_exact}")
+
+
+if __name__ == "__main__":
+    main()
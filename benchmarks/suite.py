@@ -0,0 +1,397 @@
+import argparse
+import fnmatch
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, NamedTuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import numpy as np
+
+import programmer_engine
+import series_engine
+from calculator_engine import AngleMode, HeadlessEngine
+from headless import HeadlessCalculator
+from result_cache import ResultCache
+
+SEED = 20240601
+DEFAULT_THRESHOLD = 0.10
+
+SCIENTIFIC_FUNCTIONS = ['sin', 'cos', 'tan', 'asin', 'acos', 'atan', 'csc', 'sec', 'cot',
+                        'sqrt', 'ln', 'log', 'square']
+
+SHORT_EXPRESSIONS = ["7+8", "12.5*4-3", "1234567/89", "2**20+0.75"]
+ADVERSARIAL_EXPRESSIONS = ["1/0", "1e308*10", "2**1000", "9**99999", "0.1+0.2-0.3",
+                           "-" * 50 + "1", "1/3*3-1", "99999999999999999*99"]
+
+
+class Benchmark(NamedTuple):
+    name: str
+    setup: Callable[[], Callable[[], None]]
+    number: int
+    items: int
+    ui: bool
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(name: str, number: int = 1000, items: int = 1, ui: bool = False):
+    def register(setup: Callable[[], Callable[[], None]]):
+        BENCHMARKS.append(Benchmark(name, setup, number, items, ui))
+        return setup
+    return register
+
+
+def long_expression(terms: int) -> str:
+    rng = np.random.default_rng(SEED)
+    ops = ['+', '-', '*', '/']
+    parts = [str(rng.integers(1, 1000))]
+    for op, value in zip(rng.choice(ops, terms - 1), rng.uniform(1, 1000, terms - 1)):
+        parts.append(f"{op}{value:.4f}")
+    return "".join(parts)
+
+
+def function_inputs(func_name: str, count: int = 1000) -> List[float]:
+    rng = np.random.default_rng(SEED)
+    if func_name in ('asin', 'acos'):
+        values = rng.uniform(-1, 1, count)
+    elif func_name in ('sqrt', 'ln', 'log'):
+        values = rng.uniform(1e-6, 1e6, count)
+    elif func_name == 'square':
+        values = rng.uniform(-1e6, 1e6, count)
+    else:
+        values = np.concatenate([rng.uniform(-720, 720, count - 8), np.arange(8) * 45.0])
+    return values.tolist()
+
+
+def _engine_expressions(expressions: List[str]) -> Callable[[], None]:
+    engine = HeadlessEngine()
+
+    def run():
+        for expr in expressions:
+            try:
+                engine.compute_expression(expr)
+            except (ArithmeticError, ValueError):
+                pass
+    return run
+
+
+benchmark('engine.expression.short', number=2000, items=len(SHORT_EXPRESSIONS))(
+    lambda: _engine_expressions(SHORT_EXPRESSIONS))
+benchmark('engine.expression.long', number=200)(
+    lambda: _engine_expressions([long_expression(200)]))
+benchmark('engine.expression.adversarial', number=50, items=len(ADVERSARIAL_EXPRESSIONS))(
+    lambda: _engine_expressions(ADVERSARIAL_EXPRESSIONS))
+
+
+def _function_bench(func_name: str, angle_mode: AngleMode) -> Callable[[], Callable[[], None]]:
+    def setup():
+        engine = HeadlessEngine(angle_mode)
+        values = function_inputs(func_name)
+        apply = engine._apply_scientific_function
+
+        def run():
+            for v in values:
+                try:
+                    apply(func_name, v)
+                except ValueError:
+                    pass
+        return run
+    return setup
+
+
+for _name in SCIENTIFIC_FUNCTIONS:
+    for _mode in AngleMode:
+        benchmark(f'engine.function.{_name}.{_mode.value}', number=20, items=1000)(
+            _function_bench(_name, _mode))
+
+
+@benchmark('engine.format_number', number=50, items=1000)
+def _format_number_bench():
+    engine = HeadlessEngine()
+    rng = np.random.default_rng(SEED)
+    values = (rng.integers(-10 ** 9, 10 ** 9, 500).astype(float).tolist()
+              + (rng.standard_normal(500) * 10.0 ** rng.integers(-12, 14, 500)).tolist())
+    fmt = engine._format_number
+
+    def run():
+        for v in values:
+            fmt(v)
+    return run
+
+
+def _complex_batch_bench(complex_mode: bool, negative: bool) -> Callable[[], Callable[[], None]]:
+    def setup():
+        engine = HeadlessEngine(complex_mode=complex_mode)
+        values = np.abs(function_inputs('sqrt'))
+        if negative:
+            values = -values
+        return lambda: engine.compute_function_batch('sqrt', values)
+    return setup
+
+
+benchmark('engine.sqrt_batch.real', number=20, items=1000)(_complex_batch_bench(False, False))
+benchmark('engine.sqrt_batch.complex_mode_real', number=20, items=1000)(_complex_batch_bench(True, False))
+benchmark('engine.sqrt_batch.complex_mode_negative', number=20, items=1000)(_complex_batch_bench(True, True))
+
+
+def _base_conversion_bench(digits: int, parse: bool) -> Callable[[], Callable[[], None]]:
+    def setup():
+        value = 7 ** int(digits / math.log10(7))
+        text = programmer_engine.format_int(value, 10)
+        if parse:
+            return lambda: programmer_engine.parse_int(text, 10)
+        return lambda: programmer_engine.format_int(value, 10)
+    return setup
+
+
+for _digits in (10_000, 100_000):
+    benchmark(f'engine.programmer.to_decimal.{_digits}', number=3)(_base_conversion_bench(_digits, False))
+    benchmark(f'engine.programmer.from_decimal.{_digits}', number=3)(_base_conversion_bench(_digits, True))
+
+
+@benchmark('engine.series.sum.closed_form', number=200)
+def _series_closed_form():
+    return lambda: series_engine.summation("3*k^4 - k + 7", 1, 10 ** 12)
+
+
+@benchmark('engine.series.sum.tail', number=5)
+def _series_tail():
+    return lambda: series_engine.summation("1/k^2", 1, None)
+
+
+@benchmark('engine.series.sum.chunked.10000000', number=1)
+def _series_chunked():
+    return lambda: series_engine.summation("sin(k)/k^2", 1, 10 ** 7)
+
+
+@benchmark('engine.precision.uncached', number=100)
+def _precision_uncached():
+    engine = HeadlessEngine(AngleMode.DEGREES, 50)
+    return lambda: engine.compute_expression("2**0.5/3+1/7")
+
+
+@benchmark('engine.precision.cached', number=1000)
+def _precision_cached():
+    engine = HeadlessEngine(AngleMode.DEGREES, 50)
+    engine.result_cache = ResultCache(os.path.join(tempfile.mkdtemp(), 'results.sqlite'))
+    engine.compute_expression("2**0.5/3+1/7")
+    return lambda: engine.compute_expression("2**0.5/3+1/7")
+
+
+_active: List[HeadlessCalculator] = []
+
+
+def make_headless() -> HeadlessCalculator:
+    while _active:
+        _active.pop().close()
+    headless = HeadlessCalculator()
+    _active.append(headless)
+    return headless
+
+
+def make_calculator():
+    return make_headless().calculator
+
+
+def _ui_evaluate(expressions: List[str], history_size: int = 0) -> Callable[[], Callable[[], None]]:
+    def setup():
+        calc = make_calculator()
+        calc.calculation_history = [f"{i}+1 = {i + 1}" for i in range(history_size)]
+
+        def run():
+            for expr in expressions:
+                calc.error_state = False
+                calc.total_expression = ""
+                calc.current_expression = expr
+                calc.evaluate()
+        return run
+    return setup
+
+
+benchmark('ui.evaluate.short', number=500, items=len(SHORT_EXPRESSIONS), ui=True)(
+    _ui_evaluate(SHORT_EXPRESSIONS))
+benchmark('ui.evaluate.long', number=100, ui=True)(
+    _ui_evaluate([long_expression(200)]))
+benchmark('ui.evaluate.adversarial', number=20, items=len(ADVERSARIAL_EXPRESSIONS), ui=True)(
+    _ui_evaluate(ADVERSARIAL_EXPRESSIONS))
+benchmark('ui.history_append_at_capacity', number=2000, ui=True)(
+    _ui_evaluate(["1+1"], history_size=100))
+
+
+@benchmark('ui.apply_theme', number=50, ui=True)
+def _apply_theme_bench():
+    calc = make_calculator()
+    return calc.cycle_theme
+
+
+@benchmark('ui.toggle_scientific_mode', number=50, items=2, ui=True)
+def _toggle_bench():
+    calc = make_calculator()
+
+    def run():
+        calc.toggle_scientific_mode()
+        calc.toggle_scientific_mode()
+    return run
+
+
+def _show_history_bench(entries: int) -> Callable[[], Callable[[], None]]:
+    def setup():
+        headless = make_headless()
+        headless.calculator.calculation_history = [f"{i}×3 = {i * 3}" for i in range(entries)]
+
+        def run():
+            headless.calculator.show_history()
+            headless.dismiss_popups()
+        return run
+    return setup
+
+
+for _entries in (10, 100):
+    benchmark(f'ui.show_history.{_entries}', number=10, ui=True)(_show_history_bench(_entries))
+
+
+def _frame_bench(scientific: bool) -> Callable[[], Callable[[], None]]:
+    def setup():
+        headless = make_headless()
+        if scientific:
+            headless.calculator.toggle_scientific_mode()
+        return headless.frame
+    return setup
+
+
+benchmark('ui.frame.standard', number=200, ui=True)(_frame_bench(False))
+benchmark('ui.frame.scientific', number=200, ui=True)(_frame_bench(True))
+
+
+def run_benchmark(bench: Benchmark, repeat: int) -> Dict[str, float]:
+    func = bench.setup()
+    func()
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(bench.number):
+            func()
+        rounds.append((time.perf_counter() - start) / (bench.number * bench.items))
+    return {
+        'number': bench.number,
+        'items': bench.items,
+        'repeat': repeat,
+        'min_s': min(rounds),
+        'median_s': statistics.median(rounds),
+        'stdev_s': statistics.stdev(rounds) if len(rounds) > 1 else 0.0
+    }
+
+
+def environment() -> Dict[str, str]:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_ROOT, capture_output=True,
+                                text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ''
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': str(os.cpu_count()),
+        'numpy': np.__version__,
+        'commit': commit,
+        'seed': str(SEED),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z')
+    }
+
+
+def run(args: argparse.Namespace) -> int:
+    selected = [b for b in BENCHMARKS
+                if any(fnmatch.fnmatch(b.name, pattern) for pattern in args.filter)
+                and not (args.skip_ui and b.ui)]
+    if not selected:
+        print("No benchmarks match the filter")
+        return 1
+
+    results = {}
+    for bench in selected:
+        result = run_benchmark(bench, args.repeat)
+        results[bench.name] = result
+        print(f"{bench.name:<40}{_format_time(result['median_s']):>12}  "
+              f"(min {_format_time(result['min_s'])}, ±{_format_time(result['stdev_s'])})", flush=True)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment(), 'results': results}, f, indent=2)
+    print(f"\nSaved {len(results)} results to {args.output}")
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+    with open(args.candidate, 'r', encoding='utf-8') as f:
+        candidate = json.load(f)['results']
+
+    metric = f"{args.metric}_s"
+    regressions = 0
+    print(f"{'benchmark':<40}{'baseline':>12}{'candidate':>12}{'change':>10}")
+    for name in sorted(set(baseline) | set(candidate)):
+        if name not in baseline or name not in candidate:
+            print(f"{name:<40}{'only in ' + ('baseline' if name in baseline else 'candidate'):>34}")
+            continue
+
+        before, after = baseline[name][metric], candidate[name][metric]
+        change = after / before - 1 if before else math.inf
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif change < -args.threshold:
+            flag = "  improved"
+        print(f"{name:<40}{_format_time(before):>12}{_format_time(after):>12}{change:>+10.1%}{flag}")
+
+    print(f"\n{regressions} regression(s) beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('µs', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calculator benchmark suite")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="Run benchmarks and save the results as JSON")
+    run_parser.add_argument('--output', default='benchmark-results.json')
+    run_parser.add_argument('--filter', nargs='+', default=['*'], help="Glob patterns of benchmark names")
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('--skip-ui', action='store_true', help="Only run engine benchmarks")
+
+    list_parser = commands.add_parser('list', help="List benchmark names")
+    list_parser.set_defaults(func=lambda args: print("\n".join(b.name for b in BENCHMARKS)) or 0)
+
+    compare_parser = commands.add_parser('compare', help="Compare two result files")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('candidate')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                                help="Relative slowdown that counts as a regression (default 0.10)")
+    compare_parser.add_argument('--metric', choices=['min', 'median'], default='median')
+
+    run_parser.set_defaults(func=run)
+    compare_parser.set_defaults(func=compare)
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+from typing import Any, Dict, List
+
+FUNCTIONS = ['sin', 'cos', 'tan', 'sqrt', 'ln', 'log']
+
+
+class RpcClient:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.ids = itertools.count(1)
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.listener = asyncio.ensure_future(self._listen())
+
+    @classmethod
+    async def connect(cls, args: argparse.Namespace) -> 'RpcClient':
+        if args.socket:
+            reader, writer = await asyncio.open_unix_connection(args.socket, limit=16 * 1024 * 1024)
+        else:
+            reader, writer = await asyncio.open_connection(args.host, args.port, limit=16 * 1024 * 1024)
+        return cls(reader, writer)
+
+    async def call(self, method: str, **params) -> Any:
+        request_id = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        request = {'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params}
+        self.writer.write(json.dumps(request).encode('utf-8') + b'\n')
+        await self.writer.drain()
+        return await future
+
+    async def close(self):
+        self.listener.cancel()
+        self.writer.close()
+
+    async def _listen(self):
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+            response = json.loads(line)
+            future = self.pending.pop(response.get('id'), None)
+            if future is None:
+                continue
+            if 'error' in response:
+                future.set_exception(RuntimeError(response['error']['message']))
+            else:
+                future.set_result(response['result'])
+
+
+def make_request(rng: random.Random) -> tuple:
+    if rng.random() < 0.5:
+        a, b = rng.randint(1, 9999), rng.randint(0, 99)
+        op = rng.choice(['+', '-', '*', '/', '**'])
+        if op == '**':
+            b %= 8
+        return 'evaluate', {'expression': f"{a}{op}{b}"}
+    return 'apply', {'function': rng.choice(FUNCTIONS), 'value': rng.uniform(-720, 720)}
+
+
+async def worker(client: RpcClient, rng: random.Random, remaining: itertools.count, total: int,
+                 latencies: Dict[str, List[float]], angle_mode: str):
+    while next(remaining) < total:
+        method, params = make_request(rng)
+        start = time.perf_counter()
+        await client.call(method, angle_mode=angle_mode, **params)
+        latencies[method].append(time.perf_counter() - start)
+
+
+def percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run(args: argparse.Namespace):
+    client = await RpcClient.connect(args)
+    rng = random.Random(args.seed)
+    latencies: Dict[str, List[float]] = {'evaluate': [], 'apply': []}
+    remaining = itertools.count()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        worker(client, random.Random(rng.random()), remaining, args.requests, latencies, args.angle_mode)
+        for _ in range(args.concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+
+    completed = sum(len(samples) for samples in latencies.values())
+    print(f"{completed} requests in {elapsed:.3f} s ({completed / elapsed:,.0f} req/s, "
+          f"concurrency {args.concurrency})")
+    print(f"{'method':<10}{'count':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for method, samples in latencies.items():
+        print(f"{method:<10}{len(samples):>8}"
+              + "".join(f"{percentile(samples, q) * 1000:>10.3f}" for q in (0.5, 0.9, 0.99))
+              + f"{max(samples, default=0.0) * 1000:>10.3f}")
+
+    stats = await client.call('stats')
+    print("\nServer stats:")
+    print(json.dumps(stats, indent=2))
+    await client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for calc_server.py")
+    parser.add_argument('--socket', help="Unix socket path (default: TCP on --host/--port)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--angle-mode', choices=['deg', 'rad'], default='deg')
+    parser.add_argument('--seed', type=int, default=1)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
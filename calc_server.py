@@ -0,0 +1,375 @@
+import argparse
+import asyncio
+import atexit
+import inspect
+import json
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import unit_engine
+from calculator_engine import AngleMode, HeadlessEngine
+from result_cache import DEFAULT_MAX_ENTRIES, ResultCache
+from instrumentation import LatencyHistogram
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+MAX_BATCH = 256
+BATCH_DELAY = 0.002
+MAX_LINE = 16 * 1024 * 1024
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+_engines: Dict[Tuple[str, Optional[int], bool], HeadlessEngine] = {}
+_result_cache: Optional[ResultCache] = None
+
+
+def open_result_cache(path: Optional[str], max_entries: int = DEFAULT_MAX_ENTRIES):
+    global _result_cache
+    if path:
+        _result_cache = ResultCache(path, max_entries)
+        atexit.register(_result_cache.close)
+
+
+def _engine(angle_mode: str, precision: Optional[int], complex_mode: bool = False) -> HeadlessEngine:
+    key = (angle_mode, precision, complex_mode)
+    if key not in _engines:
+        _engines[key] = HeadlessEngine(AngleMode(angle_mode), precision, complex_mode)
+        _engines[key].result_cache = _result_cache
+    return _engines[key]
+
+
+def evaluate_worker(key: Tuple, expressions: List[str]) -> List[Tuple[bool, str]]:
+    angle_mode, precision, complex_mode = key
+    return _engine(angle_mode, precision, complex_mode).compute_expression_batch(expressions)
+
+
+def apply_worker(key: Tuple, values: List[float]) -> List[Tuple[bool, str]]:
+    func_name, angle_mode, complex_mode = key
+    return _engine(angle_mode, None, complex_mode).compute_function_batch(func_name, values)
+
+
+def convert_worker(key: Tuple, values: List[float]) -> List[Tuple[bool, str]]:
+    from_unit, to_unit = key
+    return _engine('deg', None).compute_conversion_batch(values, from_unit, to_unit)
+
+
+class RpcError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class MicroBatcher:
+    def __init__(self, executor: Executor, worker: Callable, max_batch: int = MAX_BATCH,
+                 max_delay: float = BATCH_DELAY):
+        self.executor = executor
+        self.worker = worker
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.pending: Dict[Tuple, List[Tuple[Any, asyncio.Future]]] = {}
+        self.timers: Dict[Tuple, asyncio.TimerHandle] = {}
+        self.batches = 0
+        self.items = 0
+
+    async def submit(self, key: Tuple, item: Any) -> Tuple[bool, str]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        queue = self.pending.setdefault(key, [])
+        queue.append((item, future))
+
+        if len(queue) >= self.max_batch:
+            self._flush(key)
+        elif key not in self.timers:
+            self.timers[key] = loop.call_later(self.max_delay, self._flush, key)
+        return await future
+
+    async def run(self, key: Tuple, items: List[Any]) -> List[Tuple[bool, str]]:
+        loop = asyncio.get_running_loop()
+        self.batches += 1
+        self.items += len(items)
+        return await loop.run_in_executor(self.executor, self.worker, key, items)
+
+    def _flush(self, key: Tuple):
+        timer = self.timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        entries = self.pending.pop(key, [])
+        if not entries:
+            return
+
+        items = [item for item, _ in entries]
+        futures = [future for _, future in entries]
+        task = asyncio.ensure_future(self.run(key, items))
+        task.add_done_callback(lambda done: self._resolve(done, futures))
+
+    @staticmethod
+    def _resolve(done: asyncio.Future, futures: List[asyncio.Future]):
+        if done.exception() is not None:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(done.exception())
+            return
+        for future, outcome in zip(futures, done.result()):
+            if not future.done():
+                future.set_result(outcome)
+
+
+class EvaluationServer:
+    def __init__(self, executor: Executor, max_batch: int = MAX_BATCH,
+                 max_delay: float = BATCH_DELAY):
+        self.evaluations = MicroBatcher(executor, evaluate_worker, max_batch, max_delay)
+        self.applications = MicroBatcher(executor, apply_worker, max_batch, max_delay)
+        self.conversions = MicroBatcher(executor, convert_worker, max_batch, max_delay)
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.started = time.time()
+        self.methods: Dict[str, Callable] = {
+            'evaluate': self.evaluate,
+            'evaluate_batch': self.evaluate_batch,
+            'apply': self.apply,
+            'apply_batch': self.apply_batch,
+            'convert': self.convert,
+            'convert_batch': self.convert_batch,
+            'units': self.units,
+            'stats': self.stats
+        }
+        self.signatures = {name: inspect.signature(method) for name, method in self.methods.items()}
+
+    async def evaluate(self, expression: str, angle_mode: str = 'deg',
+                       precision: Optional[int] = None, complex: bool = False) -> Dict[str, str]:
+        key = (_angle_mode(angle_mode), _precision(precision), _complex(complex))
+        return _outcome(await self.evaluations.submit(key, _expression(expression)))
+
+    async def evaluate_batch(self, expressions: List[str], angle_mode: str = 'deg',
+                             precision: Optional[int] = None, complex: bool = False) -> List[Dict[str, str]]:
+        if not isinstance(expressions, list):
+            raise RpcError(INVALID_PARAMS, "expressions must be a list")
+        key = (_angle_mode(angle_mode), _precision(precision), _complex(complex))
+        outcomes = await self.evaluations.run(key, [_expression(e) for e in expressions])
+        return [_outcome(o) for o in outcomes]
+
+    async def apply(self, function: str, value: float,
+                    angle_mode: str = 'deg', complex: bool = False) -> Dict[str, str]:
+        key = (_function(function), _angle_mode(angle_mode), _complex(complex))
+        return _outcome(await self.applications.submit(key, _number(value)))
+
+    async def apply_batch(self, function: str, values: List[float],
+                          angle_mode: str = 'deg', complex: bool = False) -> List[Dict[str, str]]:
+        if not isinstance(values, list):
+            raise RpcError(INVALID_PARAMS, "values must be a list")
+        key = (_function(function), _angle_mode(angle_mode), _complex(complex))
+        outcomes = await self.applications.run(key, [_number(v) for v in values])
+        return [_outcome(o) for o in outcomes]
+
+    async def convert(self, value: float, from_unit: str, to_unit: str) -> Dict[str, str]:
+        key = _units(from_unit, to_unit)
+        return _outcome(await self.conversions.submit(key, _number(value)))
+
+    async def convert_batch(self, values: List[float], from_unit: str, to_unit: str) -> List[Dict[str, str]]:
+        if not isinstance(values, list):
+            raise RpcError(INVALID_PARAMS, "values must be a list")
+        key = _units(from_unit, to_unit)
+        outcomes = await self.conversions.run(key, [_number(v) for v in values])
+        return [_outcome(o) for o in outcomes]
+
+    async def units(self) -> Dict[str, List[str]]:
+        return {category: unit_engine.units(category) for category in unit_engine.categories()}
+
+    async def stats(self) -> Dict[str, Any]:
+        return {
+            'uptime_s': time.time() - self.started,
+            'batches': {
+                'evaluate': {'batches': self.evaluations.batches, 'items': self.evaluations.items},
+                'apply': {'batches': self.applications.batches, 'items': self.applications.items},
+                'convert': {'batches': self.conversions.batches, 'items': self.conversions.items}
+            },
+            'latency': {name: h.snapshot() for name, h in sorted(self.histograms.items())}
+        }
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        write_lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    await self._send(writer, write_lock, _error(None, INVALID_REQUEST, "Request too large"))
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.ensure_future(self._handle_line(line, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            writer.close()
+
+    async def _handle_line(self, line: bytes, writer: asyncio.StreamWriter, write_lock: asyncio.Lock):
+        try:
+            request = json.loads(line)
+        except ValueError:
+            await self._send(writer, write_lock, _error(None, PARSE_ERROR, "Parse error"))
+            return
+
+        if isinstance(request, list):
+            if not request:
+                response = _error(None, INVALID_REQUEST, "Empty batch")
+            else:
+                responses = await asyncio.gather(*(self._dispatch(r) for r in request))
+                response = [r for r in responses if r is not None]
+        else:
+            response = await self._dispatch(request)
+
+        if response:
+            await self._send(writer, write_lock, response)
+
+    async def _dispatch(self, request: Any) -> Optional[Dict[str, Any]]:
+        if not isinstance(request, dict) or request.get('jsonrpc') != '2.0':
+            return _error(None, INVALID_REQUEST, "Invalid request")
+
+        response = await self._call(request)
+        return response if 'id' in request else None
+
+    async def _call(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        request_id = request.get('id')
+        name = request.get('method')
+        method = self.methods.get(name) if isinstance(name, str) else None
+        if method is None:
+            return _error(request_id, METHOD_NOT_FOUND, "Method not found")
+
+        params = request.get('params', {})
+        try:
+            if isinstance(params, list):
+                arguments = self.signatures[name].bind(*params)
+            elif isinstance(params, dict):
+                arguments = self.signatures[name].bind(**params)
+            else:
+                return _error(request_id, INVALID_PARAMS, "Invalid params")
+        except TypeError as e:
+            return _error(request_id, INVALID_PARAMS, str(e))
+
+        start = time.perf_counter()
+        try:
+            result = await method(*arguments.args, **arguments.kwargs)
+        except RpcError as e:
+            return _error(request_id, e.code, e.message)
+        except Exception:
+            return _error(request_id, INTERNAL_ERROR, "Internal error")
+        finally:
+            self.histograms.setdefault(name, LatencyHistogram()).record(time.perf_counter() - start)
+
+        return {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, write_lock: asyncio.Lock, payload: Any):
+        async with write_lock:
+            writer.write(json.dumps(payload, ensure_ascii=False).encode('utf-8') + b'\n')
+            await writer.drain()
+
+
+def _error(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
+
+
+def _outcome(outcome: Tuple[bool, str]) -> Dict[str, str]:
+    ok, text = outcome
+    return {'value': text} if ok else {'error': text}
+
+
+def _angle_mode(angle_mode: str) -> str:
+    if angle_mode not in ('deg', 'rad'):
+        raise RpcError(INVALID_PARAMS, "angle_mode must be 'deg' or 'rad'")
+    return angle_mode
+
+
+def _precision(precision: Optional[int]) -> Optional[int]:
+    if precision is not None and (isinstance(precision, bool) or not isinstance(precision, int)
+                                  or not 1 <= precision <= 1000):
+        raise RpcError(INVALID_PARAMS, "precision must be an integer between 1 and 1000")
+    return precision
+
+
+def _complex(complex_mode: bool) -> bool:
+    if not isinstance(complex_mode, bool):
+        raise RpcError(INVALID_PARAMS, "complex must be a boolean")
+    return complex_mode
+
+
+def _units(from_unit: str, to_unit: str) -> Tuple[str, str]:
+    if not isinstance(from_unit, str) or not isinstance(to_unit, str):
+        raise RpcError(INVALID_PARAMS, "units must be strings")
+    try:
+        unit_engine.conversion(from_unit, to_unit)
+    except ValueError as e:
+        raise RpcError(INVALID_PARAMS, str(e))
+    return from_unit, to_unit
+
+
+def _expression(expression: str) -> str:
+    if not isinstance(expression, str):
+        raise RpcError(INVALID_PARAMS, "expression must be a string")
+    return expression
+
+
+def _function(function: str) -> str:
+    if not isinstance(function, str):
+        raise RpcError(INVALID_PARAMS, "function must be a string")
+    return function
+
+
+def _number(value: float) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise RpcError(INVALID_PARAMS, "value must be a number")
+    return float(value)
+
+
+async def serve(args: argparse.Namespace):
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=open_result_cache,
+                             initargs=(args.cache, args.cache_size)) as executor:
+        server = EvaluationServer(executor, args.max_batch, args.batch_delay / 1000)
+        if args.socket:
+            if os.path.exists(args.socket):
+                os.unlink(args.socket)
+            listener = await asyncio.start_unix_server(server.handle_connection, path=args.socket, limit=MAX_LINE)
+            address = args.socket
+        else:
+            listener = await asyncio.start_server(server.handle_connection, args.host, args.port, limit=MAX_LINE)
+            address = f"{args.host}:{args.port}"
+
+        print(f"Calculator evaluation server listening on {address}", flush=True)
+        async with listener:
+            await listener.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local JSON-RPC evaluation server for the calculator engine")
+    parser.add_argument('--socket', help="Unix socket path (default: TCP on --host/--port)")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--max-batch', type=int, default=MAX_BATCH)
+    parser.add_argument('--batch-delay', type=float, default=BATCH_DELAY * 1000,
+                        help="Micro-batching window in milliseconds")
+    parser.add_argument('--cache', help="SQLite file that persists high-precision and series results across runs")
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_MAX_ENTRIES,
+                        help="Maximum number of cached results (least recently used are evicted)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
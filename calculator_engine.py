@@ -0,0 +1,306 @@
+import ast
+import cmath
+import math
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+from instrumentation import instrumented
+from startup_profiler import lazy_import
+
+np = lazy_import('numpy')
+complex_engine = lazy_import('complex_engine')
+precision_engine = lazy_import('precision_engine')
+result_cache = lazy_import('result_cache')
+series_engine = lazy_import('series_engine')
+trig_kernels = lazy_import('trig_kernels')
+unit_engine = lazy_import('unit_engine')
+
+Scalar = Union[float, complex]
+
+ALLOWED_EXPRESSION_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd
+)
+
+
+class AngleMode(Enum):
+    DEGREES = 'deg'
+    RADIANS = 'rad'
+
+
+class CalculatorEngine:
+    MAX_DIGITS = 15
+
+    angle_mode = AngleMode.DEGREES
+    precision_digits: Optional[int] = None
+    complex_mode = False
+    result_cache: Optional['result_cache.ResultCache'] = None
+
+    def compute_expression(self, full_expr: str) -> str:
+        complex_input = self.complex_mode and 'i' in full_expr
+        if self.precision_digits is not None and not complex_input:
+            return self._cached('expr', full_expr, lambda: self._compute_precise(full_expr))
+
+        result = eval(complex_engine.to_python(full_expr) if complex_input else full_expr)
+
+        if isinstance(result, complex) and self.complex_mode:
+            result = complex_engine.clean(result)
+        elif not isinstance(result, (int, float)):
+            raise ValueError("Invalid result type")
+
+        if abs(result) > 1e15:
+            raise OverflowError("Number too large")
+
+        return self._format_number(result)
+
+    def _compute_precise(self, full_expr: str) -> str:
+        result = precision_engine.evaluate_expression(full_expr, self.precision_digits)
+        return precision_engine.format_precise(result, self.precision_digits)
+
+    def _cached(self, kind: str, text: str, compute: Callable[[], Any]) -> Any:
+        cache = self.result_cache
+        if cache is None:
+            return compute()
+        angle_mode = None if kind == 'expr' else self.angle_mode.value
+        key = result_cache.make_key(kind, text, angle_mode, self.precision_digits, self.complex_mode)
+        value = cache.get(key)
+        if value is None:
+            value = compute()
+            cache.put(key, value)
+        return value
+
+    def compute_function(self, func_name: str, value: Scalar) -> str:
+        result = self._apply_scientific_function(func_name, value)
+
+        if abs(result) > 1e15:
+            raise OverflowError("Number too large")
+
+        return self._format_number(result)
+
+    def compute_expression_batch(self, expressions: Sequence[str]) -> List[Tuple[bool, str]]:
+        outcomes = []
+        for expr in expressions:
+            try:
+                check_expression(complex_engine.to_python(expr) if self.complex_mode else expr,
+                                 self.complex_mode)
+                outcomes.append((True, self.compute_expression(expr)))
+            except Exception as e:
+                outcomes.append((False, expression_error_message(e)))
+        return outcomes
+
+    def compute_function_batch(self, func_name: str, values: Sequence[float]) -> List[Tuple[bool, str]]:
+        values = np.asarray(values, dtype=np.float64).reshape(-1)
+        kernel = None
+        if self.angle_mode == AngleMode.DEGREES:
+            kernel = trig_kernels.DEGREE_ARRAY_FUNCTIONS.get(func_name)
+        if kernel is None and self.complex_mode:
+            kernel = complex_engine.ARRAY_FUNCTIONS.get(func_name)
+        if kernel is None:
+            return [self._function_outcome(func_name, v) for v in values.tolist()]
+
+        outcomes = []
+        for value, result in zip(values.tolist(), kernel(values).tolist()):
+            if cmath.isnan(result) or abs(result) > 1e15:
+                outcomes.append(self._function_outcome(func_name, value))
+            else:
+                outcomes.append((True, self._format_number(complex_engine.clean(result))))
+        return outcomes
+
+    def compute_conversion(self, value: float, from_unit: str, to_unit: str) -> str:
+        return unit_engine.format_value(unit_engine.convert(value, from_unit, to_unit))
+
+    def compute_conversion_batch(self, values: Sequence[float], from_unit: str,
+                                 to_unit: str) -> List[Tuple[bool, str]]:
+        outcomes = []
+        for result in unit_engine.convert_array(values, from_unit, to_unit).reshape(-1).tolist():
+            if math.isfinite(result):
+                outcomes.append((True, unit_engine.format_value(result)))
+            else:
+                outcomes.append((False, "Number too large"))
+        return outcomes
+
+    def compute_series(self, operator: str, expr: str, start: int, stop: Optional[int]) -> Tuple[str, str]:
+        if operator not in series_engine.OPERATORS:
+            raise ValueError(f"Unknown operator: {operator}")
+        text = f"{operator}({start},{'inf' if stop is None else stop}){expr}"
+        result_str, method = self._cached('series', text, lambda: self._compute_series(operator, expr, start, stop))
+        return result_str, method
+
+    def _compute_series(self, operator: str, expr: str, start: int, stop: Optional[int]) -> List[str]:
+        result = series_engine.OPERATORS[operator](expr, start, stop, self.angle_mode == AngleMode.DEGREES)
+
+        if abs(result.value) > 1e15:
+            raise OverflowError("Number too large")
+
+        return [self._format_number(result.value), result.method]
+
+    def _function_outcome(self, func_name: str, value: float) -> Tuple[bool, str]:
+        try:
+            return True, self.compute_function(func_name, value)
+        except Exception as e:
+            return False, function_error_message(e)
+
+    def parse_value(self, text: str) -> Scalar:
+        if self.complex_mode:
+            return complex_engine.parse(text)
+        return float(text)
+
+    def _apply_scientific_function(self, func_name: str, value: Scalar) -> Scalar:
+        if isinstance(value, complex):
+            return complex_engine.apply(func_name, value, self.angle_mode == AngleMode.DEGREES)
+        if self.angle_mode == AngleMode.DEGREES and func_name in trig_kernels.DEGREE_FUNCTIONS:
+            return trig_kernels.DEGREE_FUNCTIONS[func_name](value)
+
+        angle_rad = value
+
+        function_map = {
+            'sin': lambda v: math.sin(angle_rad),
+            'cos': lambda v: math.cos(angle_rad),
+            'tan': lambda v: math.tan(angle_rad),
+            'asin': lambda v: self._asin_safe(v),
+            'acos': lambda v: self._acos_safe(v),
+            'atan': lambda v: self._atan_safe(v),
+            'csc': lambda v: self._csc_safe(angle_rad),
+            'sec': lambda v: self._sec_safe(angle_rad),
+            'cot': lambda v: self._cot_safe(angle_rad),
+            'sqrt': lambda v: self._sqrt_safe(v),
+            'ln': lambda v: self._ln_safe(v),
+            'log': lambda v: self._log_safe(v),
+            'square': lambda v: v ** 2
+        }
+
+        if func_name not in function_map:
+            raise ValueError(f"Unknown function: {func_name}")
+
+        return function_map[func_name](value)
+
+    def _asin_safe(self, value: float) -> float:
+        if value < -1 or value > 1:
+            if self.complex_mode:
+                return complex_engine.apply('asin', value, self.angle_mode == AngleMode.DEGREES)
+            raise ValueError("Domain error: arcsin requires -1 ≤ x ≤ 1")
+        result = math.asin(value)
+        return math.degrees(result) if self.angle_mode == AngleMode.DEGREES else result
+
+    def _acos_safe(self, value: float) -> float:
+        if value < -1 or value > 1:
+            if self.complex_mode:
+                return complex_engine.apply('acos', value, self.angle_mode == AngleMode.DEGREES)
+            raise ValueError("Domain error: arccos requires -1 ≤ x ≤ 1")
+        result = math.acos(value)
+        return math.degrees(result) if self.angle_mode == AngleMode.DEGREES else result
+
+    def _atan_safe(self, value: float) -> float:
+        result = math.atan(value)
+        return math.degrees(result) if self.angle_mode == AngleMode.DEGREES else result
+
+    def _csc_safe(self, angle_rad: float) -> float:
+        sin_val = math.sin(angle_rad)
+        if abs(sin_val) < 1e-10:
+            raise ValueError("Math error: csc undefined")
+        return 1 / sin_val
+
+    def _sec_safe(self, angle_rad: float) -> float:
+        cos_val = math.cos(angle_rad)
+        if abs(cos_val) < 1e-10:
+            raise ValueError("Math error: sec undefined")
+        return 1 / cos_val
+
+    def _cot_safe(self, angle_rad: float) -> float:
+        tan_val = math.tan(angle_rad)
+        if abs(tan_val) < 1e-10:
+            raise ValueError("Math error: cot undefined")
+        return 1 / tan_val
+
+    def _sqrt_safe(self, value: float) -> float:
+        if value < 0:
+            if self.complex_mode:
+                return cmath.sqrt(value)
+            raise ValueError("Cannot calculate square root of negative number")
+        return math.sqrt(value)
+
+    def _ln_safe(self, value: float) -> float:
+        if value < 0 and self.complex_mode:
+            return cmath.log(value)
+        if value <= 0:
+            raise ValueError("Cannot calculate ln of non-positive number")
+        return math.log(value)
+
+    def _log_safe(self, value: float) -> float:
+        if value < 0 and self.complex_mode:
+            return cmath.log10(value)
+        if value <= 0:
+            raise ValueError("Cannot calculate log of non-positive number")
+        return math.log10(value)
+
+    def _root_safe(self, value: Scalar, power: float) -> Scalar:
+        if power == 0:
+            raise ValueError("Root power cannot be zero")
+        if isinstance(value, complex):
+            return complex_engine.root(value, power)
+        if value >= 0:
+            return value ** (1 / power)
+        if power == int(power) and int(power) % 2 == 1:
+            return -((-value) ** (1 / power))
+        if self.complex_mode:
+            return complex_engine.root(value, power)
+        raise ValueError("Cannot calculate even root of negative number")
+
+    @instrumented
+    def _format_number(self, number: Scalar) -> str:
+        if isinstance(number, complex):
+            return complex_engine.format_rectangular(number, self._format_number)
+        if number == int(number):
+            return str(int(number))
+        else:
+            result_str = str(round(number, 10))
+            if '.' in result_str:
+                result_str = result_str.rstrip('0').rstrip('.')
+
+            if len(result_str) > self.MAX_DIGITS:
+                return f"{number:.6e}"
+
+            return result_str
+
+
+class HeadlessEngine(CalculatorEngine):
+    def __init__(self, angle_mode: AngleMode = AngleMode.DEGREES,
+                 precision_digits: Optional[int] = None, complex_mode: bool = False):
+        self.angle_mode = angle_mode
+        self.precision_digits = precision_digits
+        self.complex_mode = complex_mode
+
+
+def expression_error_message(error: Exception) -> str:
+    if isinstance(error, ZeroDivisionError):
+        return "Cannot divide by zero"
+    if isinstance(error, OverflowError):
+        return "Number too large"
+    return "Error"
+
+
+def function_error_message(error: Exception) -> str:
+    if isinstance(error, ValueError):
+        return str(error)
+    return "Math Error"
+
+
+@lru_cache(maxsize=1024)
+def check_expression(expr: str, allow_complex: bool = False):
+    try:
+        tree = ast.parse(expr, mode='eval')
+    except SyntaxError:
+        raise ValueError("Invalid expression")
+    constant_types = (int, float, complex) if allow_complex else (int, float)
+    for node in ast.walk(tree):
+        if not isinstance(node, ALLOWED_EXPRESSION_NODES):
+            raise ValueError("Invalid expression")
+        if isinstance(node, ast.Constant) and type(node.value) not in constant_types:
+            raise ValueError("Invalid expression")
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            exponent = node.right.operand if isinstance(node.right, ast.UnaryOp) else node.right
+            if not isinstance(exponent, ast.Constant):
+                raise ValueError("Invalid expression")
+            if abs(exponent.value) > precision_engine.MAX_POWER_EXPONENT:
+                raise OverflowError("Number too large")
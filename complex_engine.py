@@ -0,0 +1,135 @@
+import cmath
+import math
+import re
+from typing import Callable, Dict, Union
+
+import numpy as np
+
+RECTANGULAR = 'rect'
+POLAR = 'polar'
+DISPLAY_MODES = [RECTANGULAR, POLAR]
+
+DEG = math.pi / 180
+ZERO_TOLERANCE = 1e-12
+
+Scalar = Union[float, complex]
+
+_BARE_UNIT = re.compile(r'(?<![\d.])i')
+
+
+def to_python(expr: str) -> str:
+    return _BARE_UNIT.sub('1j', expr).replace('i', 'j')
+
+
+def parse(text: str) -> Scalar:
+    try:
+        return float(text)
+    except ValueError:
+        pass
+
+    try:
+        return complex(to_python(text))
+    except ValueError:
+        raise ValueError(f"Invalid number: {text}")
+
+
+def clean(value: Scalar) -> Scalar:
+    if not isinstance(value, complex):
+        return value
+    scale = max(1.0, abs(value))
+    real = 0.0 if abs(value.real) < ZERO_TOLERANCE * scale else value.real
+    imag = 0.0 if abs(value.imag) < ZERO_TOLERANCE * scale else value.imag
+    if imag == 0:
+        return real
+    return complex(real, imag)
+
+
+def format_rectangular(value: complex, format_real: Callable[[float], str]) -> str:
+    real, imag = value.real, value.imag
+    imag_text = "" if abs(imag) == 1 else format_real(abs(imag))
+    sign = '-' if imag < 0 else '+'
+    if real == 0:
+        return f"{'-' if imag < 0 else ''}{imag_text}i"
+    return f"{format_real(real)}{sign}{imag_text}i"
+
+
+def format_polar(value: complex, format_real: Callable[[float], str], degrees: bool) -> str:
+    radius, angle = cmath.polar(value)
+    if degrees:
+        return f"{format_real(radius)} cis {format_real(math.degrees(angle))}°"
+    return f"{format_real(radius)} cis {format_real(angle)}"
+
+
+def _scaled_trig(func: Callable[[complex], complex]) -> Callable[[complex, bool], complex]:
+    return lambda z, degrees: func(z * DEG if degrees else z)
+
+
+def _inverse_trig(func: Callable[[complex], complex]) -> Callable[[complex, bool], complex]:
+    return lambda z, degrees: func(z) / DEG if degrees else func(z)
+
+
+def _reciprocal(func: Callable[[complex], complex], name: str) -> Callable[[complex, bool], complex]:
+    def apply(z: complex, degrees: bool) -> complex:
+        value = func(z * DEG if degrees else z)
+        if value == 0:
+            raise ValueError(f"Math error: {name} undefined")
+        return 1 / value
+    return apply
+
+
+def _log(func: Callable[[complex], complex], name: str) -> Callable[[complex, bool], complex]:
+    def apply(z: complex, degrees: bool) -> complex:
+        if z == 0:
+            raise ValueError(f"Cannot calculate {name} of zero")
+        return func(z)
+    return apply
+
+
+FUNCTIONS: Dict[str, Callable[[complex, bool], complex]] = {
+    'sin': _scaled_trig(cmath.sin),
+    'cos': _scaled_trig(cmath.cos),
+    'tan': _scaled_trig(cmath.tan),
+    'asin': _inverse_trig(cmath.asin),
+    'acos': _inverse_trig(cmath.acos),
+    'atan': _inverse_trig(cmath.atan),
+    'csc': _reciprocal(cmath.sin, 'csc'),
+    'sec': _reciprocal(cmath.cos, 'sec'),
+    'cot': _reciprocal(cmath.tan, 'cot'),
+    'sqrt': lambda z, degrees: cmath.sqrt(z),
+    'ln': _log(cmath.log, 'ln'),
+    'log': _log(cmath.log10, 'log'),
+    'square': lambda z, degrees: z * z
+}
+
+
+def apply(func_name: str, value: Scalar, degrees: bool) -> Scalar:
+    if func_name not in FUNCTIONS:
+        raise ValueError(f"Unknown function: {func_name}")
+    return clean(FUNCTIONS[func_name](complex(value), degrees))
+
+
+def root(value: Scalar, power: float) -> Scalar:
+    if value == 0:
+        return 0.0
+    return clean(cmath.exp(cmath.log(complex(value)) / power))
+
+
+def _real_or_complex(func: Callable[[np.ndarray], np.ndarray],
+                     invalid: Callable[[np.ndarray], np.ndarray]) -> Callable[[np.ndarray], np.ndarray]:
+    def apply_array(values: np.ndarray) -> np.ndarray:
+        bad = invalid(values)
+        with np.errstate(divide='ignore'):
+            if not bad.any():
+                return func(values)
+            result = np.empty(values.shape, dtype=np.complex128)
+            result[~bad] = func(values[~bad])
+            result[bad] = func(values[bad].astype(np.complex128))
+        return result
+    return apply_array
+
+
+ARRAY_FUNCTIONS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    'sqrt': _real_or_complex(np.sqrt, lambda v: v < 0),
+    'ln': _real_or_complex(np.log, lambda v: v < 0),
+    'log': _real_or_complex(np.log10, lambda v: v < 0)
+}
@@ -0,0 +1,243 @@
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(REPO_ROOT, 'Advanced-Scientific-Calculator.py')
+WINDOW_SIZE = (420, 680)
+
+KEY_CODES = {
+    '.': 46, '+': 43, '-': 45, '*': 42, '/': 47, '%': 37,
+    '=': 13, '\n': 13, '\b': 8, '\x1b': 27
+}
+
+_window = None
+
+
+def install_window(size: Sequence[int] = WINDOW_SIZE):
+    global _window
+    if _window is not None:
+        return _window
+
+    os.environ.setdefault('KIVY_NO_ARGS', '1')
+    os.environ.setdefault('KIVY_NO_CONSOLELOG', '1')
+    os.environ['KIVY_GL_BACKEND'] = 'mock'
+    os.environ['KIVY_WINDOW'] = ''
+    os.environ.setdefault('KCFG_GRAPHICS_MAXFPS', '0')
+    if 'kivy.core.window' in sys.modules and sys.modules['kivy.core.window'].Window is not None:
+        _window = sys.modules['kivy.core.window'].Window
+        return _window
+
+    import kivy.core.window as core_window
+    from kivy.core.window import WindowBase
+
+    class HeadlessWindow(WindowBase):
+        def flip(self):
+            pass
+
+        def request_keyboard(self, callback, target, input_type='text', keyboard_suggestions=True):
+            return None
+
+    _window = HeadlessWindow()
+    _window.size = size
+    core_window.Window = _window
+    return _window
+
+
+def load_app_module():
+    install_window()
+    module = sys.modules.get('calculator_app')
+    if module is None:
+        if REPO_ROOT not in sys.path:
+            sys.path.insert(0, REPO_ROOT)
+        spec = importlib.util.spec_from_file_location('calculator_app', APP_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules['calculator_app'] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+class HeadlessCalculator:
+    def __init__(self, session_store=None, complete_startup: bool = True):
+        self.window = install_window()
+        from kivy.clock import Clock
+
+        self.module = load_app_module()
+        self.clock = Clock
+        self.calculator = self.module.Calculator(session_store=session_store)
+        self.window.add_widget(self.calculator)
+        self.frame_times: List[float] = []
+        self.frame()
+        if complete_startup:
+            self.calculator.complete_startup()
+            self.frame()
+
+    def close(self):
+        self.dismiss_popups()
+        self.window.unbind(on_key_down=self.calculator._on_keyboard_down)
+        self.window.unbind(on_flip=self.calculator._on_first_frame)
+        self.window.remove_widget(self.calculator)
+
+    def press(self, text: str, frame: bool = True):
+        button = self.find_button(text)
+        button.trigger_action(duration=0)
+        if frame:
+            self.frame()
+
+    def find_button(self, text: str):
+        calc = self.calculator
+        if text in calc.btns_dict:
+            return calc.btns_dict[text]
+        for button in calc.menu_buttons:
+            if button.text == text:
+                return button
+        for button in self._walk_buttons():
+            if button.text == text:
+                return button
+        raise KeyError(f"No button labelled {text!r}")
+
+    def key(self, key: int, codepoint: str = '', modifiers: Iterable[str] = (), frame: bool = True):
+        self.window.dispatch('on_key_down', key, 0, codepoint, list(modifiers))
+        if frame:
+            self.frame()
+
+    def type(self, text: str, frame: bool = True):
+        for char in text:
+            if char.isdigit():
+                self.key(ord(char), char, frame=frame)
+            elif char in KEY_CODES:
+                self.key(KEY_CODES[char], char if char.isprintable() else '', frame=frame)
+            else:
+                self.key(ord(char.lower()), char, frame=frame)
+
+    def frame(self) -> float:
+        start = time.perf_counter()
+        self.clock.tick()
+        self.window.dispatch('on_draw')
+        self.window.dispatch('on_flip')
+        elapsed = time.perf_counter() - start
+        self.frame_times.append(elapsed)
+        return elapsed
+
+    def frames(self, count: int) -> List[float]:
+        return [self.frame() for _ in range(count)]
+
+    def dismiss_popups(self):
+        from kivy.uix.modalview import ModalView
+
+        for widget in list(self.window.children):
+            if isinstance(widget, ModalView):
+                widget.dismiss(animation=False)
+        self.frame()
+
+    def widget_count(self) -> int:
+        return sum(1 for _ in self._walk_widgets())
+
+    def canvas_instruction_count(self) -> int:
+        total = 0
+        for widget in self._walk_widgets():
+            canvas = widget.canvas
+            if canvas is None:
+                continue
+            for group in (canvas.before, canvas, canvas.after):
+                total += _count_instructions(group)
+        return total
+
+    def display(self) -> Dict[str, str]:
+        calc = self.calculator
+        return {
+            'label': calc.label.text,
+            'total': calc.total_label.text,
+            'memory': calc.memory_label.text
+        }
+
+    def metrics(self) -> Dict[str, Any]:
+        frames = self.frame_times or [0.0]
+        return {
+            'widgets': self.widget_count(),
+            'canvas_instructions': self.canvas_instruction_count(),
+            'frames': len(self.frame_times),
+            'frame_ms_mean': statistics.mean(frames) * 1000,
+            'frame_ms_max': max(frames) * 1000,
+            'frame_ms_p95': sorted(frames)[int(0.95 * (len(frames) - 1))] * 1000
+        }
+
+    def _walk_widgets(self):
+        for root in self.window.children:
+            yield from root.walk(restrict=True)
+
+    def _walk_buttons(self):
+        from kivy.uix.button import Button
+
+        for widget in self._walk_widgets():
+            if isinstance(widget, Button):
+                yield widget
+
+
+def _count_instructions(group) -> int:
+    children = getattr(group, 'children', None)
+    if not children:
+        return 0
+    return sum(1 + _count_instructions(child) for child in children)
+
+
+def run_scenario(steps: Sequence[str], calc: Optional[HeadlessCalculator] = None) -> Dict[str, Any]:
+    calc = calc or HeadlessCalculator()
+    calc.frame_times.clear()
+    timings = []
+    for step in steps:
+        kind, _, arg = step.partition(':')
+        start = time.perf_counter()
+        if kind == 'press':
+            calc.press(arg)
+        elif kind == 'type':
+            calc.type(arg)
+        elif kind == 'frames':
+            calc.frames(int(arg))
+        elif kind == 'dismiss':
+            calc.dismiss_popups()
+        else:
+            raise ValueError(f"Unknown step: {step}")
+        timings.append((step, (time.perf_counter() - start) * 1000))
+
+    result = calc.metrics()
+    result['display'] = calc.display()
+    result['steps_ms'] = timings
+    return result
+
+
+DEFAULT_SCENARIO = [
+    'type:12+30=', 'press:Theme', 'press:Scientific', 'type:9', 'press:√',
+    'press:=', 'press:Standard', 'press:History', 'frames:5', 'dismiss', 'frames:5'
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive the calculator UI without a display")
+    parser.add_argument('steps', nargs='*', default=DEFAULT_SCENARIO,
+                        help="Steps such as press:7, type:12+3=, frames:10, dismiss")
+    parser.add_argument('--json', action='store_true', help="Print the result as JSON")
+    args = parser.parse_args()
+
+    result = run_scenario(args.steps)
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return
+
+    print(f"display              {result['display']['label']!r}")
+    print(f"widgets              {result['widgets']}")
+    print(f"canvas instructions  {result['canvas_instructions']}")
+    print(f"frames               {result['frames']} "
+          f"(mean {result['frame_ms_mean']:.3f} ms, p95 {result['frame_ms_p95']:.3f} ms, "
+          f"max {result['frame_ms_max']:.3f} ms)")
+    for step, ms in result['steps_ms']:
+        print(f"  {step:<24}{ms:>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+import argparse
+import difflib
+import json
+import os
+import statistics
+import struct
+import tempfile
+import time
+from typing import Any, BinaryIO, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from session_store import SessionState, SessionStore, encode
+
+RECORD_ENV = 'CALC_RECORD'
+MAGIC = b'CALCREC1'
+
+DEFINE = 0
+PRESS = 1
+MENU = 2
+KEY = 3
+END = 4
+
+EVENT = struct.Struct('<BI')
+LABEL_ID = struct.Struct('<H')
+KEY_EVENT = struct.Struct('<HHBH')
+LENGTH = struct.Struct('<I')
+
+MODIFIERS = ['shift', 'ctrl', 'alt', 'meta', 'capslock', 'numlock']
+MAX_DELTA_US = 2 ** 32 - 1
+
+MENU_BUTTONS = {
+    'History': 'history_btn',
+    'Theme': 'theme_btn',
+    'Scientific': 'mode_btn',
+    'Stats': 'stats_btn',
+    'Matrix': 'matrix_btn',
+    'Prog': 'programmer_btn'
+}
+STATE_FIELDS = ['total_expression', 'current_expression', 'last_result', 'pending_function',
+                'custom_root_mode', 'root_power_value', 'scientific_mode', 'stats_mode', 'matrix_mode',
+                'programmer_mode', 'error_state', 'has_memory']
+
+
+class InputEvent(NamedTuple):
+    time: float
+    kind: int
+    label: str = ''
+    key: int = 0
+    scancode: int = 0
+    modifiers: Tuple[str, ...] = ()
+
+
+class Recording(NamedTuple):
+    initial_state: bytes
+    events: List[InputEvent]
+    final_state: Optional[bytes]
+
+
+class EventRecorder:
+    def __init__(self, path: str, initial_state: SessionState):
+        self.path = path
+        self.labels: Dict[str, int] = {}
+        self.last_time = time.perf_counter()
+        self.file: Optional[BinaryIO] = open(path, 'wb')
+        blob = encode(initial_state)
+        self.file.write(MAGIC + LENGTH.pack(len(blob)) + blob)
+
+    def record_press(self, label: str, menu: bool = False):
+        if self.file is None:
+            return
+        self._write(MENU if menu else PRESS, LABEL_ID.pack(self._label_id(label)))
+
+    def record_key(self, key: int, scancode: int, codepoint: Optional[str], modifiers: Sequence[str]):
+        if self.file is None:
+            return
+        mask = sum(1 << i for i, name in enumerate(MODIFIERS) if name in modifiers)
+        payload = KEY_EVENT.pack(key & 0xFFFF, scancode & 0xFFFF, mask, self._label_id(codepoint or ''))
+        self._write(KEY, payload)
+
+    def flush(self):
+        if self.file is not None:
+            self.file.flush()
+
+    def close(self, final_state: Optional[SessionState] = None):
+        if self.file is None:
+            return
+        if final_state is not None:
+            blob = encode(final_state)
+            self._write(END, LENGTH.pack(len(blob)) + blob)
+        self.file.close()
+        self.file = None
+
+    def _label_id(self, label: str) -> int:
+        label_id = self.labels.get(label)
+        if label_id is None:
+            label_id = self.labels[label] = len(self.labels)
+            data = label.encode('utf-8')
+            self.file.write(EVENT.pack(DEFINE, 0) + LENGTH.pack(len(data)) + data)
+        return label_id
+
+    def _write(self, kind: int, payload: bytes):
+        if self.file is None:
+            return
+        now = time.perf_counter()
+        delta = min(int((now - self.last_time) * 1e6), MAX_DELTA_US)
+        self.last_time = now
+        self.file.write(EVENT.pack(kind, delta) + payload)
+
+
+def read_recording(path: str) -> Recording:
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not an input recording")
+
+    position = len(MAGIC)
+    initial_state, position = _read_blob(data, position)
+    labels: List[str] = []
+    events: List[InputEvent] = []
+    final_state = None
+    elapsed = 0.0
+
+    while position + EVENT.size <= len(data):
+        kind, delta = EVENT.unpack_from(data, position)
+        position += EVENT.size
+        elapsed += delta / 1e6
+        try:
+            if kind == DEFINE:
+                blob, position = _read_blob(data, position)
+                labels.append(blob.decode('utf-8'))
+            elif kind in (PRESS, MENU):
+                (label_id,) = LABEL_ID.unpack_from(data, position)
+                position += LABEL_ID.size
+                events.append(InputEvent(elapsed, kind, labels[label_id]))
+            elif kind == KEY:
+                key, scancode, mask, label_id = KEY_EVENT.unpack_from(data, position)
+                position += KEY_EVENT.size
+                modifiers = tuple(name for i, name in enumerate(MODIFIERS) if mask & (1 << i))
+                events.append(InputEvent(elapsed, kind, labels[label_id], key, scancode, modifiers))
+            elif kind == END:
+                final_state, position = _read_blob(data, position)
+            else:
+                raise ValueError(f"Unknown event kind {kind}")
+        except (struct.error, IndexError):
+            break
+    return Recording(initial_state, events, final_state)
+
+
+def _read_blob(data: bytes, position: int) -> Tuple[bytes, int]:
+    (length,) = LENGTH.unpack_from(data, position)
+    start = position + LENGTH.size
+    if start + length > len(data):
+        raise struct.error("Truncated recording")
+    return data[start:start + length], start + length
+
+
+def _load_state(blob: bytes, directory: str, name: str) -> Tuple[SessionStore, SessionState]:
+    path = os.path.join(directory, name)
+    with open(path, 'wb') as f:
+        f.write(blob)
+    store = SessionStore(path)
+    snapshot = store.load()
+    if snapshot is None:
+        raise ValueError("Recording holds an unreadable session state")
+    return store, snapshot.state._replace(history=snapshot.load_history())
+
+
+def replay(path: str, pace: str = 'max', draw_frames: bool = False) -> Dict[str, Any]:
+    from headless import HeadlessCalculator
+
+    recording = read_recording(path)
+    with tempfile.TemporaryDirectory() as directory:
+        store, initial = _load_state(recording.initial_state, directory, 'initial.bin')
+        expected = None
+        if recording.final_state is not None:
+            expected = _load_state(recording.final_state, directory, 'final.bin')[1]
+
+        headless = HeadlessCalculator(session_store=store)
+        calc = headless.calculator
+        calc.session_store = None
+        calc.calculation_history
+
+    timings: List[float] = []
+    errors: List[str] = []
+    started = time.perf_counter()
+    for event in recording.events:
+        if pace == 'recorded':
+            delay = event.time - (time.perf_counter() - started)
+            if delay > 0:
+                time.sleep(delay)
+
+        start = time.perf_counter()
+        try:
+            dispatch(headless, event)
+        except KeyError as e:
+            errors.append(str(e))
+        timings.append(time.perf_counter() - start)
+        if draw_frames:
+            headless.frame()
+    total = time.perf_counter() - started
+
+    history = list(calc.calculation_history)
+    report: Dict[str, Any] = {
+        'events': len(recording.events),
+        'recorded_duration_s': recording.events[-1].time if recording.events else 0.0,
+        'replay_duration_s': total,
+        'processing_s': sum(timings),
+        'per_event_us': _summary(timings),
+        'slowest': sorted(
+            ((t * 1e6, _describe(e)) for t, e in zip(timings, recording.events)), reverse=True)[:10],
+        'dispatch_errors': errors,
+        'end_state': {name: getattr(calc, name) for name in STATE_FIELDS},
+        'display': headless.display(),
+        'history_added': history[len(initial.history):] if history[:len(initial.history)] == initial.history
+        else list(difflib.unified_diff(initial.history, history, lineterm='', n=0))
+    }
+    if expected is not None:
+        report['matches_recording'] = (
+            expected.history == history
+            and expected.current_expression == calc.current_expression
+            and expected.total_expression == calc.total_expression
+        )
+        report['history_diff'] = list(difflib.unified_diff(
+            expected.history, history, 'recorded', 'replayed', lineterm='', n=1))
+    headless.close()
+    return report
+
+
+def dispatch(headless, event: InputEvent):
+    calc = headless.calculator
+    if event.kind == PRESS:
+        headless.press(event.label, frame=False)
+    elif event.kind == MENU:
+        getattr(calc, MENU_BUTTONS[event.label]).trigger_action(duration=0)
+    elif event.kind == KEY:
+        headless.key(event.key, event.label, event.modifiers, frame=False)
+
+
+def _summary(seconds: List[float]) -> Dict[str, float]:
+    if not seconds:
+        return {}
+    ordered = sorted(seconds)
+    return {
+        'mean': statistics.mean(ordered) * 1e6,
+        'p50': ordered[len(ordered) // 2] * 1e6,
+        'p99': ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))] * 1e6,
+        'max': ordered[-1] * 1e6
+    }
+
+
+def _describe(event: InputEvent) -> str:
+    if event.kind == KEY:
+        return f"key {event.key} {event.label!r} {'+'.join(event.modifiers)}".rstrip()
+    return f"{'menu' if event.kind == MENU else 'press'} {event.label}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and replay calculator input recordings")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    show_parser = commands.add_parser('show', help="List the recorded events")
+    show_parser.add_argument('path')
+
+    replay_parser = commands.add_parser('replay', help="Replay a recording in a headless calculator")
+    replay_parser.add_argument('path')
+    replay_parser.add_argument('--pace', choices=['max', 'recorded'], default='max')
+    replay_parser.add_argument('--frames', action='store_true', help="Draw a frame after every event")
+    replay_parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    if args.command == 'show':
+        recording = read_recording(args.path)
+        for event in recording.events:
+            print(f"{event.time:10.3f}s  {_describe(event)}")
+        print(f"{len(recording.events)} events, final state {'saved' if recording.final_state else 'missing'}")
+        return
+
+    report = replay(args.path, args.pace, args.frames)
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False, default=str))
+        return
+
+    per_event = report['per_event_us']
+    print(f"events               {report['events']}")
+    print(f"recorded duration    {report['recorded_duration_s']:.3f} s")
+    print(f"replay duration      {report['replay_duration_s']:.3f} s "
+          f"(processing {report['processing_s'] * 1000:.2f} ms)")
+    if per_event:
+        print(f"per event            mean {per_event['mean']:.1f} µs, p50 {per_event['p50']:.1f} µs, "
+              f"p99 {per_event['p99']:.1f} µs, max {per_event['max']:.1f} µs")
+    print(f"display              {report['display']['label']!r}")
+    for name, value in report['end_state'].items():
+        print(f"  {name:<20}{value!r}")
+    print(f"history added        {len(report['history_added'])} entries")
+    if 'matches_recording' in report:
+        print(f"matches recording    {report['matches_recording']}")
+        for line in report['history_diff']:
+            print(f"  {line}")
+    for message in report['dispatch_errors']:
+        print(f"dispatch error: {message}")
+
+
+if __name__ == "__main__":
+    main()
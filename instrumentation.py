@@ -0,0 +1,145 @@
+import functools
+import json
+import math
+import os
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Optional
+
+INSTRUMENT_ENV = 'CALC_INSTRUMENT'
+ENABLED = bool(os.environ.get(INSTRUMENT_ENV))
+
+
+class LatencyHistogram:
+    BUCKETS_US = [2 ** i for i in range(27)]
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.counts = [0] * (len(self.BUCKETS_US) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def record(self, seconds: float):
+        micros = seconds * 1e6
+        index = 0 if micros <= 1 else math.ceil(math.log2(micros))
+        self.counts[min(index, len(self.BUCKETS_US))] += 1
+        self.count += 1
+        self.total += micros
+        self.maximum = max(self.maximum, micros)
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.BUCKETS_US + [math.inf], self.counts):
+            seen += count
+            if seen >= target:
+                return min(bound, self.maximum)
+        return self.maximum
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean_us': self.total / self.count if self.count else 0.0,
+            'p50_us': self.percentile(0.5),
+            'p90_us': self.percentile(0.9),
+            'p99_us': self.percentile(0.99),
+            'max_us': self.maximum,
+            'buckets_us': {
+                ('inf' if bound is None else str(bound)): count
+                for bound, count in zip(self.BUCKETS_US + [None], self.counts) if count
+            }
+        }
+
+
+class Metrics:
+    def __init__(self):
+        self.latencies: Dict[str, LatencyHistogram] = {}
+        self.exceptions: Counter = Counter()
+        self.error_messages: Counter = Counter()
+        self.started = time.time()
+        self.enabled = ENABLED
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        if name not in self.latencies:
+            self.latencies[name] = LatencyHistogram()
+        return self.latencies[name]
+
+    def reset(self):
+        for histogram in self.latencies.values():
+            histogram.clear()
+        self.exceptions.clear()
+        self.error_messages.clear()
+        self.started = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'enabled': self.enabled,
+            'elapsed_s': time.time() - self.started,
+            'calls': {name: h.snapshot() for name, h in sorted(self.latencies.items()) if h.count},
+            'exceptions': dict(self.exceptions),
+            'errors': dict(self.error_messages.most_common())
+        }
+
+    def dump(self, path: str, extra: Optional[Dict[str, Any]] = None):
+        data = self.snapshot()
+        if extra:
+            data.update(extra)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+    def report(self) -> str:
+        if not self.enabled:
+            return f"Instrumentation is off. Start with {INSTRUMENT_ENV}=1 to record hot paths."
+
+        lines = [f"{'function':<26}{'calls':>7}{'p50 µs':>9}{'p99 µs':>9}{'max µs':>10}"]
+        for name, h in sorted(self.latencies.items()):
+            if h.count:
+                lines.append(f"{name:<26}{h.count:>7}{h.percentile(0.5):>9.0f}"
+                             f"{h.percentile(0.99):>9.0f}{h.maximum:>10.0f}")
+        if self.exceptions:
+            lines.append("")
+            lines.extend(f"raised in {name}: {count}" for name, count in self.exceptions.most_common())
+        if self.error_messages:
+            lines.append("")
+            lines.extend(f"{message}: {count}" for message, count in self.error_messages.most_common())
+        return "\n".join(lines)
+
+
+metrics = Metrics()
+
+
+def instrumented(func: Callable) -> Callable:
+    if not ENABLED:
+        return func
+
+    name = func.__name__
+    histogram = metrics.histogram(name)
+    clock = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            metrics.exceptions[name] += 1
+            raise
+        finally:
+            histogram.record(clock() - start)
+    return wrapper
+
+
+def counts_errors(func: Callable) -> Callable:
+    if not ENABLED:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(self, message: str, *args, **kwargs):
+        metrics.error_messages[message] += 1
+        return func(self, message, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,176 @@
+import math
+import os
+from typing import List, Union
+
+import numpy as np
+
+MAX_DISPLAY_ROWS = 4
+MAX_DISPLAY_COLS = 4
+MAX_ENTRY_LENGTH = 200
+
+MatrixValue = Union[float, complex, np.ndarray]
+
+
+def parse_matrix(text: str) -> np.ndarray:
+    rows = text.strip().strip(';').split(';')
+    if not rows[0]:
+        raise ValueError("Empty matrix")
+
+    values: List[List[float]] = []
+    for row in rows:
+        try:
+            values.append([float(cell) for cell in row.strip(',').split(',')])
+        except ValueError:
+            raise ValueError("Invalid matrix entry")
+
+    width = len(values[0])
+    if any(len(row) != width for row in values):
+        raise ValueError("Rows must have the same length")
+    return _require_finite(np.array(values, dtype=np.float64))
+
+
+def load_matrix(path: str) -> np.ndarray:
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.npy':
+        matrix = np.load(path, mmap_mode='r')
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            first_line = f.readline()
+        delimiter = ',' if ',' in first_line else None
+        matrix = np.loadtxt(path, delimiter=delimiter, dtype=np.float64, ndmin=2)
+
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(-1, 1)
+    if matrix.ndim != 2:
+        raise ValueError("Matrix file must hold a 2-D array")
+    return _require_finite(matrix)
+
+
+def format_matrix(matrix: np.ndarray) -> str:
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+
+    rows, cols = matrix.shape
+    row_idx = _display_indices(rows, MAX_DISPLAY_ROWS)
+    col_idx = _display_indices(cols, MAX_DISPLAY_COLS)
+    lines = []
+    for i in row_idx:
+        if i is None:
+            lines.append("⋮")
+            continue
+        cells = ["…" if j is None else format_element(matrix[i, j]) for j in col_idx]
+        lines.append("  ".join(cells))
+    return "\n".join(lines)
+
+
+def format_element(value) -> str:
+    if isinstance(value, (complex, np.complexfloating)) and value.imag != 0:
+        sign = '+' if value.imag >= 0 else '-'
+        return f"{value.real:.4g}{sign}{abs(value.imag):.4g}i"
+    value = float(np.real(value))
+    if not math.isfinite(value):
+        return str(value)
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return f"{value:.5g}"
+
+
+def describe(value: MatrixValue) -> str:
+    if isinstance(value, np.ndarray):
+        if value.ndim == 1:
+            return f"[{value.shape[0]}]"
+        return f"[{value.shape[0]}×{value.shape[1]}]"
+    return format_element(value)
+
+
+def determinant(a: np.ndarray) -> Union[float, complex]:
+    _require_square(a)
+    return _check_overflow(_scalar(np.linalg.det(a)))
+
+
+def inverse(a: np.ndarray) -> np.ndarray:
+    _require_square(a)
+    try:
+        return _check_overflow(np.linalg.inv(a))
+    except np.linalg.LinAlgError:
+        raise ValueError("Matrix is singular")
+
+
+def transpose(a: np.ndarray) -> np.ndarray:
+    return a.T
+
+
+def trace(a: np.ndarray) -> Union[float, complex]:
+    _require_square(a)
+    return _check_overflow(_scalar(np.trace(a)))
+
+
+def eigenvalues(a: np.ndarray) -> np.ndarray:
+    _require_square(a)
+    try:
+        values = np.linalg.eigvals(a)
+    except np.linalg.LinAlgError:
+        raise ValueError("Eigenvalues did not converge")
+    if np.iscomplexobj(values) and not np.any(values.imag):
+        values = values.real
+    return _check_overflow(values.reshape(-1, 1))
+
+
+def multiply(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    if a.shape[1] != b.shape[0]:
+        raise ValueError(f"Cannot multiply {describe(a)} by {describe(b)}")
+    return _check_overflow(a @ b)
+
+
+def add(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    _require_same_shape(a, b)
+    return _check_overflow(a + b)
+
+
+def subtract(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    _require_same_shape(a, b)
+    return _check_overflow(a - b)
+
+
+def solve(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    _require_square(a)
+    if a.shape[0] != b.shape[0]:
+        raise ValueError(f"Cannot solve {describe(a)} with {describe(b)}")
+    try:
+        return _check_overflow(np.linalg.solve(a, b))
+    except np.linalg.LinAlgError:
+        raise ValueError("Matrix is singular")
+
+
+def _require_finite(matrix: np.ndarray) -> np.ndarray:
+    if not np.isfinite(matrix).all():
+        raise ValueError("Matrix entries must be finite")
+    return matrix
+
+
+def _check_overflow(result: MatrixValue) -> MatrixValue:
+    if not np.isfinite(result).all():
+        raise OverflowError("Number too large")
+    return result
+
+
+def _scalar(value) -> Union[float, complex]:
+    if np.iscomplexobj(value):
+        return complex(value)
+    return float(value)
+
+
+def _require_square(a: np.ndarray):
+    if a.ndim != 2 or a.shape[0] != a.shape[1]:
+        raise ValueError("Matrix must be square")
+
+
+def _require_same_shape(a: np.ndarray, b: np.ndarray):
+    if a.shape != b.shape:
+        raise ValueError(f"Shape mismatch: {describe(a)} and {describe(b)}")
+
+
+def _display_indices(size: int, limit: int) -> list:
+    if size <= limit:
+        return list(range(size))
+    return list(range(limit - 2)) + [None, size - 1]
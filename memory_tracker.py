@@ -0,0 +1,282 @@
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+import types
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+MEMORY_ENV = 'CALC_MEMORY_PROFILE'
+BUDGETS_ENV = 'CALC_MEMORY_BUDGETS'
+TRACE_FRAMES = 8
+SAMPLE_INTERVAL = 15.0
+SNAPSHOT_INTERVAL = 60.0
+
+DEFAULT_BUDGETS = {
+    'history': 1 << 20,
+    'caches': 16 << 20,
+    'widget_tree': 64 << 20,
+    'btns_dict': 4 << 20
+}
+
+_BUDGET = re.compile(r'^\s*(\w+)\s*=\s*(\d+(?:\.\d+)?)\s*([KMG]?B?)\s*$', re.IGNORECASE)
+_UNITS = {'': 1, 'B': 1, 'K': 1 << 10, 'KB': 1 << 10, 'M': 1 << 20, 'MB': 1 << 20, 'G': 1 << 30, 'GB': 1 << 30}
+_LEAF_TYPES = (str, bytes, bytearray, int, float, complex, bool, type(None))
+
+
+def parse_budgets(text: str) -> Dict[str, int]:
+    budgets = {}
+    for part in filter(None, (p.strip() for p in text.split(','))):
+        match = _BUDGET.match(part)
+        if match is None:
+            raise ValueError(f"Invalid memory budget: {part}")
+        name, amount, unit = match.groups()
+        budgets[name] = int(float(amount) * _UNITS[unit.upper()])
+    return budgets
+
+
+def format_bytes(size: Optional[float]) -> str:
+    if size is None:
+        return "-"
+    for unit in ('B', 'KB', 'MB'):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def deep_size(obj: Any, seen: Optional[Set[int]] = None) -> int:
+    if seen is None:
+        seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, _LEAF_TYPES):
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return total
+
+
+def callback_size(func: Callable, seen: Optional[Set[int]] = None) -> int:
+    if seen is None:
+        seen = set()
+    if id(func) in seen or not isinstance(func, types.FunctionType):
+        return 0
+    seen.add(id(func))
+    total = sys.getsizeof(func)
+    for cell in func.__closure__ or ():
+        if id(cell) in seen:
+            continue
+        seen.add(id(cell))
+        total += sys.getsizeof(cell)
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            continue
+        if isinstance(value, types.FunctionType):
+            total += callback_size(value, seen)
+        elif isinstance(value, _LEAF_TYPES + (tuple,)):
+            total += deep_size(value, seen)
+    if func.__defaults__:
+        total += deep_size(func.__defaults__, seen)
+    return total
+
+
+class Subsystem:
+    def __init__(self, name: str, measure: Optional[Callable[[], int]] = None,
+                 evict: Optional[Callable[[int], bool]] = None, detail: Optional[Callable[[], str]] = None):
+        self.name = name
+        self.measure = measure
+        self.evict = evict
+        self.detail = detail
+        self.files: Set[str] = set()
+        self.prefixes: List[str] = []
+        self.ranges: Dict[str, List[Tuple[int, int]]] = {}
+        self.owned: Optional[int] = None
+        self.traced = 0
+        self.stale = False
+        self.evictions = 0
+
+    def add_source(self, source: Any):
+        if isinstance(source, types.ModuleType) and hasattr(source, '__path__'):
+            self.prefixes.extend(os.path.join(directory, '') for directory in source.__path__)
+        elif isinstance(source, types.ModuleType):
+            self.files.add(source.__file__)
+        elif isinstance(source, type):
+            for member in vars(source).values():
+                if isinstance(member, types.FunctionType):
+                    self.add_code(member)
+        else:
+            self.add_code(getattr(source, '__wrapped__', source))
+
+    def add_code(self, func: Callable):
+        code = getattr(func, '__func__', func).__code__
+        lines = [line for code_object in _code_objects(code) for _, _, line in code_object.co_lines() if line]
+        self.ranges.setdefault(code.co_filename, []).append((min(lines), max(lines)))
+
+    def owns(self, filename: str, lineno: int) -> bool:
+        if filename in self.files or any(filename.startswith(prefix) for prefix in self.prefixes):
+            return True
+        return any(first <= lineno <= last for first, last in self.ranges.get(filename, ()))
+
+    def usage(self) -> int:
+        return self.traced if self.owned is None else self.owned
+
+
+def _code_objects(code: types.CodeType):
+    yield code
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _code_objects(const)
+
+
+def _owner(traceback: tracemalloc.Traceback, frame_owners: Dict[Tuple[str, int], Optional[str]],
+           subsystems: List[Subsystem]) -> Optional[str]:
+    for frame in traceback:
+        location = (frame.filename, frame.lineno)
+        if location not in frame_owners:
+            frame_owners[location] = next((s.name for s in subsystems if s.owns(*location)), None)
+        if frame_owners[location] is not None:
+            return frame_owners[location]
+    return None
+
+
+class MemoryTracker:
+    def __init__(self):
+        self.enabled = bool(os.environ.get(MEMORY_ENV))
+        self.interval = SAMPLE_INTERVAL
+        self.budgets: Dict[str, int] = dict(DEFAULT_BUDGETS)
+        self.budget_error: Optional[str] = None
+        try:
+            self.budgets.update(parse_budgets(os.environ.get(BUDGETS_ENV, '')))
+        except ValueError as e:
+            self.budget_error = str(e)
+        self.subsystems: Dict[str, Subsystem] = {}
+        self.lock = threading.Lock()
+        self.analyzing = False
+        self.samples = 0
+        self.traced_total = 0
+        self.traced_peak = 0
+        self.unattributed = 0
+        self.sampled_at: Optional[float] = None
+        self.snapshot_at: Optional[float] = None
+        self.analysis_time = 0.0
+        self.last_evicted: List[str] = []
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+
+    def register(self, name: str, **kwargs) -> Subsystem:
+        subsystem = Subsystem(name, **kwargs)
+        self.subsystems[name] = subsystem
+        return subsystem
+
+    def sample(self) -> List[str]:
+        for subsystem in self.subsystems.values():
+            if subsystem.measure is not None:
+                subsystem.owned = subsystem.measure()
+        evicted = self.enforce_budgets()
+        self.samples += 1
+        self.sampled_at = time.time()
+
+        if self.enabled and tracemalloc.is_tracing() and not self.analyzing and (
+                self.snapshot_at is None or self.sampled_at - self.snapshot_at >= SNAPSHOT_INTERVAL):
+            self.analyzing = True
+            self.snapshot_at = self.sampled_at
+            self.traced_total, self.traced_peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            threading.Thread(target=self._analyze, args=(snapshot,), daemon=True).start()
+        return evicted
+
+    def enforce_budgets(self) -> List[str]:
+        evicted = []
+        for name, subsystem in self.subsystems.items():
+            budget = self.budgets.get(name)
+            if budget is None or subsystem.evict is None or subsystem.stale or subsystem.usage() <= budget:
+                continue
+            if not subsystem.evict(budget):
+                continue
+            subsystem.evictions += 1
+            if subsystem.measure is not None:
+                subsystem.owned = subsystem.measure()
+            else:
+                subsystem.stale = True
+            evicted.append(name)
+        if evicted:
+            self.last_evicted = evicted
+        return evicted
+
+    def _analyze(self, snapshot: tracemalloc.Snapshot):
+        started = time.perf_counter()
+        subsystems = list(self.subsystems.values())
+        frame_owners: Dict[Tuple[str, int], Optional[str]] = {}
+        totals = {subsystem.name: 0 for subsystem in subsystems}
+        unattributed = 0
+        for statistic in snapshot.statistics('traceback'):
+            owner = _owner(statistic.traceback, frame_owners, subsystems)
+            if owner is None:
+                unattributed += statistic.size
+            else:
+                totals[owner] += statistic.size
+
+        with self.lock:
+            for subsystem in subsystems:
+                subsystem.traced = totals[subsystem.name]
+                subsystem.stale = False
+            self.unattributed = unattributed
+            self.analysis_time = time.perf_counter() - started
+            self.analyzing = False
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'enabled': self.enabled,
+            'samples': self.samples,
+            'traced_bytes': self.traced_total,
+            'traced_peak_bytes': self.traced_peak,
+            'unattributed_bytes': self.unattributed,
+            'subsystems': {
+                name: {
+                    'traced_bytes': s.traced,
+                    'owned_bytes': s.owned,
+                    'budget_bytes': self.budgets.get(name),
+                    'evictions': s.evictions
+                }
+                for name, s in self.subsystems.items()
+            }
+        }
+
+    def report(self) -> str:
+        if not self.enabled:
+            return f"Memory profiling is off. Start with {MEMORY_ENV}=1 to attribute allocations to subsystems."
+
+        lines = []
+        if self.budget_error:
+            lines.append(f"{self.budget_error} (using defaults)")
+        if self.snapshot_at is None:
+            lines.append("Memory: waiting for the first sample")
+            return "\n".join(lines)
+        age = time.time() - self.snapshot_at
+        lines.append(f"Memory: {format_bytes(self.traced_total)} traced, peak {format_bytes(self.traced_peak)}, "
+                     f"snapshot {age:.0f}s ago (analysis {self.analysis_time * 1000:.0f} ms)")
+        lines.append(f"{'subsystem':<13}{'traced':>10}{'owned':>10}{'budget':>10}{'evict':>6}")
+        for name, s in self.subsystems.items():
+            lines.append(f"{name:<13}{format_bytes(s.traced):>10}{format_bytes(s.owned):>10}"
+                         f"{format_bytes(self.budgets.get(name)):>10}{s.evictions:>6}")
+            if s.detail is not None:
+                lines.append(f"  {s.detail()}")
+        lines.append(f"{'other':<13}{format_bytes(self.unattributed):>10}")
+        if self.last_evicted:
+            lines.append(f"Last over budget: {', '.join(self.last_evicted)}")
+        return "\n".join(lines)
+
+
+tracker = MemoryTracker()
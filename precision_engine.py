@@ -0,0 +1,198 @@
+import ast
+import math
+import sys
+from decimal import Decimal, DivisionByZero, InvalidOperation, Overflow, localcontext
+from fractions import Fraction
+from functools import lru_cache
+from typing import NamedTuple, Optional, Union
+
+MAX_POWER_EXPONENT = 100000
+PRECISION_LEVELS = [None, 20, 34, 50, 100]
+
+Number = Union[int, float, Fraction, Decimal]
+
+
+class ExpressionInfo(NamedTuple):
+    code: object
+    rational_code: object
+    decimal_code: object
+    exact_code: Optional[object]
+
+
+class _Inexact(Exception):
+    pass
+
+
+class _LiteralWrapper(ast.NodeTransformer):
+    def __init__(self, source: str, wrapper: str):
+        self.source = source
+        self.wrapper = wrapper
+
+    def visit_Constant(self, node: ast.Constant):
+        text = ast.get_source_segment(self.source, node) or repr(node.value)
+        call = ast.Call(func=ast.Name(id=self.wrapper, ctx=ast.Load()),
+                        args=[ast.Constant(value=text)], keywords=[])
+        return ast.copy_location(call, node)
+
+
+class _CheckedArithmetic(ast.NodeTransformer):
+    NAMES = {ast.Add: '_add', ast.Sub: '_sub', ast.Mult: '_mul'}
+
+    def visit_BinOp(self, node: ast.BinOp):
+        self.generic_visit(node)
+        call = ast.Call(func=ast.Name(id=self.NAMES[type(node.op)], ctx=ast.Load()),
+                        args=[node.left, node.right], keywords=[])
+        return ast.copy_location(call, node)
+
+
+def _as_float(value: Union[int, float]) -> float:
+    result = float(value)
+    if result != value:
+        raise _Inexact
+    return result
+
+
+def _add(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
+    if isinstance(a, int) and isinstance(b, int):
+        return a + b
+    a, b = _as_float(a), _as_float(b)
+    total = a + b
+    b_virtual = total - a
+    if (a - (total - b_virtual)) + (b - b_virtual) != 0 or not math.isfinite(total):
+        raise _Inexact
+    return total
+
+
+def _sub(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
+    return _add(a, -b)
+
+
+def _odd_part(value: float) -> int:
+    numerator = abs(value.as_integer_ratio()[0])
+    return numerator >> ((numerator & -numerator).bit_length() - 1) if numerator else 0
+
+
+def _mul(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
+    if isinstance(a, int) and isinstance(b, int):
+        return a * b
+    a, b = _as_float(a), _as_float(b)
+    product = a * b
+    if (_odd_part(a) * _odd_part(b)).bit_length() > 53 or not math.isfinite(product) or (
+            product == 0 and a != 0 and b != 0) or (product != 0 and abs(product) < sys.float_info.min):
+        raise _Inexact
+    return product
+
+
+CHECKED_NAMESPACE = {'__builtins__': {}, '_add': _add, '_sub': _sub, '_mul': _mul}
+
+
+@lru_cache(maxsize=256)
+def analyze(expr: str) -> ExpressionInfo:
+    tree = ast.parse(expr, mode='eval')
+    float_exact = True
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant):
+            if not isinstance(node.value, (int, float)) or isinstance(node.value, bool):
+                raise ValueError("Invalid expression")
+            text = ast.get_source_segment(expr, node) or repr(node.value)
+            if isinstance(node.value, float) and Decimal(node.value) != Decimal(text):
+                float_exact = False
+        elif isinstance(node, ast.BinOp):
+            if isinstance(node.op, (ast.Div, ast.Pow)):
+                float_exact = False
+            if isinstance(node.op, ast.Pow) and isinstance(node.right, ast.Constant):
+                if abs(node.right.value) > MAX_POWER_EXPONENT:
+                    raise OverflowError("Number too large")
+        elif not isinstance(node, (ast.Expression, ast.UnaryOp, ast.operator, ast.unaryop)):
+            raise ValueError("Invalid expression")
+
+    rational_tree = _LiteralWrapper(expr, 'F').visit(ast.parse(expr, mode='eval'))
+    decimal_tree = _LiteralWrapper(expr, 'D').visit(ast.parse(expr, mode='eval'))
+    exact_code = None
+    if float_exact:
+        checked_tree = _CheckedArithmetic().visit(ast.parse(expr, mode='eval'))
+        exact_code = compile(ast.fix_missing_locations(checked_tree), '<expr>', 'eval')
+    return ExpressionInfo(
+        compile(tree, '<expr>', 'eval'),
+        compile(ast.fix_missing_locations(rational_tree), '<expr>', 'eval'),
+        compile(ast.fix_missing_locations(decimal_tree), '<expr>', 'eval'),
+        exact_code
+    )
+
+
+def evaluate_expression(expr: str, digits: Optional[int] = None) -> Number:
+    if digits is None:
+        return eval(expr)
+
+    info = analyze(expr)
+    if info.exact_code is not None:
+        try:
+            return eval(info.exact_code, CHECKED_NAMESPACE)
+        except (_Inexact, OverflowError):
+            return _evaluate_promoted(info, digits)
+
+    try:
+        result = eval(info.code, {'__builtins__': {}})
+    except OverflowError:
+        result = None
+
+    if isinstance(result, int):
+        return result
+    if result is not None and not isinstance(result, (int, float)):
+        raise ValueError("Invalid result type")
+    return _evaluate_promoted(info, digits)
+
+
+def _evaluate_promoted(info: ExpressionInfo, digits: int) -> Number:
+    try:
+        result = eval(info.rational_code, {'__builtins__': {}, 'F': Fraction})
+        if isinstance(result, Fraction):
+            return result
+    except OverflowError:
+        pass
+
+    with localcontext() as ctx:
+        ctx.prec = digits + 5
+        ctx.traps[Overflow] = True
+        ctx.traps[DivisionByZero] = True
+        ctx.traps[InvalidOperation] = True
+        try:
+            result = eval(info.decimal_code, {'__builtins__': {}, 'D': ctx.create_decimal})
+        except DivisionByZero:
+            raise ZeroDivisionError("division by zero")
+        except Overflow:
+            raise OverflowError("Number too large")
+        except InvalidOperation:
+            raise ValueError("Invalid result type")
+    if not isinstance(result, Decimal):
+        raise ValueError("Invalid result type")
+    return result
+
+
+def to_decimal(value: Number, digits: int) -> Decimal:
+    with localcontext() as ctx:
+        ctx.prec = digits
+        if isinstance(value, Fraction):
+            return Decimal(value.numerator) / Decimal(value.denominator)
+        return ctx.create_decimal(value)
+
+
+def format_precise(value: Number, digits: int) -> str:
+    if isinstance(value, int) and value.bit_length() < digits * 3:
+        return str(value)
+
+    result = to_decimal(value, digits)
+    if result == 0:
+        return "0"
+    if not result.is_finite():
+        raise OverflowError("Number too large")
+
+    if -7 <= result.adjusted() < digits:
+        text = format(result, 'f')
+        if '.' in text:
+            text = text.rstrip('0').rstrip('.')
+        return text
+    mantissa, exponent = f"{result.normalize():E}".split('E')
+    return f"{mantissa}e{int(exponent)}"
+
@@ -0,0 +1,204 @@
+import ast
+import decimal
+import re
+from typing import Dict, List, Optional
+
+BASES = {'HEX': 16, 'DEC': 10, 'OCT': 8, 'BIN': 2}
+WORD_SIZES: List[Optional[int]] = [8, 16, 32, 64, None]
+DIGITS = '0123456789ABCDEF'
+
+MAX_BITS = 1 << 22
+MAX_INPUT_DIGITS = 1000
+MAX_DISPLAY_LENGTH = 40
+SMALL_BITS = 4096
+SMALL_DIGITS = 1200
+
+_FORMATS = {16: 'X', 8: 'o', 2: 'b'}
+_TOKEN = re.compile(r'\s*(?:([0-9A-Fa-f]+)|(<<|>>|[-+*/%&|^~()]))')
+_DIGIT_PATTERNS = {base: re.compile(f"[{DIGITS[:base]}{DIGITS[10:base].lower()}]+") for base in BASES.values()}
+_DECIMAL_CONTEXT = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+
+_BINARY_OPS = {
+    ast.Add: lambda a, b: a + b,
+    ast.Sub: lambda a, b: a - b,
+    ast.Mult: lambda a, b: _multiply(a, b),
+    ast.Div: lambda a, b: _divide(a, b),
+    ast.Mod: lambda a, b: a - b * _divide(a, b),
+    ast.BitAnd: lambda a, b: a & b,
+    ast.BitOr: lambda a, b: a | b,
+    ast.BitXor: lambda a, b: a ^ b,
+    ast.LShift: lambda a, b: _shift_left(a, b),
+    ast.RShift: lambda a, b: a >> _shift_amount(b)
+}
+_UNARY_OPS = {
+    ast.USub: lambda a: -a,
+    ast.UAdd: lambda a: a,
+    ast.Invert: lambda a: ~a
+}
+
+
+def wrap(value: int, word_size: Optional[int]) -> int:
+    if word_size is None:
+        if value.bit_length() > MAX_BITS:
+            raise OverflowError("Number too large")
+        return value
+    value &= (1 << word_size) - 1
+    if value >> (word_size - 1):
+        value -= 1 << word_size
+    return value
+
+
+def parse_int(text: str, base: int) -> int:
+    negative = text.startswith('-')
+    digits = text[1:] if negative else text
+    if _DIGIT_PATTERNS[base].fullmatch(digits) is None:
+        raise ValueError(f"Invalid digit for base {base}")
+    value = _parse_decimal(digits) if base == 10 else int(digits, base)
+    return -value if negative else value
+
+
+def format_int(value: int, base: int, word_size: Optional[int] = None) -> str:
+    if base != 10 and word_size is not None and value < 0:
+        value &= (1 << word_size) - 1
+    if value < 0:
+        return '-' + format_int(-value, base)
+    if base == 10:
+        return _to_decimal_string(value)
+    return format(value, _FORMATS[base])
+
+
+def convert(text: str, from_base: int, to_base: int, word_size: Optional[int]) -> str:
+    return format_int(wrap(parse_int(text, from_base), word_size), to_base, word_size)
+
+
+def convert_expression(expr: str, from_base: int, to_base: int, word_size: Optional[int]) -> str:
+    parts = []
+    sign = ''
+    operand_expected = True
+    for number, op in _tokens(expr):
+        if number is not None:
+            parts.append(convert(sign + number, from_base, to_base, word_size))
+            sign = ''
+            operand_expected = False
+        elif op == '-' and operand_expected and not sign:
+            sign = op
+        else:
+            parts.append(sign + op)
+            sign = ''
+            operand_expected = op != ')'
+    parts.append(sign)
+    return "".join(parts)
+
+
+def evaluate(expr: str, base: int, word_size: Optional[int]) -> int:
+    names: Dict[str, int] = {}
+    parts = []
+    for number, op in _tokens(expr):
+        if number is None:
+            parts.append(op)
+        else:
+            name = f"_{len(names)}"
+            names[name] = wrap(parse_int(number, base), word_size)
+            parts.append(name)
+
+    try:
+        tree = ast.parse("".join(parts), mode='eval')
+    except SyntaxError:
+        raise ValueError("Invalid expression")
+    return _evaluate_node(tree.body, names, word_size)
+
+
+def valid_digit(digit: str, base: int) -> bool:
+    return len(digit) == 1 and 0 <= DIGITS.find(digit.upper()) < base
+
+
+def max_input_digits(base: int, word_size: Optional[int]) -> int:
+    if word_size is None:
+        return MAX_INPUT_DIGITS
+    return len(format_int((1 << word_size) - 1, base))
+
+
+def abbreviate(text: str, limit: int = MAX_DISPLAY_LENGTH) -> str:
+    if len(text) <= limit:
+        return text
+    keep = (limit - 1) // 2
+    return f"{text[:keep]}…{text[-keep:]}"
+
+
+def _tokens(expr: str):
+    position = 0
+    expr = expr.rstrip()
+    while position < len(expr):
+        match = _TOKEN.match(expr, position)
+        if match is None:
+            raise ValueError("Invalid expression")
+        yield match.group(1), match.group(2)
+        position = match.end()
+
+
+def _evaluate_node(node: ast.AST, names: Dict[str, int], word_size: Optional[int]) -> int:
+    if isinstance(node, ast.Name) and node.id in names:
+        return names[node.id]
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+        left = _evaluate_node(node.left, names, word_size)
+        right = _evaluate_node(node.right, names, word_size)
+        return wrap(_BINARY_OPS[type(node.op)](left, right), word_size)
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        return wrap(_UNARY_OPS[type(node.op)](_evaluate_node(node.operand, names, word_size)), word_size)
+    raise ValueError("Invalid expression")
+
+
+def _divide(a: int, b: int) -> int:
+    if b == 0:
+        raise ZeroDivisionError("Cannot divide by zero")
+    quotient = abs(a) // abs(b)
+    return quotient if (a < 0) == (b < 0) else -quotient
+
+
+def _multiply(a: int, b: int) -> int:
+    if a.bit_length() + b.bit_length() > MAX_BITS + 1:
+        raise OverflowError("Number too large")
+    return a * b
+
+
+def _shift_amount(amount: int) -> int:
+    if amount < 0:
+        raise ValueError("Negative shift count")
+    return amount
+
+
+def _shift_left(value: int, amount: int) -> int:
+    if value.bit_length() + _shift_amount(amount) > MAX_BITS + 1:
+        raise OverflowError("Number too large")
+    return value << amount
+
+
+def _parse_decimal(digits: str, powers: Optional[Dict[int, int]] = None) -> int:
+    if len(digits) <= SMALL_DIGITS:
+        return int(digits)
+    if powers is None:
+        powers = {}
+    low_digits = 1 << ((len(digits) - 1).bit_length() - 1)
+    if low_digits not in powers:
+        powers[low_digits] = 10 ** low_digits
+    high = _parse_decimal(digits[:-low_digits], powers)
+    return high * powers[low_digits] + _parse_decimal(digits[-low_digits:], powers)
+
+
+def _to_decimal_string(value: int) -> str:
+    if value.bit_length() <= SMALL_BITS:
+        return str(value)
+    with decimal.localcontext(_DECIMAL_CONTEXT):
+        return str(_to_decimal(value, {}))
+
+
+def _to_decimal(value: int, powers: Dict[int, decimal.Decimal]) -> decimal.Decimal:
+    bits = value.bit_length()
+    if bits <= SMALL_BITS:
+        return decimal.Decimal(value)
+    half = bits >> 1
+    high = value >> half
+    low = value - (high << half)
+    if half not in powers:
+        powers[half] = decimal.Decimal(2) ** half
+    return _to_decimal(high, powers) * powers[half] + _to_decimal(low, powers)
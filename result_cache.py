@@ -0,0 +1,259 @@
+import json
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+CACHE_ENV = 'CALC_RESULT_CACHE'
+KEY_VERSION = 2
+DEFAULT_MAX_ENTRIES = 20000
+WRITE_BATCH = 512
+CONNECT_TIMEOUT = 5.0
+WRITE_RETRIES = 3
+RETRY_DELAY = 0.05
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS results ("
+    "key TEXT PRIMARY KEY, value TEXT NOT NULL, used INTEGER NOT NULL, hits INTEGER NOT NULL DEFAULT 0)",
+    "CREATE INDEX IF NOT EXISTS results_used ON results (used)"
+)
+
+
+def make_key(kind: str, text: str, angle_mode: Optional[str], precision: Optional[int], complex_mode: bool) -> str:
+    return f"{kind}|v{KEY_VERSION}|{angle_mode or ''}|{precision or ''}|{int(complex_mode)}|{''.join(text.split())}"
+
+
+class ResultCache:
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries: 'OrderedDict[str, Any]' = OrderedDict()
+        self.lock = threading.Lock()
+        self.loaded = threading.Event()
+        self.persistent = True
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.pending: queue.Queue = queue.Queue()
+        self.writer = threading.Thread(target=self._run, daemon=True)
+        self.writer.start()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+        self.pending.put(('touch', key, time.time_ns()))
+        return value
+
+    def put(self, key: str, value: Any):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            self.stores += 1
+            self._evict()
+        self.pending.put(('put', key, json.dumps(value), time.time_ns()))
+
+    def shrink(self, max_entries: int) -> int:
+        with self.lock:
+            before = len(self.entries)
+            self.max_entries = max_entries
+            self._evict()
+            evicted = before - len(self.entries)
+        if evicted:
+            self.pending.put(('trim', max_entries))
+        return evicted
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+        self.pending.put(('clear',))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        done = threading.Event()
+        self.pending.put(('flush', done))
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 2.0):
+        if self.writer.is_alive():
+            self.pending.put(None)
+            self.writer.join(timeout)
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'path': self.path,
+            'persistent': self.persistent,
+            'loaded': self.loaded.is_set(),
+            'entries': len(self.entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate(),
+            'stores': self.stores,
+            'evictions': self.evictions
+        }
+
+    def report(self) -> str:
+        lookups = self.hits + self.misses
+        state = "" if self.persistent else " (memory only)"
+        if not self.loaded.is_set():
+            state = " (loading)"
+        return (f"Result cache{state}: {len(self.entries)}/{self.max_entries} entries, "
+                f"{self.hits}/{lookups} hits ({self.hit_rate():.0%}), "
+                f"{self.stores} stored, {self.evictions} evicted")
+
+    def _evict(self):
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def _run(self):
+        connection = self._open()
+        while True:
+            operations = [self.pending.get()]
+            while len(operations) < WRITE_BATCH:
+                try:
+                    operations.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+
+            closing = None in operations
+            if connection is not None:
+                connection = self._write(connection, [op for op in operations if op is not None])
+            for op in operations:
+                if op is not None and op[0] == 'flush':
+                    op[1].set()
+            if closing:
+                if connection is not None:
+                    connection.close()
+                return
+
+    def _connect(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=CONNECT_TIMEOUT)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        for statement in SCHEMA:
+            connection.execute(statement)
+        return connection
+
+    def _reconnect(self) -> Optional[sqlite3.Connection]:
+        try:
+            return self._connect()
+        except (OSError, sqlite3.Error):
+            self.persistent = False
+            return None
+
+    def _open(self) -> Optional[sqlite3.Connection]:
+        try:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM results WHERE key NOT LIKE ?", (f"%|v{KEY_VERSION}|%",))
+            rows = connection.execute(
+                "SELECT key, value FROM (SELECT key, value, used FROM results ORDER BY used DESC LIMIT ?) "
+                "ORDER BY used", (self.max_entries,)
+            ).fetchall()
+        except (OSError, sqlite3.Error):
+            self.persistent = False
+            self.loaded.set()
+            return None
+
+        stored: 'OrderedDict[str, Any]' = OrderedDict()
+        for key, value in rows:
+            try:
+                stored[key] = json.loads(value)
+            except ValueError:
+                continue
+        with self.lock:
+            for key, value in self.entries.items():
+                stored[key] = value
+                stored.move_to_end(key)
+            self.entries = stored
+            self._evict()
+        self.loaded.set()
+        return connection
+
+    def _write(self, connection: sqlite3.Connection, operations: List[Tuple]) -> Optional[sqlite3.Connection]:
+        for attempt in range(WRITE_RETRIES):
+            try:
+                self._apply(connection, operations)
+                return connection
+            except sqlite3.OperationalError:
+                time.sleep(RETRY_DELAY * (attempt + 1))
+            except sqlite3.Error:
+                break
+        connection.close()
+        return self._reconnect()
+
+    def _apply(self, connection: sqlite3.Connection, operations: List[Tuple]):
+        stored = False
+        with connection:
+            for op in operations:
+                if op[0] == 'put':
+                    connection.execute(
+                        "INSERT INTO results (key, value, used) VALUES (?, ?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET value = excluded.value, used = excluded.used",
+                        op[1:]
+                    )
+                    stored = True
+                elif op[0] == 'touch':
+                    connection.execute("UPDATE results SET used = ?, hits = hits + 1 WHERE key = ?",
+                                       (op[2], op[1]))
+                elif op[0] == 'trim':
+                    self._trim(connection, op[1])
+                elif op[0] == 'clear':
+                    connection.execute("DELETE FROM results")
+            if stored:
+                self._trim(connection, self.max_entries)
+
+    @staticmethod
+    def _trim(connection: sqlite3.Connection, max_entries: int):
+        if max_entries <= 0:
+            connection.execute("DELETE FROM results")
+            return
+        connection.execute(
+            "DELETE FROM results WHERE used < (SELECT used FROM results ORDER BY used DESC LIMIT 1 OFFSET ?)",
+            (max_entries - 1,)
+        )
+
+
+def summarize(path: str, top: int = 10) -> str:
+    connection = sqlite3.connect(path, timeout=CONNECT_TIMEOUT)
+    try:
+        count, hits = connection.execute("SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM results").fetchone()
+        lines = [f"{count} cached results, {hits} hits since stored"]
+        by_kind: Dict[str, List[int]] = {}
+        for key, entry_hits in connection.execute("SELECT key, hits FROM results"):
+            totals = by_kind.setdefault(key.split('|', 1)[0], [0, 0])
+            totals[0] += 1
+            totals[1] += entry_hits
+        for kind, (kind_count, kind_hits) in sorted(by_kind.items()):
+            lines.append(f"  {kind:<8}{kind_count:>8} entries{kind_hits:>10} hits")
+        lines.append("")
+        lines.append("Most reused:")
+        for key, entry_hits in connection.execute(
+                "SELECT key, hits FROM results WHERE hits > 0 ORDER BY hits DESC LIMIT ?", (top,)):
+            lines.append(f"{entry_hits:>8}  {key}")
+        return "\n".join(lines)
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("usage: python result_cache.py CACHE_PATH")
+        sys.exit(2)
+    print(summarize(sys.argv[1]))
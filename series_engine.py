@@ -0,0 +1,482 @@
+import ast
+import math
+from fractions import Fraction
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+INDEX = 'k'
+CHUNK_SIZE = 1 << 20
+MAX_TERMS = 10 ** 10
+MAX_POLYNOMIAL_DEGREE = 24
+MAX_COEFFICIENT_BITS = 4096
+DIRECT_PRODUCT_TERMS = 1000
+
+ALTERNATING_TERMS = 64
+ALTERNATING_DECAY_INDEX = 1 << 20
+ALTERNATING_DECAY = 1e-2
+TAIL_START = 256
+TAIL_DOUBLINGS = 10
+TAIL_TOLERANCE = 1e-9
+MAX_TAIL_RATIO = 0.97
+
+ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant, ast.Name, ast.Load, ast.Call,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd
+)
+
+Polynomial = List[Fraction]
+ArrayFunction = Callable[[np.ndarray], np.ndarray]
+
+
+class SeriesResult(NamedTuple):
+    value: float
+    method: str
+    terms: Optional[int]
+
+
+class NeumaierSum:
+    def __init__(self):
+        self.total = 0.0
+        self.compensation = 0.0
+
+    def add(self, value: float):
+        total = self.total + value
+        if abs(self.total) >= abs(value):
+            self.compensation += (self.total - total) + value
+        else:
+            self.compensation += (value - total) + self.total
+        self.total = total
+
+    @property
+    def value(self) -> float:
+        return self.total + self.compensation
+
+
+def _functions(degrees: bool) -> Dict[str, object]:
+    scale = math.pi / 180 if degrees else 1.0
+    return {
+        'pi': math.pi,
+        'e': math.e,
+        'sqrt': np.sqrt,
+        'ln': np.log,
+        'log': np.log10,
+        'exp': np.exp,
+        'abs': np.abs,
+        'sin': lambda x: np.sin(x * scale),
+        'cos': lambda x: np.cos(x * scale),
+        'tan': lambda x: np.tan(x * scale),
+        'asin': lambda x: np.arcsin(x) / scale,
+        'acos': lambda x: np.arccos(x) / scale,
+        'atan': lambda x: np.arctan(x) / scale
+    }
+
+
+class Series:
+    def __init__(self, expr: str, degrees: bool = False):
+        self.source = expr.strip()
+        if not self.source:
+            raise ValueError("Enter a term f(k)")
+        try:
+            tree = ast.parse(self.source.replace('^', '**').replace('π', 'pi'), mode='eval')
+        except SyntaxError:
+            raise ValueError("Invalid term")
+
+        namespace = _functions(degrees)
+        for node in ast.walk(tree):
+            if not isinstance(node, ALLOWED_NODES):
+                raise ValueError("Invalid term")
+            if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+                raise ValueError("Invalid term")
+            if isinstance(node, ast.Name) and node.id != INDEX and node.id not in namespace:
+                raise ValueError(f"Unknown name: {node.id}")
+            if isinstance(node, ast.Call) and (not isinstance(node.func, ast.Name) or node.keywords
+                                               or len(node.args) != 1 or node.func.id not in namespace
+                                               or not callable(namespace[node.func.id])):
+                raise ValueError("Invalid term")
+
+        self.tree = tree
+        self.namespace = namespace
+        self.code = compile(_FloatConstants().visit(ast.parse(ast.unparse(tree), mode='eval')), '<series>', 'eval')
+        self.polynomial = _polynomial(tree.body)
+        self.geometric = _geometric(tree.body) if self.polynomial is None else None
+
+    def terms(self, k: np.ndarray) -> np.ndarray:
+        try:
+            with np.errstate(all='ignore'):
+                values = eval(self.code, {'__builtins__': {}}, dict(self.namespace, k=k))
+        except OverflowError:
+            raise OverflowError("Number too large")
+        except ZeroDivisionError:
+            raise ValueError("Term undefined")
+        values = np.broadcast_to(np.asarray(values, dtype=np.float64), k.shape)
+        if not np.isfinite(values).all():
+            bad = int(k[~np.isfinite(values)][0])
+            raise ValueError(f"Term undefined at k = {bad}")
+        return values
+
+
+class _FloatConstants(ast.NodeTransformer):
+    def visit_Constant(self, node: ast.Constant):
+        return ast.copy_location(ast.Constant(value=float(node.value)), node)
+
+
+def _polynomial(node: ast.AST) -> Optional[Polynomial]:
+    if isinstance(node, ast.Constant):
+        return [Fraction(node.value)]
+    if isinstance(node, ast.Name):
+        if node.id == INDEX:
+            return [Fraction(0), Fraction(1)]
+        if node.id in ('pi', 'e'):
+            return [Fraction(getattr(math, node.id))]
+        return None
+    if isinstance(node, ast.UnaryOp):
+        operand = _polynomial(node.operand)
+        if operand is None:
+            return None
+        return [-c for c in operand] if isinstance(node.op, ast.USub) else operand
+    if not isinstance(node, ast.BinOp):
+        return None
+
+    left = _polynomial(node.left)
+    right = _polynomial(node.right)
+    if left is None or right is None:
+        return None
+    if isinstance(node.op, (ast.Add, ast.Sub)):
+        sign = 1 if isinstance(node.op, ast.Add) else -1
+        size = max(len(left), len(right))
+        left = left + [Fraction(0)] * (size - len(left))
+        right = right + [Fraction(0)] * (size - len(right))
+        return _trim([a + sign * b for a, b in zip(left, right)])
+    if isinstance(node.op, ast.Mult):
+        return _multiply(left, right)
+    if isinstance(node.op, ast.Div):
+        if len(right) != 1 or right[0] == 0:
+            return None
+        return [c / right[0] for c in left]
+    if isinstance(node.op, ast.Pow):
+        if len(right) != 1 or right[0].denominator != 1:
+            return None
+        power = int(right[0])
+        if len(left) == 1:
+            return _constant_power(left[0], power)
+        if power < 0 or (len(left) - 1) * power > MAX_POLYNOMIAL_DEGREE:
+            return None
+        result = [Fraction(1)]
+        for _ in range(power):
+            result = _multiply(result, left)
+        return result
+    return None
+
+
+def _constant_power(base: Fraction, power: int) -> Optional[Polynomial]:
+    if base == 0 and power < 0:
+        return None
+    bits = max(base.numerator.bit_length(), base.denominator.bit_length())
+    if bits * abs(power) > MAX_COEFFICIENT_BITS:
+        return None
+    return [base ** power]
+
+
+def _multiply(a: Polynomial, b: Polynomial) -> Optional[Polynomial]:
+    if len(a) + len(b) - 2 > MAX_POLYNOMIAL_DEGREE:
+        return None
+    result = [Fraction(0)] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            result[i + j] += x * y
+    return _trim(result)
+
+
+def _trim(poly: Polynomial) -> Polynomial:
+    while len(poly) > 1 and poly[-1] == 0:
+        poly = poly[:-1]
+    return poly
+
+
+def _geometric(node: ast.AST) -> Optional[Tuple[float, float]]:
+    if isinstance(node, ast.UnaryOp):
+        inner = _geometric(node.operand)
+        if inner is None:
+            return None
+        return (-inner[0], inner[1]) if isinstance(node.op, ast.USub) else inner
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+        base = _polynomial(node.left)
+        exponent = _polynomial(node.right)
+        if base is None or exponent is None or len(base) != 1 or len(exponent) > 2:
+            return None
+        if base[0] < 0 and any(c.denominator != 1 for c in exponent):
+            return None
+        try:
+            base_value = float(base[0])
+            if len(exponent) == 1:
+                return base_value ** float(exponent[0]), 1.0
+            return base_value ** float(exponent[0]), base_value ** float(exponent[1])
+        except (OverflowError, ZeroDivisionError):
+            return None
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Mult, ast.Div)):
+        left = _geometric(node.left)
+        right = _geometric(node.right)
+        if left is None or right is None:
+            return None
+        if isinstance(node.op, ast.Mult):
+            return left[0] * right[0], left[1] * right[1]
+        if right[0] == 0 or right[1] == 0:
+            return None
+        return left[0] / right[0], left[1] / right[1]
+
+    poly = _polynomial(node)
+    if poly is None or len(poly) != 1:
+        return None
+    try:
+        return float(poly[0]), 1.0
+    except OverflowError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _bernoulli(n: int) -> Fraction:
+    row = [Fraction(0)] * (n + 1)
+    for m in range(n + 1):
+        row[m] = Fraction(1, m + 1)
+        for j in range(m, 0, -1):
+            row[j - 1] = j * (row[j - 1] - row[j])
+    return row[0]
+
+
+def _power_sum(p: int, n: int) -> Fraction:
+    total = Fraction(0)
+    for j in range(p + 1):
+        total += math.comb(p + 1, j) * _bernoulli(j) * Fraction(n) ** (p + 1 - j)
+    return total / (p + 1)
+
+
+def _polynomial_sum(poly: Polynomial, start: int, stop: int) -> float:
+    total = Fraction(0)
+    for power, coefficient in enumerate(poly):
+        if coefficient:
+            total += coefficient * (_power_sum(power, stop) - _power_sum(power, start - 1))
+    try:
+        return float(total)
+    except OverflowError:
+        raise OverflowError("Number too large")
+
+
+def _geometric_sum(coefficient: float, ratio: float, start: int, stop: Optional[int]) -> float:
+    try:
+        first = coefficient * ratio ** start
+        if stop is None:
+            if coefficient != 0 and abs(ratio) >= 1:
+                raise ValueError("Series does not converge")
+            return first / (1 - ratio)
+        count = stop - start + 1
+        if ratio == 1:
+            return first * count
+        if abs(ratio - 1) < 0.5:
+            return first * -math.expm1(count * math.log1p(ratio - 1)) / (1 - ratio)
+        return first * (1 - ratio ** count) / (1 - ratio)
+    except OverflowError:
+        raise OverflowError("Number too large")
+    except ZeroDivisionError:
+        raise ValueError(f"Term undefined at k = {start}")
+
+
+def _chunked_sum(terms: ArrayFunction, start: int, stop: int) -> float:
+    total = NeumaierSum()
+    for chunk_start in range(start, stop + 1, CHUNK_SIZE):
+        chunk_stop = min(chunk_start + CHUNK_SIZE, stop + 1)
+        total.add(float(np.sum(terms(np.arange(chunk_start, chunk_stop, dtype=np.float64)))))
+    return total.value
+
+
+def _partial_sums(terms: ArrayFunction, start: int) -> Tuple[np.ndarray, float, float]:
+    sums = []
+    total = NeumaierSum()
+    position = start
+    count = TAIL_START
+    last_term = 0.0
+    peak = 0.0
+    for _ in range(TAIL_DOUBLINGS + 1):
+        while position < start + count:
+            chunk_stop = min(position + CHUNK_SIZE, start + count)
+            values = terms(np.arange(position, chunk_stop, dtype=np.float64))
+            total.add(float(np.sum(values)))
+            last_term = float(values[-1])
+            peak = max(peak, float(np.abs(values).max()))
+            position = chunk_stop
+        sums.append(total.value)
+        count *= 2
+    return np.array(sums), last_term, peak
+
+
+def _aitken(sequence: np.ndarray) -> np.ndarray:
+    first = np.diff(sequence)
+    second = np.diff(first)
+    with np.errstate(all='ignore'):
+        accelerated = sequence[2:] - first[1:] ** 2 / second
+    return np.where(np.isfinite(accelerated), accelerated, sequence[2:])
+
+
+def _alternating_sum(terms: ArrayFunction, start: int) -> float:
+    values = terms(np.arange(start, start + ALTERNATING_TERMS, dtype=np.float64))
+    magnitudes = np.abs(values)
+    n = ALTERNATING_TERMS
+    d = (3 + math.sqrt(8)) ** n
+    d = (d + 1 / d) / 2
+    b = -1.0
+    c = -d
+    total = NeumaierSum()
+    for k in range(n):
+        c = b - c
+        total.add(c * magnitudes[k])
+        b = (k + n) * (k - n) * b / ((k + 0.5) * (k + 1))
+    return math.copysign(total.value / d, values[0])
+
+
+def _is_alternating(terms: ArrayFunction, start: int) -> bool:
+    values = terms(np.arange(start, start + ALTERNATING_TERMS, dtype=np.float64))
+    magnitudes = np.abs(values)
+    if not (np.all(values[:-1] * values[1:] < 0) and np.all(np.diff(magnitudes) <= 0)):
+        return False
+    far = terms(np.array([start + ALTERNATING_DECAY_INDEX], dtype=np.float64))
+    if abs(float(far[0])) > ALTERNATING_DECAY * magnitudes[0]:
+        raise ValueError("Series does not converge")
+    return True
+
+
+def _infinite_sum(terms: ArrayFunction, start: int) -> SeriesResult:
+    if _is_alternating(terms, start):
+        return SeriesResult(_alternating_sum(terms, start), "alternating acceleration", ALTERNATING_TERMS)
+
+    sums, last_term, peak = _partial_sums(terms, start)
+    if abs(last_term) > ALTERNATING_DECAY * peak:
+        raise ValueError("Series does not converge")
+    count = TAIL_START << TAIL_DOUBLINGS
+    scale = max(1.0, abs(sums[-1]))
+    differences = np.diff(sums)
+    if abs(differences[-1]) <= 1e-15 * scale and abs(last_term) <= 1e-15 * scale:
+        return SeriesResult(float(sums[-1]), "direct", count)
+
+    ratios = differences[-3:] / differences[-4:-1]
+    if not np.all((ratios > 0) & (ratios < MAX_TAIL_RATIO)):
+        raise ValueError("Series does not converge")
+
+    accelerated = sums
+    while len(accelerated) >= 5:
+        accelerated = _aitken(accelerated)
+    error = abs(accelerated[-1] - accelerated[-2])
+    if not error <= TAIL_TOLERANCE * max(1.0, abs(accelerated[-1])):
+        raise ValueError("Series converges too slowly")
+    return SeriesResult(float(accelerated[-1]), "tail acceleration", count)
+
+
+def _check_range(start: int, stop: Optional[int]):
+    if stop is not None and stop < start:
+        raise ValueError("Upper limit is below lower limit")
+
+
+def summation(expr: str, start: int, stop: Optional[int], degrees: bool = False) -> SeriesResult:
+    _check_range(start, stop)
+    series = Series(expr, degrees)
+    terms = None if stop is None else stop - start + 1
+
+    if series.polynomial is not None:
+        if stop is None:
+            if series.polynomial != [0]:
+                raise ValueError("Series does not converge")
+            return SeriesResult(0.0, "closed form", None)
+        method = "arithmetic series" if len(series.polynomial) <= 2 else "closed form"
+        return SeriesResult(_polynomial_sum(series.polynomial, start, stop), method, terms)
+
+    if series.geometric is not None:
+        coefficient, ratio = series.geometric
+        return SeriesResult(_geometric_sum(coefficient, ratio, start, stop), "geometric series", terms)
+
+    if stop is None:
+        return _infinite_sum(series.terms, start)
+    if terms > MAX_TERMS:
+        raise ValueError("Too many terms")
+    return SeriesResult(_chunked_sum(series.terms, start, stop), "compensated sum", terms)
+
+
+def product(expr: str, start: int, stop: Optional[int], degrees: bool = False) -> SeriesResult:
+    _check_range(start, stop)
+    series = Series(expr, degrees)
+    terms = None if stop is None else stop - start + 1
+
+    if series.geometric is not None or (series.polynomial is not None and len(series.polynomial) == 1):
+        coefficient, ratio = series.geometric or (float(series.polynomial[0]), 1.0)
+        if stop is None:
+            if coefficient == 1 and ratio == 1:
+                return SeriesResult(1.0, "closed form", None)
+            if coefficient == 0:
+                return SeriesResult(0.0, "closed form", None)
+            raise ValueError("Product does not converge")
+        exponent = (start + stop) * terms // 2
+        return SeriesResult(_power(coefficient, terms) * _power(ratio, exponent), "geometric product", terms)
+
+    if stop is None:
+        logs = _infinite_sum(lambda k: _log_terms(series, k), start)
+        return SeriesResult(_exp(logs.value), logs.method, logs.terms)
+
+    if terms > MAX_TERMS:
+        raise ValueError("Too many terms")
+    if terms <= DIRECT_PRODUCT_TERMS:
+        values = series.terms(np.arange(start, stop + 1, dtype=np.float64))
+        result = math.prod(values.tolist())
+        if not math.isfinite(result):
+            raise OverflowError("Number too large")
+        return SeriesResult(result, "direct", terms)
+
+    negatives = 0
+    logs = NeumaierSum()
+    for chunk_start in range(start, stop + 1, CHUNK_SIZE):
+        chunk_stop = min(chunk_start + CHUNK_SIZE, stop + 1)
+        values = series.terms(np.arange(chunk_start, chunk_stop, dtype=np.float64))
+        if not values.all():
+            return SeriesResult(0.0, "direct", terms)
+        negatives += int(np.count_nonzero(values < 0))
+        logs.add(float(np.sum(np.log(np.abs(values)))))
+    result = _exp(logs.value)
+    return SeriesResult(-result if negatives & 1 else result, "log sum", terms)
+
+
+def _log_terms(series: Series, k: np.ndarray) -> np.ndarray:
+    values = series.terms(k)
+    if np.any(values <= 0):
+        raise ValueError("Product does not converge")
+    return np.log(values)
+
+
+def _power(base: float, exponent: float) -> float:
+    try:
+        result = base ** exponent
+    except OverflowError:
+        raise OverflowError("Number too large")
+    if isinstance(result, complex) or not math.isfinite(result):
+        raise OverflowError("Number too large")
+    return result
+
+
+def _exp(value: float) -> float:
+    try:
+        return math.exp(value)
+    except OverflowError:
+        raise OverflowError("Number too large")
+
+
+OPERATORS: Dict[str, Callable[..., SeriesResult]] = {
+    'Σ': summation,
+    'Π': product
+}
+
+
+def parse_limit(text: str) -> Optional[int]:
+    text = text.strip().lower()
+    if text in ('inf', '∞', 'infinity'):
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        raise ValueError(f"Invalid limit: {text}")
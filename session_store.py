@@ -0,0 +1,269 @@
+import itertools
+import os
+import queue
+import struct
+import threading
+import zlib
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+from startup_profiler import lazy_import
+
+np = lazy_import('numpy')
+
+MAGIC = b'CALCSESS'
+VERSION = 2
+READABLE_VERSIONS = (1, 2)
+HISTORY_PAGE_SIZE = 32
+
+HEADER = struct.Struct('<8sHB?H?dII')
+MATRIX_SHAPE = struct.Struct('<II')
+PAGE_ENTRY = struct.Struct('<QII')
+LENGTH = struct.Struct('<I')
+WORD_SIZE = struct.Struct('<H')
+
+MEMORY_SCALAR = 0
+MEMORY_MATRIX = 1
+MEMORY_COMPLEX_MATRIX = 2
+MEMORY_COMPLEX = 3
+MATRIX_DTYPES = {
+    MEMORY_MATRIX: '<f8',
+    MEMORY_COMPLEX_MATRIX: '<c16',
+    MEMORY_COMPLEX: '<c16'
+}
+
+MemoryValue = Union[float, complex, 'np.ndarray']
+
+
+class SessionState(NamedTuple):
+    memory_value: MemoryValue
+    has_memory: bool
+    theme: str
+    scientific_mode: bool
+    angle_mode: str
+    precision_digits: Optional[int]
+    total_expression: str
+    current_expression: str
+    history: List[str]
+    history_base: Optional['SessionSnapshot'] = None
+    programmer_base: Optional[str] = None
+    word_size: Optional[int] = None
+
+
+class SessionSnapshot:
+    def __init__(self, path: str, state: SessionState, history_count: int,
+                 pages: List[Tuple[int, int, int]]):
+        self.path = path
+        self.state = state
+        self.history_count = history_count
+        self.pages = pages
+        self.compressed: Optional[List[bytes]] = None
+
+    def compressed_pages(self) -> List[bytes]:
+        if self.compressed is None:
+            with open(self.path, 'rb') as f:
+                blobs = []
+                for offset, length, _ in self.pages:
+                    f.seek(offset)
+                    blobs.append(_read_exact(f, length))
+            self.compressed = blobs
+        return self.compressed
+
+    def history_page(self, index: int) -> List[str]:
+        offset, length, count = self.pages[index]
+        if self.compressed is not None:
+            compressed = self.compressed[index]
+        else:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                compressed = _read_exact(f, length)
+        try:
+            data = zlib.decompress(compressed)
+            entries = []
+            position = 0
+            for _ in range(count):
+                text, position = _read_text(data, position)
+                entries.append(text)
+        except (zlib.error, struct.error, UnicodeDecodeError):
+            raise ValueError("Corrupt history page")
+        return entries
+
+    def load_history(self) -> List[str]:
+        history: List[str] = []
+        for index in range(len(self.pages)):
+            history.extend(self.history_page(index))
+        return history
+
+
+class SessionStore:
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.sequence = itertools.count()
+        self.written = -1
+        self.pending: queue.Queue = queue.Queue()
+        self.writer = threading.Thread(target=self._run, daemon=True)
+        self.writer.start()
+
+    def load(self) -> Optional[SessionSnapshot]:
+        try:
+            with open(self.path, 'rb') as f:
+                return _read_snapshot(self.path, f)
+        except (OSError, ValueError, struct.error, UnicodeDecodeError):
+            return None
+
+    def save(self, state: SessionState) -> bool:
+        return self._write(state, next(self.sequence))
+
+    def save_in_background(self, state: SessionState):
+        self.pending.put(('save', state, next(self.sequence)))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        done = threading.Event()
+        self.pending.put(('flush', done))
+        return done.wait(timeout)
+
+    def _write(self, state: SessionState, sequence: int) -> bool:
+        data = encode(state)
+        with self.lock:
+            if sequence < self.written:
+                return False
+            directory = os.path.dirname(self.path) or '.'
+            os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(temp_path, 'wb') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            self.written = sequence
+        return True
+
+    def _run(self):
+        while True:
+            operations = [self.pending.get()]
+            while True:
+                try:
+                    operations.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+
+            saves = [op for op in operations if op[0] == 'save']
+            if saves:
+                _, state, sequence = saves[-1]
+                try:
+                    self._write(state, sequence)
+                except OSError:
+                    pass
+            for op in operations:
+                if op[0] == 'flush':
+                    op[1].set()
+
+
+def encode(state: SessionState) -> bytes:
+    memory = state.memory_value
+    if isinstance(memory, complex):
+        memory_kind = MEMORY_COMPLEX
+        memory = np.array([[memory]])
+    elif isinstance(memory, (int, float)):
+        memory_kind = MEMORY_SCALAR
+    elif np.iscomplexobj(memory):
+        memory_kind = MEMORY_COMPLEX_MATRIX
+    else:
+        memory_kind = MEMORY_MATRIX
+    is_matrix = memory_kind != MEMORY_SCALAR
+
+    pages = []
+    history_count = len(state.history)
+    base = state.history_base
+    if base is not None:
+        pages.extend((compressed, count) for compressed, (_, _, count) in zip(base.compressed_pages(), base.pages))
+        history_count += base.history_count
+    for start in range(0, len(state.history), HISTORY_PAGE_SIZE):
+        entries = state.history[start:start + HISTORY_PAGE_SIZE]
+        pages.append((zlib.compress(b''.join(_pack_text(e) for e in entries)), len(entries)))
+
+    header = HEADER.pack(
+        MAGIC, VERSION,
+        memory_kind,
+        state.has_memory,
+        state.precision_digits or 0,
+        state.scientific_mode,
+        0.0 if is_matrix else float(memory),
+        history_count,
+        len(pages)
+    )
+
+    parts = [header]
+    if is_matrix:
+        matrix = np.ascontiguousarray(memory, dtype=MATRIX_DTYPES[memory_kind]).reshape(memory.shape[0], -1)
+        parts.append(MATRIX_SHAPE.pack(*matrix.shape))
+        parts.append(matrix.tobytes())
+    for text in (state.theme, state.angle_mode, state.total_expression, state.current_expression,
+                 state.programmer_base or ''):
+        parts.append(_pack_text(text))
+    parts.append(WORD_SIZE.pack(state.word_size or 0))
+
+    offset = sum(len(p) for p in parts) + PAGE_ENTRY.size * len(pages)
+    for compressed, count in pages:
+        parts.append(PAGE_ENTRY.pack(offset, len(compressed), count))
+        offset += len(compressed)
+    parts.extend(compressed for compressed, _ in pages)
+    return b''.join(parts)
+
+
+def _read_snapshot(path: str, f) -> SessionSnapshot:
+    (magic, version, memory_kind, has_memory, precision, scientific,
+     memory_scalar, history_count, page_count) = HEADER.unpack(_read_exact(f, HEADER.size))
+    if magic != MAGIC or version not in READABLE_VERSIONS:
+        raise ValueError("Not a session snapshot")
+
+    if memory_kind in MATRIX_DTYPES:
+        dtype = np.dtype(MATRIX_DTYPES[memory_kind])
+        rows, cols = MATRIX_SHAPE.unpack(_read_exact(f, MATRIX_SHAPE.size))
+        data = _read_exact(f, rows * cols * dtype.itemsize)
+        memory: MemoryValue = np.frombuffer(data, dtype=dtype).reshape(rows, cols).copy()
+        if memory_kind == MEMORY_COMPLEX:
+            memory = complex(memory[0, 0])
+    elif memory_kind == MEMORY_SCALAR:
+        memory = memory_scalar
+    else:
+        raise ValueError("Unknown memory kind")
+
+    theme, angle_mode, total_expression, current_expression = (_read_text_from(f) for _ in range(4))
+    programmer_base, word_size = None, None
+    if version >= 2:
+        programmer_base = _read_text_from(f) or None
+        (word_size,) = WORD_SIZE.unpack(_read_exact(f, WORD_SIZE.size))
+    pages = [PAGE_ENTRY.unpack(_read_exact(f, PAGE_ENTRY.size)) for _ in range(page_count)]
+
+    state = SessionState(memory, has_memory, theme, scientific, angle_mode, precision or None,
+                         total_expression, current_expression, [],
+                         programmer_base=programmer_base, word_size=word_size or None)
+    return SessionSnapshot(path, state, history_count, pages)
+
+
+def _pack_text(text: str) -> bytes:
+    data = text.encode('utf-8')
+    return LENGTH.pack(len(data)) + data
+
+
+def _read_text(data: bytes, position: int) -> Tuple[str, int]:
+    (length,) = LENGTH.unpack_from(data, position)
+    start = position + LENGTH.size
+    return data[start:start + length].decode('utf-8'), start + length
+
+
+def _read_text_from(f) -> str:
+    (length,) = LENGTH.unpack(_read_exact(f, LENGTH.size))
+    return _read_exact(f, length).decode('utf-8')
+
+
+def _read_exact(f, size: int) -> bytes:
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated session snapshot")
+    return data
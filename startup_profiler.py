@@ -0,0 +1,98 @@
+import importlib.util
+import json
+import os
+import sys
+import time
+import types
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+PROFILE_ENV = 'CALC_PROFILE_STARTUP'
+
+
+class StartupProfiler:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.last_checkpoint = self.started
+        self.phases: List[Tuple[str, float]] = []
+        self.first_frame_at: Optional[float] = None
+        self.reported = False
+        self.enabled = bool(os.environ.get(PROFILE_ENV))
+
+    def checkpoint(self, name: str):
+        now = time.perf_counter()
+        self.phases.append((name, now - self.last_checkpoint))
+        self.last_checkpoint = now
+
+    @contextmanager
+    def step(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self.phases.append((name, now - start))
+            self.last_checkpoint = now
+
+    def first_frame(self):
+        if self.first_frame_at is not None:
+            return
+        self.first_frame_at = time.perf_counter()
+        self.checkpoint('first frame')
+
+    def finish(self):
+        if self.enabled and not self.reported:
+            self.reported = True
+            self.report()
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            'phases_ms': [(name, seconds * 1000) for name, seconds in self.phases],
+            'time_to_first_frame_ms': (
+                (self.first_frame_at - self.started) * 1000 if self.first_frame_at is not None else None
+            )
+        }
+
+    def format(self) -> str:
+        lines = ["Startup profile (ms):"]
+        for name, seconds in self.phases:
+            lines.append(f"  {name:<32}{seconds * 1000:>10.2f}")
+        if self.first_frame_at is not None:
+            lines.append(f"  {'time to first frame':<32}{(self.first_frame_at - self.started) * 1000:>10.2f}")
+        return "\n".join(lines)
+
+    def report(self):
+        print(self.format(), flush=True)
+
+        path = os.environ.get(PROFILE_ENV, '')
+        if path.endswith('.json'):
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.summary(), f, indent=2)
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def is_loaded(module: types.ModuleType) -> bool:
+    return type(module) is types.ModuleType
+
+
+def preload(name: str) -> types.ModuleType:
+    module = lazy_import(name)
+    getattr(module, '__spec__')
+    return module
+
+
+profiler = StartupProfiler()
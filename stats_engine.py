@@ -0,0 +1,227 @@
+import itertools
+import math
+import os
+from typing import Iterator, List, Optional, Sequence
+
+import numpy as np
+
+CHUNK_SIZE = 1 << 20
+RESERVOIR_SIZE = 8192
+BINARY_EXTENSIONS = ('.bin', '.dat', '.f64', '.raw')
+
+
+class RunningStats:
+    def __init__(self, reservoir_size: int = RESERVOIR_SIZE, seed: Optional[int] = None):
+        self.reservoir_size = reservoir_size
+        self._rng = np.random.default_rng(seed)
+        self.clear()
+
+    def clear(self):
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._total = 0.0
+        self._total_comp = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._reservoir = np.empty(self.reservoir_size, dtype=np.float64)
+
+    def add(self, value: float):
+        x = float(value)
+        if not math.isfinite(x):
+            raise ValueError("Data point must be finite")
+
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (x - self.mean)
+        self._add_to_total(x)
+        self.minimum = min(self.minimum, x)
+        self.maximum = max(self.maximum, x)
+
+        if self.n <= self.reservoir_size:
+            self._reservoir[self.n - 1] = x
+        else:
+            slot = int(self._rng.integers(self.n))
+            if slot < self.reservoir_size:
+                self._reservoir[slot] = x
+
+    def add_array(self, values: Sequence[float]):
+        arr = np.asarray(values, dtype=np.float64).reshape(-1)
+        if arr.size == 0:
+            return
+        if not np.isfinite(arr).all():
+            raise ValueError("Data point must be finite")
+
+        m = arr.size
+        chunk_sum = float(arr.sum())
+        chunk_mean = chunk_sum / m
+        chunk_m2 = float(np.square(arr - chunk_mean).sum())
+
+        self._update_reservoir(arr)
+        self._merge_moments(m, chunk_mean, chunk_m2)
+        self._add_to_total(chunk_sum)
+        self.minimum = min(self.minimum, float(arr.min()))
+        self.maximum = max(self.maximum, float(arr.max()))
+
+    def add_file(self, path: str, column: int = 0, chunk_size: int = CHUNK_SIZE) -> int:
+        count = 0
+        for chunk in iter_file_chunks(path, column=column, chunk_size=chunk_size):
+            self.add_array(chunk)
+            count += chunk.size
+        return count
+
+    def merge(self, other: 'RunningStats'):
+        if other.n == 0:
+            return
+        if self.n == 0:
+            self.n = other.n
+            self.mean = other.mean
+            self._m2 = other._m2
+            self._total = other._total
+            self._total_comp = other._total_comp
+            self.minimum = other.minimum
+            self.maximum = other.maximum
+            self._reservoir = other._reservoir.copy()
+            return
+
+        own = self._reservoir[:min(self.n, self.reservoir_size)]
+        theirs = other._reservoir[:min(other.n, other.reservoir_size)]
+        total_n = self.n + other.n
+        if own.size + theirs.size <= self.reservoir_size:
+            merged = np.concatenate([own, theirs])
+        else:
+            take_own = int(self._rng.binomial(self.reservoir_size, self.n / total_n))
+            take_own = min(take_own, own.size)
+            take_theirs = min(self.reservoir_size - take_own, theirs.size)
+            merged = np.concatenate([
+                self._rng.choice(own, take_own, replace=False),
+                self._rng.choice(theirs, take_theirs, replace=False)
+            ])
+        self._reservoir[:merged.size] = merged
+
+        self._merge_moments(other.n, other.mean, other._m2)
+        self._add_to_total(other._total)
+        self._add_to_total(other._total_comp)
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def total(self) -> float:
+        return self._total + self._total_comp
+
+    @property
+    def variance(self) -> float:
+        if self.n < 2:
+            raise ValueError("Need at least two data points")
+        return self._m2 / (self.n - 1)
+
+    @property
+    def population_variance(self) -> float:
+        self._require_data()
+        return self._m2 / self.n
+
+    @property
+    def std_dev(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def population_std_dev(self) -> float:
+        return math.sqrt(self.population_variance)
+
+    def quantile(self, q: float) -> float:
+        self._require_data()
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        sample = self._reservoir[:min(self.n, self.reservoir_size)]
+        return float(np.quantile(sample, q))
+
+    @property
+    def is_exact_quantiles(self) -> bool:
+        return self.n <= self.reservoir_size
+
+    def _require_data(self):
+        if self.n == 0:
+            raise ValueError("No data points")
+
+    def _merge_moments(self, m: int, other_mean: float, other_m2: float):
+        total_n = self.n + m
+        delta = other_mean - self.mean
+        self.mean += delta * m / total_n
+        self._m2 += other_m2 + delta * delta * self.n * m / total_n
+        self.n = total_n
+
+    def _add_to_total(self, x: float):
+        t = self._total + x
+        if abs(self._total) >= abs(x):
+            self._total_comp += (self._total - t) + x
+        else:
+            self._total_comp += (x - t) + self._total
+        self._total = t
+
+    def _update_reservoir(self, arr: np.ndarray):
+        size = self.reservoir_size
+        fill = max(0, min(arr.size, size - self.n))
+        if fill:
+            self._reservoir[self.n:self.n + fill] = arr[:fill]
+
+        rest = arr[fill:]
+        if rest.size:
+            seen = np.arange(self.n + fill + 1, self.n + arr.size + 1, dtype=np.float64)
+            slots = (self._rng.random(rest.size) * seen).astype(np.int64)
+            keep = slots < size
+            self._reservoir[slots[keep]] = rest[keep]
+
+
+def iter_file_chunks(path: str, column: int = 0, chunk_size: int = CHUNK_SIZE,
+                     dtype: str = 'float64') -> Iterator[np.ndarray]:
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext == '.npy':
+        data = np.load(path, mmap_mode='r')
+        if data.ndim == 2:
+            data = data[:, column]
+        elif data.ndim != 1:
+            raise ValueError("Data file must hold a single numeric column")
+        yield from _iter_slices(data, chunk_size)
+    elif ext in BINARY_EXTENSIONS:
+        data = np.memmap(path, dtype=dtype, mode='r')
+        yield from _iter_slices(data, chunk_size)
+    else:
+        yield from _iter_text_chunks(path, column, chunk_size)
+
+
+def _iter_slices(data: np.ndarray, chunk_size: int) -> Iterator[np.ndarray]:
+    for start in range(0, data.shape[0], chunk_size):
+        yield np.asarray(data[start:start + chunk_size], dtype=np.float64)
+
+
+def _iter_text_chunks(path: str, column: int, chunk_size: int) -> Iterator[np.ndarray]:
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = (line for line in f if line.strip() and not line.lstrip().startswith('#'))
+        first_batch: List[str] = list(itertools.islice(lines, chunk_size))
+        if not first_batch:
+            return
+
+        delimiter = ',' if ',' in first_batch[0] else None
+        if not _is_number(_split_field(first_batch[0], delimiter, column)):
+            first_batch = first_batch[1:]
+
+        batch = first_batch
+        while batch:
+            yield np.loadtxt(batch, delimiter=delimiter, usecols=(column,),
+                             dtype=np.float64, ndmin=1)
+            batch = list(itertools.islice(lines, chunk_size))
+
+
+def _split_field(line: str, delimiter: Optional[str], column: int) -> str:
+    fields = line.split(delimiter)
+    return fields[column].strip() if column < len(fields) else ''
+
+
+def _is_number(text: str) -> bool:
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return False
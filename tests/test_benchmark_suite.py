@@ -0,0 +1,83 @@
+import argparse
+import fnmatch
+import importlib.util
+import json
+import os
+
+import pytest
+
+pytest.importorskip('kivy')
+
+from headless import REPO_ROOT
+
+
+@pytest.fixture(scope='module')
+def suite():
+    spec = importlib.util.spec_from_file_location('benchmark_suite', os.path.join(REPO_ROOT, 'benchmarks', 'suite.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_results(path, results):
+    path.write_text(json.dumps({'environment': {}, 'results': results}))
+    return str(path)
+
+
+def test_names_are_unique_and_grouped(suite):
+    names = [b.name for b in suite.BENCHMARKS]
+    assert len(names) == len(set(names))
+    assert all(name.split('.')[0] in ('engine', 'ui') for name in names)
+    assert all(b.ui == b.name.startswith('ui.') for b in suite.BENCHMARKS)
+
+
+@pytest.mark.parametrize('pattern', ['engine.expression.*', 'engine.format_number', 'engine.sqrt_batch.*',
+                                     'ui.evaluate.short', 'ui.toggle_scientific_mode'])
+def test_benchmarks_run(suite, pattern):
+    for bench in suite.BENCHMARKS:
+        if fnmatch.fnmatch(bench.name, pattern):
+            result = suite.run_benchmark(bench._replace(number=2), repeat=2)
+            assert result['min_s'] <= result['median_s']
+            assert result['number'] == 2 and result['repeat'] == 2
+
+
+def test_run_writes_selected_results(suite, tmp_path, capsys):
+    output = tmp_path / 'results.json'
+    args = argparse.Namespace(filter=['engine.function.sin.*'], skip_ui=True, repeat=1, output=str(output))
+    assert suite.run(args) == 0
+    data = json.loads(output.read_text())
+    assert sorted(data['results']) == ['engine.function.sin.deg', 'engine.function.sin.rad']
+    assert data['environment']['seed'] == str(suite.SEED)
+
+
+def test_run_without_matches(suite, tmp_path, capsys):
+    args = argparse.Namespace(filter=['ui.*'], skip_ui=True, repeat=1, output=str(tmp_path / 'none.json'))
+    assert suite.run(args) == 1
+    assert "No benchmarks match" in capsys.readouterr().out
+
+
+def test_compare_flags_regressions(suite, tmp_path, capsys):
+    baseline = write_results(tmp_path / 'a.json', {
+        'fast': {'median_s': 1e-6, 'min_s': 1e-6}, 'slow': {'median_s': 1e-3, 'min_s': 1e-3},
+        'gone': {'median_s': 1.0, 'min_s': 1.0}})
+    candidate = write_results(tmp_path / 'b.json', {
+        'fast': {'median_s': 2e-6, 'min_s': 1.05e-6}, 'slow': {'median_s': 5e-4, 'min_s': 5e-4},
+        'new': {'median_s': 1.0, 'min_s': 1.0}})
+
+    args = argparse.Namespace(baseline=baseline, candidate=candidate, threshold=0.1, metric='median')
+    assert suite.compare(args) == 1
+    out = capsys.readouterr().out
+    assert 'REGRESSION' in out and 'improved' in out
+    assert 'only in baseline' in out and 'only in candidate' in out
+
+    args.metric = 'min'
+    args.baseline = write_results(tmp_path / 'c.json', {'fast': {'median_s': 1e-6, 'min_s': 1e-6}})
+    args.candidate = write_results(tmp_path / 'd.json', {'fast': {'median_s': 2e-6, 'min_s': 1.05e-6}})
+    assert suite.compare(args) == 0
+
+
+def test_format_time(suite):
+    assert suite._format_time(2.5) == "2.50 s"
+    assert suite._format_time(0.0015) == "1.50 ms"
+    assert suite._format_time(3e-6) == "3.00 µs"
+    assert suite._format_time(4e-8) == "40 ns"
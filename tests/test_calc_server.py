@@ -0,0 +1,123 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import calc_server
+from calc_server import (INTERNAL_ERROR, INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND,
+                         PARSE_ERROR, EvaluationServer)
+
+
+@pytest.fixture
+def server():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield EvaluationServer(executor, max_batch=4, max_delay=0.001)
+
+
+def dispatch(server, request):
+    return asyncio.run(server._dispatch(request))
+
+
+def call(server, method, params=None, request_id=1):
+    request = {'jsonrpc': '2.0', 'id': request_id, 'method': method}
+    if params is not None:
+        request['params'] = params
+    return dispatch(server, request)
+
+
+def test_evaluate(server):
+    assert call(server, 'evaluate', {'expression': '2+3*4'})['result'] == {'value': '14'}
+    assert call(server, 'evaluate', ['1/0'])['result'] == {'error': 'Cannot divide by zero'}
+    assert call(server, 'evaluate', {'expression': '1/3', 'precision': 20})['result'] == {
+        'value': '0.33333333333333333333'}
+
+
+def test_batches(server):
+    response = call(server, 'evaluate_batch', {'expressions': ['1+1', '2*3']})
+    assert response['result'] == [{'value': '2'}, {'value': '6'}]
+    response = call(server, 'apply_batch', {'function': 'sin', 'values': [30, 90]})
+    assert response['result'] == [{'value': '0.5'}, {'value': '1'}]
+    response = call(server, 'convert', {'value': 1, 'from_unit': 'km', 'to_unit': 'm'})
+    assert response['result'] == {'value': '1000'}
+
+
+def test_micro_batching_groups_concurrent_requests(server):
+    async def run():
+        requests = [{'jsonrpc': '2.0', 'id': i, 'method': 'evaluate', 'params': [f'{i}+1']} for i in range(8)]
+        return await asyncio.gather(*(server._dispatch(r) for r in requests))
+
+    responses = asyncio.run(run())
+    assert [r['result']['value'] for r in responses] == [str(i + 1) for i in range(8)]
+    assert server.evaluations.items == 8
+    assert server.evaluations.batches == 2
+
+
+@pytest.mark.parametrize('request_body', [
+    {'jsonrpc': '2.0', 'method': 'evaluate', 'params': ['1']},
+    {'jsonrpc': '2.0', 'method': 'missing'},
+    {'jsonrpc': '2.0', 'method': 'evaluate', 'params': {'expr': '1'}},
+    {'jsonrpc': '2.0', 'method': 'evaluate', 'params': ['1', 'grad']}
+])
+def test_notification_has_no_response(server, request_body):
+    assert dispatch(server, request_body) is None
+
+
+@pytest.mark.parametrize('request_body, code', [
+    ([], INVALID_REQUEST),
+    ({'method': 'evaluate', 'id': 1}, INVALID_REQUEST),
+    ({'method': 'evaluate'}, INVALID_REQUEST),
+    ({'jsonrpc': '2.0', 'id': 1, 'method': 'missing'}, METHOD_NOT_FOUND),
+    ({'jsonrpc': '2.0', 'id': 1, 'method': ['evaluate']}, METHOD_NOT_FOUND),
+    ({'jsonrpc': '2.0', 'id': 1, 'method': {'a': 1}}, METHOD_NOT_FOUND),
+    ({'jsonrpc': '2.0', 'id': 1, 'method': 'evaluate', 'params': 5}, INVALID_PARAMS),
+    ({'jsonrpc': '2.0', 'id': 1, 'method': 'evaluate', 'params': {}}, INVALID_PARAMS),
+    ({'jsonrpc': '2.0', 'id': 1, 'method': 'evaluate', 'params': {'expr': '1'}}, INVALID_PARAMS),
+    ({'jsonrpc': '2.0', 'id': 1, 'method': 'evaluate', 'params': ['1', 'deg', None, False, 9]}, INVALID_PARAMS),
+    ({'jsonrpc': '2.0', 'id': 1, 'method': 'evaluate', 'params': [1]}, INVALID_PARAMS),
+    ({'jsonrpc': '2.0', 'id': 1, 'method': 'evaluate', 'params': ['1', 'grad']}, INVALID_PARAMS),
+    ({'jsonrpc': '2.0', 'id': 1, 'method': 'evaluate', 'params': ['1', 'deg', 0]}, INVALID_PARAMS),
+    ({'jsonrpc': '2.0', 'id': 1, 'method': 'evaluate', 'params': ['1', 'deg', True]}, INVALID_PARAMS),
+    ({'jsonrpc': '2.0', 'id': 1, 'method': 'apply', 'params': ['sin', True]}, INVALID_PARAMS),
+    ({'jsonrpc': '2.0', 'id': 1, 'method': 'convert', 'params': [1, 'km', 'kg']}, INVALID_PARAMS),
+    ({'jsonrpc': '2.0', 'id': 1, 'method': 'evaluate_batch', 'params': ['1+1']}, INVALID_PARAMS),
+])
+def test_invalid_requests(server, request_body, code):
+    assert dispatch(server, request_body)['error']['code'] == code
+
+
+def test_worker_failure_is_internal_error(server, monkeypatch):
+    def broken(key, items):
+        raise RuntimeError("worker crashed")
+
+    monkeypatch.setattr(server.evaluations, 'worker', broken)
+    response = call(server, 'evaluate', ['1+1'])
+    assert response['error'] == {'code': INTERNAL_ERROR, 'message': 'Internal error'}
+    assert 'evaluate' in asyncio.run(server.stats())['latency']
+
+
+def test_connection_handles_lines(server):
+    async def run():
+        listener = await asyncio.start_server(server.handle_connection, '127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b'not json\n')
+            writer.write(json.dumps([
+                {'jsonrpc': '2.0', 'id': 1, 'method': 'evaluate', 'params': ['6*7']},
+                {'jsonrpc': '2.0', 'method': 'evaluate', 'params': ['1']}
+            ]).encode() + b'\n')
+            await writer.drain()
+            lines = [json.loads(await reader.readline()) for _ in range(2)]
+            writer.close()
+            return lines
+
+    lines = asyncio.run(run())
+    assert {'jsonrpc': '2.0', 'id': None, 'error': {'code': PARSE_ERROR, 'message': 'Parse error'}} in lines
+    assert [{'jsonrpc': '2.0', 'id': 1, 'result': {'value': '42'}}] in lines
+
+
+def test_units_lists_categories(server):
+    units = call(server, 'units')['result']
+    assert 'm' in units['length']
+    assert calc_server._error(3, INVALID_PARAMS, 'x')['id'] == 3
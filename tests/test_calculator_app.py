@@ -0,0 +1,254 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip('kivy')
+
+from headless import REPO_ROOT, HeadlessCalculator
+from session_store import SessionStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionStore(str(tmp_path / 'session.bin'))
+
+
+@pytest.fixture
+def calc(store):
+    calculator = HeadlessCalculator(session_store=store)
+    yield calculator
+    calculator.close()
+
+
+def toggle(calc, button):
+    button.trigger_action(duration=0)
+    calc.frame()
+
+
+def test_keyboard_arithmetic(calc):
+    calc.type('12+30=')
+    assert calc.display()['label'] == '42'
+    assert calc.calculator.calculation_history[-1] == '12+30 = 42'
+
+
+@pytest.mark.parametrize('leave', ['mode_btn', 'stats_btn'])
+def test_leaving_matrix_mode_clears_entry(calc, leave):
+    toggle(calc, calc.calculator.matrix_btn)
+    calc.type('1')
+    calc.press(',')
+    calc.type('2')
+    assert calc.display()['label'] == '1,2'
+    toggle(calc, getattr(calc.calculator, leave))
+    assert not calc.calculator.matrix_mode
+    assert calc.display()['label'] == '0'
+
+
+def test_complex_matrix_determinant(calc):
+    toggle(calc, calc.calculator.matrix_btn)
+    calc.calculator.matrix_x = np.array([[1 + 1j, 2], [0, 3j]])
+    calc.press('det')
+    assert calc.calculator.calculation_history[-1] == 'det[2×2] = -3+3i'
+
+
+def popup_inputs(calc):
+    from kivy.uix.modalview import ModalView
+    from kivy.uix.textinput import TextInput
+
+    popups = [w for w in calc.window.children if isinstance(w, ModalView)]
+    return popups, [w for popup in popups for w in popup.walk() if isinstance(w, TextInput)]
+
+
+def test_keys_go_to_open_popup(calc):
+    calc.type('12')
+    calc.press('Scientific')
+    calc.press('VAR')
+    popups, inputs = popup_inputs(calc)
+    assert popups and inputs
+    calc.type('3\b\n')
+    assert calc.display()['label'] == '12'
+    calc.dismiss_popups()
+    calc.type('3')
+    assert calc.display()['label'] == '123'
+
+
+KEYBOARD_METRICS = """
+from headless import HeadlessCalculator
+from instrumentation import metrics
+calc = HeadlessCalculator()
+handler = type(calc.calculator)._on_keyboard_down
+print(hasattr(handler, '__wrapped__'), hasattr(type(calc.calculator)._keyboard_captured, '__wrapped__'))
+calc.type('12')
+print(metrics.snapshot()['calls']['_on_keyboard_down']['count'])
+"""
+
+
+def test_keyboard_handler_is_instrumented():
+    env = dict(os.environ, CALC_INSTRUMENT='1')
+    result = subprocess.run([sys.executable, '-c', KEYBOARD_METRICS], cwd=REPO_ROOT, env=env,
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ['True', 'False', '2']
+
+
+DEFERRED_IMPORTS = """
+import sys
+from headless import HeadlessCalculator
+from startup_profiler import is_loaded
+calc = HeadlessCalculator(complete_startup=False)
+loaded = lambda: sorted(n for n in ('numpy', 'sqlite3', 'matrix_engine', 'trig_kernels')
+                        if n in sys.modules and is_loaded(sys.modules[n]))
+print(loaded())
+calc.calculator.complete_startup()
+print(loaded())
+calc.press('Scientific')
+calc.type('30')
+calc.press('sin')
+print(calc.display()['label'])
+"""
+
+
+def test_optional_engines_load_after_first_frame():
+    result = subprocess.run([sys.executable, '-c', DEFERRED_IMPORTS], cwd=REPO_ROOT,
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines() == [
+        "[]", "['matrix_engine', 'numpy', 'trig_kernels']", "0.5"
+    ]
+
+
+def test_history_stays_lazy_across_saves(calc, store):
+    for i in range(40):
+        calc.type(f'{i}+1=')
+    calc.calculator.save_session(background=False)
+    restored = HeadlessCalculator(session_store=SessionStore(store.path))
+    try:
+        calculator = restored.calculator
+        calculator.current_expression = '8'
+        calculator.save_session(background=False)
+        assert calculator.history_snapshot is not None
+        restored.type('*5=')
+        calculator.save_session()
+        assert calculator.session_store.flush(5)
+        snapshot = SessionStore(store.path).load()
+        assert snapshot.history_count == 41
+        assert snapshot.load_history()[-2:] == ['39+1 = 40', '8×5 = 40']
+    finally:
+        restored.close()
+
+
+def test_autosave_skips_unchanged_sessions(calc, store, monkeypatch):
+    captured = []
+    capture = calc.calculator.capture_session
+    monkeypatch.setattr(calc.calculator, 'capture_session', lambda: captured.append(1) or capture())
+    calc.type('12')
+    calc.calculator.save_session()
+    calc.calculator.save_session()
+    assert len(captured) == 1
+    calc.press('M+')
+    calc.calculator.save_session()
+    assert len(captured) == 2
+    assert store.flush(5)
+    assert store.load().state.memory_value == 12
+
+
+def test_complex_results_chain_and_accumulate(calc):
+    calc.press('Scientific')
+    calc.press('CPLX')
+    calc.type('1+2')
+    calc.press('i')
+    calc.type('=*3=')
+    assert calc.display()['label'] == '3+6i'
+    assert calc.calculator.calculation_history[-1] == '(1+2i)×3 = 3+6i'
+    calc.press('M+')
+    calc.press('M+')
+    calc.press('C')
+    calc.press('MR')
+    assert calc.display()['label'] == '6+12i'
+    calc.press('CPLX')
+    calc.press('CPLX')
+    assert not calc.calculator.complex_mode
+    assert calc.display()['label'] == '0'
+    calc.press('MR')
+    assert calc.display()['label'] == 'Complex number in memory'
+
+
+def test_leaving_complex_mode_keeps_real_entry(calc):
+    calc.press('Scientific')
+    calc.press('CPLX')
+    calc.type('12')
+    calc.press('CPLX')
+    calc.press('CPLX')
+    assert calc.display()['label'] == '12'
+
+
+def test_programmer_mode_leaves_scientific_mode(calc):
+    calc.press('Scientific')
+    assert calc.calculator.mode_btn.text == 'Standard'
+    toggle(calc, calc.calculator.programmer_btn)
+    assert calc.calculator.programmer_mode and not calc.calculator.scientific_mode
+    assert calc.calculator.mode_btn.text == 'Scientific'
+    assert calc.calculator.programmer_btn.text == 'Standard'
+
+
+def test_programmer_operators_replace_shifts(calc):
+    toggle(calc, calc.calculator.programmer_btn)
+    calc.type('5<')
+    assert calc.calculator.total_expression == '5<<'
+    calc.type('+')
+    assert calc.calculator.total_expression == '5+'
+    calc.type('>&')
+    assert calc.calculator.total_expression == '5&'
+
+
+def test_negative_entry_converts_between_bases(calc):
+    toggle(calc, calc.calculator.programmer_btn)
+    calc.calculator.current_expression = '-9'
+    calc.press('HEX')
+    assert calc.display()['label'] == 'FFFFFFFFFFFFFFF7'
+
+
+def test_programmer_mode_survives_restart(calc, store):
+    toggle(calc, calc.calculator.programmer_btn)
+    calc.press('HEX')
+    calc.type('FF')
+    calc.calculator.save_session(background=False)
+    restored = HeadlessCalculator(session_store=SessionStore(store.path))
+    try:
+        calculator = restored.calculator
+        assert (calculator.programmer_mode, calculator.programmer_base, calculator.word_size) == (True, 'HEX', 64)
+        assert restored.display()['label'] == 'FF'
+        restored.type('+1=')
+        assert restored.display()['label'] == '100'
+    finally:
+        restored.close()
+
+
+class _Dismissable:
+    def dismiss(self):
+        pass
+
+
+def test_unit_conversion_refused_in_programmer_mode(calc):
+    toggle(calc, calc.calculator.programmer_btn)
+    calc.type('12')
+    calc.calculator.convert_units(_Dismissable(), 'km', 'm')
+    assert calc.display()['label'] == 'Units need a decimal value'
+
+
+@pytest.mark.parametrize('entry', ['3+4i', 'abc'])
+def test_unit_conversion_rejects_non_real_entry(calc, entry):
+    calc.calculator.current_expression = entry
+    calc.calculator.convert_units(_Dismissable(), 'km', 'm')
+    assert calc.display()['label'] == 'Invalid input'
+    calc.type('+')
+    assert calc.calculator.total_expression == ''
+
+
+def test_unit_conversion_records_history(calc):
+    calc.type('2')
+    calc.calculator.convert_units(_Dismissable(), 'km', 'm')
+    assert calc.display()['label'] == '2000'
+    assert calc.calculator.calculation_history[-1] == '2 km = 2000 m'
@@ -0,0 +1,72 @@
+import cmath
+
+import numpy as np
+import pytest
+
+import complex_engine
+
+
+def fmt(value):
+    return f"{value:g}"
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('2.5', 2.5), ('3i', 3j), ('i', 1j), ('1+2i', 1 + 2j), ('-4.5-i', -4.5 - 1j), ('2e3i', 2000j)
+])
+def test_parse(text, expected):
+    assert complex_engine.parse(text) == expected
+
+
+def test_parse_rejects_garbage():
+    with pytest.raises(ValueError, match="Invalid number"):
+        complex_engine.parse('1+2k')
+
+
+def test_to_python():
+    assert complex_engine.to_python('(1+2i)*i') == '(1+2j)*1j'
+
+
+def test_clean_drops_rounding_noise():
+    assert complex_engine.clean(cmath.exp(1j * cmath.pi)) == -1.0
+    assert complex_engine.clean(1e-20 + 2j) == 2j
+    assert complex_engine.clean(3.5) == 3.5
+
+
+@pytest.mark.parametrize('value, expected', [
+    (3 + 4j, '3+4i'), (3 - 1j, '3-i'), (-2j, '-2i'), (1j, 'i'), (-1.5 + 0.5j, '-1.5+0.5i')
+])
+def test_format_rectangular(value, expected):
+    assert complex_engine.format_rectangular(value, fmt) == expected
+
+
+def test_format_polar():
+    assert complex_engine.format_polar(1j, fmt, True) == '1 cis 90°'
+    assert complex_engine.format_polar(-1 + 0j, fmt, False) == f"1 cis {fmt(cmath.pi)}"
+
+
+def test_apply():
+    assert complex_engine.apply('sqrt', -4, False) == 2j
+    assert complex_engine.apply('square', 1 + 1j, False) == 2j
+    assert complex_engine.apply('sin', 90, True) == pytest.approx(1)
+    assert complex_engine.apply('asin', 2, True) == pytest.approx(cmath.asin(2) * 180 / cmath.pi)
+    with pytest.raises(ValueError, match="ln of zero"):
+        complex_engine.apply('ln', 0, False)
+    with pytest.raises(ValueError, match="csc undefined"):
+        complex_engine.apply('csc', 0, True)
+    with pytest.raises(ValueError, match="Unknown function"):
+        complex_engine.apply('gamma', 1, False)
+
+
+def test_root():
+    assert complex_engine.root(-8, 3) == pytest.approx(1 + 1.7320508075688772j)
+    assert complex_engine.root(0, 5) == 0.0
+
+
+def test_array_functions_switch_to_complex_only_when_needed():
+    real = complex_engine.ARRAY_FUNCTIONS['sqrt'](np.array([4.0, 9.0]))
+    assert real.dtype == np.float64
+    mixed = complex_engine.ARRAY_FUNCTIONS['sqrt'](np.array([4.0, -9.0]))
+    assert mixed.dtype == np.complex128
+    np.testing.assert_allclose(mixed, [2, 3j])
+    logs = complex_engine.ARRAY_FUNCTIONS['log'](np.array([100.0, -100.0]))
+    np.testing.assert_allclose(logs, [2, 2 + 1.3643763538418412j])
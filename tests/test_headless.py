@@ -0,0 +1,53 @@
+import pytest
+
+pytest.importorskip('kivy')
+
+from headless import HeadlessCalculator, run_scenario
+
+
+@pytest.fixture
+def calc():
+    calculator = HeadlessCalculator()
+    yield calculator
+    calculator.close()
+
+
+def test_close_unbinds_window_handlers():
+    calc = HeadlessCalculator()
+    calculator = calc.calculator
+    calc.close()
+    other = HeadlessCalculator()
+    try:
+        other.type('7')
+        assert other.display()['label'] == '7'
+        assert calculator.current_expression != '7'
+        assert calculator.parent is None
+    finally:
+        other.close()
+
+
+def test_press_and_find_button(calc):
+    calc.press('9')
+    calc.press('×')
+    calc.type('3=')
+    assert calc.display()['label'] == '27'
+    assert calc.find_button('Theme') in calc.calculator.menu_buttons
+    with pytest.raises(KeyError):
+        calc.find_button('no such button')
+
+
+def test_metrics_count_widgets_and_frames(calc):
+    calc.frame_times.clear()
+    calc.frames(3)
+    metrics = calc.metrics()
+    assert metrics['frames'] == 3
+    assert metrics['widgets'] > 20
+    assert metrics['canvas_instructions'] > metrics['widgets']
+
+
+def test_run_scenario(calc):
+    result = run_scenario(['type:12+30=', 'press:History', 'frames:2', 'dismiss'], calc)
+    assert result['display']['label'] == '42'
+    assert [step for step, _ in result['steps_ms']][-1] == 'dismiss'
+    with pytest.raises(ValueError):
+        run_scenario(['wiggle:1'], calc)
@@ -0,0 +1,90 @@
+import pytest
+
+import input_recorder
+from input_recorder import KEY, MENU, PRESS, EventRecorder, read_recording
+from session_store import SessionState
+
+
+def make_state(**changes):
+    state = SessionState(
+        memory_value=0.0, has_memory=False, theme='dark', scientific_mode=False, angle_mode='deg',
+        precision_digits=None, total_expression='', current_expression='', history=[])
+    return state._replace(**changes)
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / 'input.rec')
+    recorder = EventRecorder(path, make_state())
+    recorder.record_press('7')
+    recorder.record_key(43, 0, '+', ['shift'])
+    recorder.record_press('7')
+    recorder.record_press('Theme', menu=True)
+    recorder.record_key(13, 40, None, ['ctrl', 'numlock'])
+    recorder.close(make_state(current_expression='14'))
+    recorder.record_press('ignored')
+
+    recording = read_recording(path)
+    assert [(e.kind, e.label) for e in recording.events] == [
+        (PRESS, '7'), (KEY, '+'), (PRESS, '7'), (MENU, 'Theme'), (KEY, '')]
+    assert recording.events[1].modifiers == ('shift',)
+    assert recording.events[4][3:] == (13, 40, ('ctrl', 'numlock'))
+    times = [e.time for e in recording.events]
+    assert times == sorted(times)
+    assert recording.final_state is not None
+    assert recording.initial_state != recording.final_state
+
+
+def test_labels_are_defined_once(tmp_path):
+    path = tmp_path / 'input.rec'
+    recorder = EventRecorder(str(path), make_state())
+    for _ in range(50):
+        recorder.record_press('sin')
+    recorder.close()
+    assert path.read_bytes().count(b'sin') == 1
+    assert len(read_recording(str(path)).events) == 50
+
+
+def test_truncated_recording_keeps_complete_events(tmp_path):
+    path = tmp_path / 'input.rec'
+    recorder = EventRecorder(str(path), make_state())
+    recorder.record_press('1')
+    recorder.record_press('2')
+    recorder.close(make_state())
+    data = path.read_bytes()
+    path.write_bytes(data[:-10])
+    recording = read_recording(str(path))
+    assert [e.label for e in recording.events] == ['1', '2']
+    assert recording.final_state is None
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'not a recording')
+    with pytest.raises(ValueError):
+        read_recording(str(path))
+
+
+def test_record_and_replay(tmp_path):
+    pytest.importorskip('kivy')
+    from headless import HeadlessCalculator
+
+    path = str(tmp_path / 'session.rec')
+    calc = HeadlessCalculator()
+    try:
+        calc.calculator.recorder = EventRecorder(path, calc.calculator.capture_session())
+        calc.type('12+30=')
+        calc.press('Theme')
+        calc.press('9')
+        calc.press('×')
+        calc.type('3=')
+        calc.calculator.recorder.close(calc.calculator.capture_session())
+    finally:
+        calc.calculator.recorder = None
+        calc.close()
+
+    report = input_recorder.replay(path)
+    assert report['events'] == 11
+    assert report['dispatch_errors'] == []
+    assert report['matches_recording']
+    assert report['display']['label'] == '27'
+    assert report['history_added'] == ['12+30 = 42', '9×3 = 27']
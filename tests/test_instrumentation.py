@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+import instrumentation
+from instrumentation import INSTRUMENT_ENV, LatencyHistogram, Metrics
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    fresh = Metrics()
+    fresh.enabled = True
+    monkeypatch.setattr(instrumentation, 'ENABLED', True)
+    monkeypatch.setattr(instrumentation, 'metrics', fresh)
+    return fresh
+
+
+def test_histogram_buckets_and_percentiles():
+    histogram = LatencyHistogram()
+    for micros in [0.5, 3, 3, 3, 100, 5000]:
+        histogram.record(micros / 1e6)
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 6
+    assert snapshot['buckets_us'] == {'1': 1, '4': 3, '128': 1, '8192': 1}
+    assert snapshot['p50_us'] == 4
+    assert snapshot['p99_us'] == pytest.approx(5000)
+    assert snapshot['max_us'] == pytest.approx(5000)
+
+
+def test_histogram_overflow_and_clear():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(0.5) == 0.0
+    histogram.record(1e4)
+    assert histogram.snapshot()['buckets_us'] == {'inf': 1}
+    histogram.clear()
+    assert histogram.snapshot()['count'] == 0
+
+
+def test_disabled_decorators_return_the_function(monkeypatch):
+    monkeypatch.setattr(instrumentation, 'ENABLED', False)
+
+    def func():
+        return 1
+
+    assert instrumentation.instrumented(func) is func
+    assert instrumentation.counts_errors(func) is func
+
+
+def test_instrumented_records_calls_and_exceptions(metrics):
+    @instrumentation.instrumented
+    def divide(a, b):
+        return a / b
+
+    assert divide(6, 3) == 2
+    with pytest.raises(ZeroDivisionError):
+        divide(1, 0)
+    assert divide.__name__ == 'divide'
+    snapshot = metrics.snapshot()
+    assert snapshot['calls']['divide']['count'] == 2
+    assert snapshot['exceptions'] == {'divide': 1}
+
+
+def test_counts_errors(metrics):
+    class Display:
+        @instrumentation.counts_errors
+        def show(self, message):
+            return message.upper()
+
+    display = Display()
+    assert display.show("Math Error") == "MATH ERROR"
+    display.show("Math Error")
+    display.show("Invalid input")
+    assert metrics.snapshot()['errors'] == {"Math Error": 2, "Invalid input": 1}
+    assert "Math Error: 2" in metrics.report()
+
+
+def test_report_dump_and_reset(metrics, tmp_path):
+    metrics.histogram('evaluate').record(0.001)
+    assert 'evaluate' in metrics.report()
+    path = tmp_path / 'metrics.json'
+    metrics.dump(str(path), extra={'startup': {'ok': True}})
+    data = json.loads(path.read_text())
+    assert data['calls']['evaluate']['count'] == 1 and data['startup'] == {'ok': True}
+    metrics.reset()
+    assert metrics.snapshot()['calls'] == {}
+
+
+def test_report_when_disabled():
+    metrics = Metrics()
+    metrics.enabled = False
+    assert INSTRUMENT_ENV in metrics.report()
@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+import matrix_engine
+
+
+def test_parse_and_format():
+    m = matrix_engine.parse_matrix("1,2;3,4.5;")
+    assert m.shape == (2, 2)
+    assert matrix_engine.format_matrix(m) == "1  2\n3  4.5"
+    assert matrix_engine.describe(m) == "[2×2]"
+
+
+def test_format_elides_large_matrices():
+    text = matrix_engine.format_matrix(np.arange(36.0).reshape(6, 6))
+    lines = text.split("\n")
+    assert lines[2] == "⋮"
+    assert lines[0] == "0  1  …  5"
+
+
+@pytest.mark.parametrize('text, message', [
+    ("", "Empty matrix"),
+    ("1,x;2,3", "Invalid matrix entry"),
+    ("1,2;3", "same length"),
+    ("1,nan;2,3", "must be finite"),
+    ("inf,1;2,3", "must be finite"),
+])
+def test_parse_errors(text, message):
+    with pytest.raises(ValueError, match=message):
+        matrix_engine.parse_matrix(text)
+
+
+def test_operations():
+    a = matrix_engine.parse_matrix("2,1;1,3")
+    b = matrix_engine.parse_matrix("1;2")
+    assert matrix_engine.determinant(a) == pytest.approx(5)
+    assert matrix_engine.trace(a) == 5
+    np.testing.assert_allclose(matrix_engine.multiply(a, matrix_engine.inverse(a)), np.eye(2), atol=1e-12)
+    np.testing.assert_allclose(matrix_engine.solve(a, b), [[0.2], [0.6]])
+    np.testing.assert_allclose(sorted(matrix_engine.eigenvalues(a).ravel()), sorted(np.linalg.eigvalsh(a)))
+    assert matrix_engine.add(a, a).tolist() == [[4, 2], [2, 6]]
+    assert matrix_engine.subtract(a, a).tolist() == [[0, 0], [0, 0]]
+
+
+def test_complex_eigenvalues_are_kept():
+    values = matrix_engine.eigenvalues(matrix_engine.parse_matrix("0,-1;1,0"))
+    assert np.iscomplexobj(values)
+    assert matrix_engine.format_element(values[0, 0]) in ("0+1i", "0-1i")
+
+
+def test_complex_determinant_and_trace():
+    a = np.array([[1 + 1j, 2], [0, 3j]])
+    assert matrix_engine.determinant(a) == pytest.approx(-3 + 3j)
+    assert matrix_engine.trace(a) == 1 + 4j
+    assert isinstance(matrix_engine.determinant(np.eye(2)), float)
+
+
+def test_shape_errors():
+    a = matrix_engine.parse_matrix("1,2,3")
+    with pytest.raises(ValueError, match="square"):
+        matrix_engine.determinant(a)
+    with pytest.raises(ValueError, match="Cannot multiply"):
+        matrix_engine.multiply(a, a)
+    with pytest.raises(ValueError, match="Shape mismatch"):
+        matrix_engine.add(a, a.T)
+    with pytest.raises(ValueError, match="singular"):
+        matrix_engine.inverse(matrix_engine.parse_matrix("1,2;2,4"))
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_overflow_is_reported():
+    big = matrix_engine.parse_matrix("1e200,0;0,1e200")
+    with pytest.raises(OverflowError, match="Number too large"):
+        matrix_engine.determinant(big)
+    with pytest.raises(OverflowError, match="Number too large"):
+        matrix_engine.multiply(big, big)
+    with pytest.raises(OverflowError):
+        matrix_engine.add(matrix_engine.parse_matrix("1e308"), matrix_engine.parse_matrix("1e308"))
+
+
+def test_format_non_finite_element():
+    assert matrix_engine.format_element(float('inf')) == "inf"
+    assert matrix_engine.format_element(1e20) == "1e+20"
+
+
+def test_load_matrix(tmp_path):
+    path = tmp_path / 'm.csv'
+    path.write_text("1,2\n3,4\n")
+    assert matrix_engine.load_matrix(str(path)).tolist() == [[1, 2], [3, 4]]
+    column = tmp_path / 'v.npy'
+    np.save(str(column), np.array([1.0, 2.0]))
+    assert matrix_engine.load_matrix(str(column)).shape == (2, 1)
+    bad = tmp_path / 'bad.npy'
+    np.save(str(bad), np.array([[1.0, np.nan]]))
+    with pytest.raises(ValueError, match="finite"):
+        matrix_engine.load_matrix(str(bad))
@@ -0,0 +1,134 @@
+import sys
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import memory_tracker
+from memory_tracker import (BUDGETS_ENV, MEMORY_ENV, MemoryTracker, callback_size, deep_size,
+                            format_bytes, parse_budgets)
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    monkeypatch.delenv(MEMORY_ENV, raising=False)
+    monkeypatch.delenv(BUDGETS_ENV, raising=False)
+    return MemoryTracker()
+
+
+def test_parse_budgets():
+    assert parse_budgets("history=2MB, caches = 512k,widget_tree=1.5G, x=10") == {
+        'history': 2 << 20, 'caches': 512 << 10, 'widget_tree': 3 << 29, 'x': 10}
+    assert parse_budgets("") == {}
+    with pytest.raises(ValueError, match="Invalid memory budget: history=lots"):
+        parse_budgets("history=lots")
+
+
+def test_invalid_budget_environment_keeps_defaults(monkeypatch):
+    monkeypatch.delenv(MEMORY_ENV, raising=False)
+    monkeypatch.setenv(BUDGETS_ENV, "history=1MB,oops")
+    tracker = MemoryTracker()
+    assert tracker.budgets == memory_tracker.DEFAULT_BUDGETS
+    assert tracker.budget_error == "Invalid memory budget: oops"
+
+
+def test_format_bytes():
+    assert format_bytes(None) == "-"
+    assert format_bytes(512) == "512 B"
+    assert format_bytes(1536) == "1.5 KB"
+    assert format_bytes(3 << 30) == "3.0 GB"
+
+
+def test_deep_size_counts_shared_objects_once():
+    text = "x" * 1000
+    array = np.zeros(1000)
+    size = deep_size({'a': [text, text], 'b': (array, array[:10])})
+    assert size >= 1000 + array.nbytes
+    assert size < 2 * 1000 + array.nbytes + 2000
+
+
+def test_callback_size_follows_closures():
+    payload = "y" * 5000
+
+    def outer():
+        return payload
+
+    def callback():
+        return outer()
+
+    assert callback_size(callback) > 5000
+    assert callback_size(len) == 0
+
+
+def test_eviction_counts_only_real_evictions(tracker):
+    data = {'items': list(range(100))}
+
+    def evict(budget):
+        if not data['items']:
+            return False
+        del data['items'][10:]
+        return True
+
+    tracker.budgets = {'history': 50}
+    subsystem = tracker.register('history', measure=lambda: len(data['items']), evict=evict)
+    assert tracker.sample() == ['history']
+    assert subsystem.owned == 10 and subsystem.evictions == 1
+    assert tracker.sample() == []
+
+    data['items'] = []
+    tracker.budgets['history'] = -1
+    assert tracker.sample() == []
+    assert subsystem.evictions == 1
+    assert tracker.last_evicted == ['history']
+
+
+def test_unmeasured_subsystem_waits_for_next_analysis(tracker):
+    calls = []
+    tracker.budgets = {'widget_tree': 10}
+    subsystem = tracker.register('widget_tree', evict=lambda budget: calls.append(budget) or True)
+    subsystem.traced = 100
+    assert tracker.enforce_budgets() == ['widget_tree']
+    assert subsystem.stale
+    assert tracker.enforce_budgets() == []
+    assert calls == [10]
+
+
+def allocate_blocks():
+    return [bytearray(4096) for _ in range(64)]
+
+
+def test_analysis_attributes_allocations(tracker):
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(memory_tracker.TRACE_FRAMES)
+    try:
+        subsystem = tracker.register('history')
+        subsystem.add_code(allocate_blocks)
+        blocks = allocate_blocks()
+        tracker._analyze(tracemalloc.take_snapshot())
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    assert subsystem.traced >= 64 * 4096
+    assert tracker.unattributed > 0
+    assert tracker.summary()['subsystems']['history']['traced_bytes'] == subsystem.traced
+    del blocks
+
+
+def test_add_source_module_and_class(tracker):
+    subsystem = tracker.register('caches')
+    subsystem.add_source(memory_tracker)
+    subsystem.add_source(MemoryTracker)
+    assert subsystem.owns(memory_tracker.__file__, 1)
+    code = MemoryTracker.sample.__code__
+    assert subsystem.owns(code.co_filename, code.co_firstlineno + 1)
+
+
+def test_report(tracker):
+    assert "Memory profiling is off" in tracker.report()
+    tracker.enabled = True
+    assert tracker.report() == "Memory: waiting for the first sample"
+    tracker.register('history', detail=lambda: "12 entries")
+    tracker.snapshot_at = tracker.sampled_at = 0.0
+    report = tracker.report()
+    assert "history" in report and "12 entries" in report
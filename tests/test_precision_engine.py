@@ -0,0 +1,67 @@
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+import precision_engine
+from precision_engine import evaluate_expression, format_precise
+
+
+def test_off_uses_float():
+    assert evaluate_expression("0.1+0.2") == 0.1 + 0.2
+
+
+def test_decimal_literals_are_exact():
+    value = evaluate_expression("0.1+0.2", 20)
+    assert value == Fraction(3, 10)
+    assert format_precise(value, 20) == "0.3"
+
+
+def test_exact_float_shortcut():
+    assert precision_engine.analyze("2.5*4-0.75").exact_code is not None
+    value = evaluate_expression("2.5*4-0.75", 20)
+    assert isinstance(value, float) and value == 9.25
+
+
+@pytest.mark.parametrize('expr, expected', [
+    ("4503599627370495.5+0.25", Fraction(18014398509481983, 4)),
+    ("9007199254740993*1.0", Fraction(9007199254740993)),
+    ("1e308*10.0", Fraction(10 ** 309)),
+    ("2.0**-1074*0.5", Fraction(1, 2 ** 1075)),
+])
+def test_inexact_float_results_are_promoted(expr, expected):
+    assert Fraction(evaluate_expression(expr, 34)) == expected
+
+
+def test_shortcut_matches_rational_arithmetic():
+    literals = ["0.5", "1.25", "3", "1024.75", "4503599627370496.0", "0.0078125", "-2.5"]
+    for a in literals:
+        for b in literals:
+            for op in "+-*":
+                expr = f"{a}{op}{b}"
+                expected = eval(f"Fraction('{a}'){op}Fraction('{b}')")
+                assert Fraction(evaluate_expression(expr, 34)) == expected, expr
+
+
+def test_division_and_powers():
+    assert evaluate_expression("1/3", 20) == Fraction(1, 3)
+    assert format_precise(evaluate_expression("1/3", 20), 20) == "0.33333333333333333333"
+    assert evaluate_expression("2**100", 20) == 2 ** 100
+    assert format_precise(evaluate_expression("2**0.5", 20), 20) == "1.4142135623730950488"
+
+
+def test_format_precise():
+    assert format_precise(Decimal("1.23E+40"), 20) == "1.23e40"
+    assert format_precise(Fraction(1, 10 ** 9), 20) == "1e-9"
+    assert format_precise(0, 20) == "0"
+
+
+@pytest.mark.parametrize('expr, error', [
+    ("1/0", ZeroDivisionError),
+    ("2**200000", OverflowError),
+    ("'a'", ValueError),
+    ("abs(1)", ValueError),
+])
+def test_errors(expr, error):
+    with pytest.raises(error):
+        evaluate_expression(expr, 20)
@@ -0,0 +1,85 @@
+import pytest
+
+import programmer_engine
+from programmer_engine import convert, convert_expression, evaluate, format_int, wrap
+
+
+@pytest.mark.parametrize('value, word_size, expected', [
+    (255, 8, -1), (128, 8, -128), (127, 8, 127), (-1, 16, -1), (1 << 40, 32, 0), (1 << 40, None, 1 << 40)
+])
+def test_wrap(value, word_size, expected):
+    assert wrap(value, word_size) == expected
+
+
+def test_format_twos_complement():
+    assert format_int(-1, 16, 8) == 'FF'
+    assert format_int(-9, 2, 8) == '11110111'
+    assert format_int(-9, 16, None) == '-9'
+    assert format_int(-9, 10, 32) == '-9'
+
+
+@pytest.mark.parametrize('text, from_base, to_base, word_size, expected', [
+    ('FF', 16, 10, 8, '-1'),
+    ('FF', 16, 10, 16, '255'),
+    ('-9', 10, 16, 32, 'FFFFFFF7'),
+    ('777', 8, 2, None, '111111111'),
+    ('ff', 16, 8, None, '377'),
+])
+def test_convert(text, from_base, to_base, word_size, expected):
+    assert convert(text, from_base, to_base, word_size) == expected
+
+
+@pytest.mark.parametrize('expr, expected', [
+    ('-9', 'FFFFFFF7'),
+    ('10+-9', 'A+FFFFFFF7'),
+    ('(-9)*2', '(FFFFFFF7)*2'),
+    ('10-9', 'A-9'),
+    ('1<<4', '1<<4'),
+    ('12+', 'C+'),
+    ('-', '-'),
+])
+def test_convert_expression(expr, expected):
+    assert convert_expression(expr, 10, 16, 32) == expected
+
+
+@pytest.mark.parametrize('expr, base, word_size, expected', [
+    ('FF+1', 16, 8, 0),
+    ('7F+1', 16, 8, -128),
+    ('1<<10', 10, None, 1024),
+    ('-7/2', 10, 32, -3),
+    ('-7%2', 10, 32, -1),
+    ('~0', 2, 8, -1),
+    ('1010&0110|1', 2, None, 3),
+    ('FF^F', 16, 16, 0xF0),
+    ('100>>2', 10, 16, 25),
+])
+def test_evaluate(expr, base, word_size, expected):
+    assert evaluate(expr, base, word_size) == expected
+
+
+@pytest.mark.parametrize('expr, error', [
+    ('1/0', ZeroDivisionError),
+    ('1>>-1', ValueError),
+    ('1<<99999999', OverflowError),
+    ('2+*', ValueError),
+    ('1.5', ValueError),
+    ('12', ValueError),
+])
+def test_evaluate_errors(expr, error):
+    with pytest.raises(error):
+        evaluate(expr, 2 if expr == '12' else 10, None)
+
+
+def test_large_decimal_round_trip():
+    digits = '9' * 5000
+    value = programmer_engine.parse_int(digits, 10)
+    assert value == 10 ** 5000 - 1
+    assert format_int(value, 10) == digits
+
+
+def test_input_helpers():
+    assert programmer_engine.valid_digit('f', 16)
+    assert not programmer_engine.valid_digit('2', 2)
+    assert programmer_engine.max_input_digits(16, 32) == 8
+    assert programmer_engine.max_input_digits(2, 8) == 8
+    assert programmer_engine.abbreviate('1' * 50, 11) == '11111…11111'
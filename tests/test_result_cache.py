@@ -0,0 +1,131 @@
+import sqlite3
+
+import pytest
+
+import result_cache
+from calculator_engine import AngleMode, HeadlessEngine
+from result_cache import KEY_VERSION, ResultCache, make_key, summarize
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'cache' / 'results.sqlite')
+
+
+def key(text):
+    return make_key('expr', text, None, 20, False)
+
+
+def open_cache(path, max_entries=100):
+    cache = ResultCache(path, max_entries)
+    assert cache.loaded.wait(5)
+    return cache
+
+
+def test_make_key():
+    assert make_key('expr', ' 1 + 2 ', None, 34, False) == f"expr|v{KEY_VERSION}||34|0|1+2"
+    assert make_key('series', 'k', 'deg', None, True) == f"series|v{KEY_VERSION}|deg||1|k"
+
+
+def test_values_persist(path):
+    cache = open_cache(path)
+    cache.put(key('a'), ['1', 'closed form'])
+    assert cache.get(key('a')) == ['1', 'closed form']
+    assert cache.get(key('b')) is None
+    assert cache.flush(5)
+    cache.close()
+
+    reopened = open_cache(path)
+    assert reopened.persistent
+    assert reopened.get(key('a')) == ['1', 'closed form']
+    assert reopened.stats()['hits'] == 1
+    reopened.close()
+
+
+def test_lru_eviction(path):
+    cache = open_cache(path, max_entries=2)
+    cache.put(key('a'), 1)
+    cache.put(key('b'), 2)
+    cache.get(key('a'))
+    cache.put(key('c'), 3)
+    assert list(cache.entries) == [key('a'), key('c')]
+    assert cache.evictions == 1
+    assert cache.shrink(1) == 1
+    assert cache.shrink(1) == 0
+    assert cache.flush(5)
+    cache.close()
+    reopened = open_cache(path)
+    assert list(reopened.entries) == [key('c')]
+    reopened.close()
+
+
+def test_stale_key_versions_are_purged(path):
+    cache = open_cache(path)
+    cache.close()
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute("INSERT INTO results (key, value, used) VALUES ('expr|deg|20|0|1/3', '\"old\"', 1)")
+        connection.execute("INSERT INTO results (key, value, used) VALUES (?, '\"new\"', 2)",
+                           (key('1/3'),))
+    connection.close()
+    cache = open_cache(path)
+    assert list(cache.entries) == [key('1/3')]
+    cache.close()
+    assert sqlite3.connect(path).execute("SELECT COUNT(*) FROM results").fetchone() == (1,)
+
+
+def test_transient_write_errors_are_retried(path, monkeypatch):
+    monkeypatch.setattr(result_cache, 'RETRY_DELAY', 0.001)
+    apply = ResultCache._apply
+    failures = []
+
+    def flaky(self, connection, operations):
+        if len(failures) < 2:
+            failures.append(operations)
+            raise sqlite3.OperationalError("database is locked")
+        apply(self, connection, operations)
+
+    monkeypatch.setattr(ResultCache, '_apply', flaky)
+    cache = open_cache(path)
+    cache.put(key('a'), 1)
+    assert cache.flush(5)
+    assert len(failures) == 2
+    assert cache.persistent
+    cache.close()
+    reopened = open_cache(path)
+    assert reopened.get(key('a')) == 1
+    reopened.close()
+
+
+def test_unusable_path_falls_back_to_memory(tmp_path):
+    cache = open_cache(str(tmp_path))
+    assert not cache.persistent
+    cache.put('a', 1)
+    assert cache.get('a') == 1
+    assert "memory only" in cache.report()
+    cache.close()
+
+
+def test_expression_keys_ignore_angle_mode(path):
+    cache = open_cache(path)
+    degrees = HeadlessEngine(AngleMode.DEGREES, 20)
+    radians = HeadlessEngine(AngleMode.RADIANS, 20)
+    degrees.result_cache = radians.result_cache = cache
+    assert degrees.compute_expression("1/3") == "0.33333333333333333333"
+    assert radians.compute_expression("1/3") == "0.33333333333333333333"
+    assert (cache.stores, cache.hits) == (1, 1)
+    degrees.compute_series('Σ', 'sin(k)', 1, 10)
+    radians.compute_series('Σ', 'sin(k)', 1, 10)
+    assert cache.stores == 3
+    cache.close()
+
+
+def test_summarize(path):
+    cache = open_cache(path)
+    cache.put(key('1/3'), "0.3")
+    cache.get(key('1/3'))
+    assert cache.flush(5)
+    cache.close()
+    text = summarize(path)
+    assert text.startswith("1 cached results, 1 hits")
+    assert "expr" in text
@@ -0,0 +1,84 @@
+import math
+
+import pytest
+
+import series_engine
+from calculator_engine import AngleMode, HeadlessEngine
+from series_engine import parse_limit, product, summation
+
+
+@pytest.mark.parametrize('expr, start, stop, value, method', [
+    ('k', 1, 100, 5050, "arithmetic series"),
+    ('k^2', 1, 10, 385, "closed form"),
+    ('k^3 - 2*k', 0, 10 ** 9, (10 ** 9 * (10 ** 9 + 1) // 2) ** 2 - 10 ** 9 * (10 ** 9 + 1), "closed form"),
+    ('3*0.5^k', 0, None, 6, "geometric series"),
+    ('2^k', 0, 10, 2047, "geometric series"),
+    ('0', 1, None, 0, "closed form"),
+    ('sin(k)', 1, 1000, sum(math.sin(math.radians(k)) for k in range(1, 1001)), "compensated sum"),
+])
+def test_summation(expr, start, stop, value, method):
+    result = summation(expr, start, stop, degrees=True)
+    assert result.value == pytest.approx(value, rel=1e-12, abs=1e-9)
+    assert result.method == method
+
+
+@pytest.mark.parametrize('expr, value, method', [
+    ('1/k^2', math.pi ** 2 / 6, "tail acceleration"),
+    ('(-1)^(k+1)/k', math.log(2), "alternating acceleration"),
+    ('k/2^k', 2, "direct"),
+])
+def test_infinite_sums(expr, value, method):
+    result = summation(expr, 1, None)
+    assert result.value == pytest.approx(value, rel=1e-9)
+    assert result.method == method
+
+
+@pytest.mark.parametrize('expr', ['1/k', '2^k', '(-1)^k', '(-1)^k*k/(k+1)', 'k'])
+def test_divergent_sums(expr):
+    with pytest.raises(ValueError, match="does not converge"):
+        summation(expr, 1, None)
+
+
+def test_products():
+    assert product('k', 1, 10).value == math.factorial(10)
+    assert product('2', 1, 10).value == 1024
+    assert product('1+1/k^2', 1, None).value == pytest.approx(math.sinh(math.pi) / math.pi, rel=1e-9)
+    assert product('k/(k+1)', 1, 5000).value == pytest.approx(1 / 5001)
+    assert product('k-3', 1, 5000).value == 0
+    with pytest.raises(ValueError, match="Product does not converge"):
+        product('1+(-1)^k/k', 1, None)
+    with pytest.raises(OverflowError, match="Number too large"):
+        product('k', 1, 2000)
+
+
+@pytest.mark.parametrize('expr, start, stop, error, message', [
+    ('2^(10^7)', 1, 3, OverflowError, "Number too large"),
+    ('2^(10^7)*k', 1, 3, OverflowError, "Number too large"),
+    ('10^400*k', 1, 3, OverflowError, "Number too large"),
+    ('0^(-1)', 1, 3, ValueError, "Term undefined"),
+    ('1/(k-3)', 1, 5, ValueError, "Term undefined at k = 3"),
+    ('k(2)', 1, 3, ValueError, "Invalid term"),
+    ('k.real', 1, 3, ValueError, "Invalid term"),
+    ('x*k', 1, 3, ValueError, "Unknown name: x"),
+    ('', 1, 3, ValueError, "Enter a term"),
+    ('k', 5, 1, ValueError, "below lower limit"),
+    ('sin(k)', 1, 10 ** 11, ValueError, "Too many terms"),
+])
+def test_errors(expr, start, stop, error, message):
+    with pytest.raises(error, match=message):
+        summation(expr, start, stop)
+
+
+def test_parse_limit():
+    assert parse_limit('∞') is None
+    assert parse_limit(' -4 ') == -4
+    with pytest.raises(ValueError, match="Invalid limit"):
+        parse_limit('ten')
+
+
+def test_engine_formats_series():
+    engine = HeadlessEngine(AngleMode.RADIANS)
+    assert engine.compute_series('Σ', 'k', 1, 100) == ("5050", "arithmetic series")
+    with pytest.raises(ValueError, match="Unknown operator"):
+        engine.compute_series('∫', 'k', 1, 2)
+    assert set(series_engine.OPERATORS) == {'Σ', 'Π'}
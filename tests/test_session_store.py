@@ -0,0 +1,120 @@
+import os
+import struct
+
+import numpy as np
+import pytest
+
+import session_store
+from session_store import HISTORY_PAGE_SIZE, SessionState, SessionStore
+
+
+def make_state(**changes):
+    state = SessionState(
+        memory_value=2.5, has_memory=True, theme='dark', scientific_mode=True, angle_mode='rad',
+        precision_digits=34, total_expression='1+', current_expression='2', history=['1+1 = 2'])
+    return state._replace(**changes)
+
+
+def _open(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return open(path, 'wb')
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionStore(str(tmp_path / 'sessions' / 'session.bin'))
+
+
+def test_round_trip(store):
+    state = make_state(programmer_base='HEX', word_size=32)
+    assert store.save(state)
+    snapshot = store.load()
+    assert snapshot.state._replace(history=[]) == state._replace(history=[])
+    assert snapshot.load_history() == ['1+1 = 2']
+
+
+@pytest.mark.parametrize('memory', [
+    np.arange(6.0).reshape(2, 3),
+    np.array([[1 + 2j, 3 - 1j]]),
+    3 - 4j,
+])
+def test_memory_kinds(store, memory):
+    store.save(make_state(memory_value=memory))
+    loaded = store.load().state.memory_value
+    assert type(loaded) is type(memory)
+    np.testing.assert_array_equal(loaded, memory)
+
+
+def test_defaults_for_optional_fields(store):
+    store.save(make_state(precision_digits=None))
+    state = store.load().state
+    assert state.precision_digits is None
+    assert state.programmer_base is None and state.word_size is None
+
+
+def test_history_is_paged_and_lazy(store):
+    history = [f"{i}+0 = {i}" for i in range(HISTORY_PAGE_SIZE * 2 + 5)]
+    store.save(make_state(history=history))
+    snapshot = store.load()
+    assert snapshot.history_count == len(history)
+    assert len(snapshot.pages) == 3
+    assert snapshot.history_page(2) == history[-5:]
+    assert snapshot.load_history() == history
+
+
+def test_saving_on_top_of_unloaded_history(store):
+    old = [f"old {i}" for i in range(40)]
+    store.save(make_state(history=old))
+    base = store.load()
+    store.save(make_state(history=['new 1'], history_base=base))
+    store.save(make_state(history=['new 1', 'new 2'], history_base=base))
+    snapshot = store.load()
+    assert snapshot.history_count == 42
+    assert snapshot.load_history() == old + ['new 1', 'new 2']
+
+
+def test_background_saves_keep_the_newest_state(store):
+    for i in range(20):
+        store.save_in_background(make_state(current_expression=str(i)))
+    assert store.flush(5)
+    assert store.load().state.current_expression == '19'
+
+
+def test_stale_background_save_is_dropped(store):
+    stale = next(store.sequence)
+    assert store.save(make_state(current_expression='new'))
+    assert not store._write(make_state(current_expression='old'), stale)
+    assert store.load().state.current_expression == 'new'
+
+
+def test_matrix_memory_is_written_by_the_writer(store):
+    memory = np.eye(2)
+    store.save_in_background(make_state(memory_value=memory))
+    assert store.flush(5)
+    np.testing.assert_array_equal(store.load().state.memory_value, memory)
+
+
+def test_reads_version_1(store):
+    data = bytearray(session_store.encode(make_state(history=[])))
+    struct.pack_into('<H', data, len(session_store.MAGIC), 1)
+    with _open(store.path) as f:
+        f.write(bytes(data[:-(session_store.LENGTH.size + session_store.WORD_SIZE.size)]))
+    state = store.load().state
+    assert state.theme == 'dark' and state.current_expression == '2'
+    assert state.programmer_base is None
+
+
+@pytest.mark.parametrize('data', [b'', b'NOTASESSION' * 10, None])
+def test_unreadable_files_load_as_none(store, data):
+    if data is None:
+        data = session_store.encode(make_state())[:-7]
+    with _open(store.path) as f:
+        f.write(data)
+    snapshot = store.load()
+    if snapshot is not None:
+        with pytest.raises(ValueError):
+            snapshot.load_history()
+
+
+def test_missing_file(store):
+    assert store.load() is None
@@ -0,0 +1,69 @@
+import json
+import sys
+
+import pytest
+
+from startup_profiler import PROFILE_ENV, StartupProfiler, is_loaded, lazy_import, preload
+
+
+PROBE = """
+with open(__file__ + '.runs', 'a') as f:
+    f.write('x')
+VALUE = 42
+"""
+
+
+@pytest.fixture
+def probe_runs(tmp_path, monkeypatch):
+    (tmp_path / 'lazy_probe.py').write_text(PROBE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, 'lazy_probe', raising=False)
+    runs = tmp_path / 'lazy_probe.py.runs'
+    yield lambda: len(runs.read_text()) if runs.exists() else 0
+    sys.modules.pop('lazy_probe', None)
+
+
+def test_phases_and_first_frame():
+    profiler = StartupProfiler()
+    profiler.checkpoint('import')
+    with profiler.step('build'):
+        pass
+    profiler.first_frame()
+    profiler.first_frame()
+    summary = profiler.summary()
+    assert [name for name, _ in summary['phases_ms']] == ['import', 'build', 'first frame']
+    assert summary['time_to_first_frame_ms'] >= sum(ms for _, ms in summary['phases_ms']) - 1e-6
+    assert 'time to first frame' in profiler.format()
+
+
+def test_report_once_to_json(tmp_path, monkeypatch, capsys):
+    path = tmp_path / 'startup.json'
+    monkeypatch.setenv(PROFILE_ENV, str(path))
+    profiler = StartupProfiler()
+    profiler.first_frame()
+    profiler.finish()
+    profiler.finish()
+    assert capsys.readouterr().out.count('Startup profile') == 1
+    assert json.loads(path.read_text())['time_to_first_frame_ms'] is not None
+
+
+def test_disabled_profiler_stays_quiet(monkeypatch, capsys):
+    monkeypatch.delenv(PROFILE_ENV, raising=False)
+    StartupProfiler().finish()
+    assert capsys.readouterr().out == ''
+
+
+def test_lazy_import_runs_module_on_first_use(probe_runs):
+    module = lazy_import('lazy_probe')
+    assert not is_loaded(module)
+    assert probe_runs() == 0
+    assert lazy_import('lazy_probe') is module
+    assert module.VALUE == 42
+    assert is_loaded(module)
+    assert preload('lazy_probe') is module
+    assert probe_runs() == 1
+
+
+def test_lazy_import_of_missing_module():
+    with pytest.raises(ImportError):
+        lazy_import('no_such_calculator_module')
@@ -0,0 +1,98 @@
+import math
+
+import numpy as np
+import pytest
+
+from stats_engine import RunningStats, iter_file_chunks
+
+
+def test_add_matches_numpy():
+    data = [2.5, -1.0, 4.0, 10.25, 3.0]
+    stats = RunningStats(seed=1)
+    for x in data:
+        stats.add(x)
+    assert stats.n == 5
+    assert stats.mean == pytest.approx(np.mean(data))
+    assert stats.variance == pytest.approx(np.var(data, ddof=1))
+    assert stats.population_std_dev == pytest.approx(np.std(data))
+    assert (stats.minimum, stats.maximum) == (-1.0, 10.25)
+    assert stats.total == pytest.approx(sum(data))
+
+
+def test_add_array_agrees_with_add():
+    data = np.random.default_rng(3).normal(5, 2, 1000)
+    one, many = RunningStats(seed=1), RunningStats(seed=1)
+    for x in data:
+        one.add(x)
+    many.add_array(data[:400])
+    many.add_array(data[400:])
+    assert many.n == one.n
+    assert many.mean == pytest.approx(one.mean)
+    assert many.variance == pytest.approx(one.variance)
+
+
+def test_compensated_total():
+    stats = RunningStats()
+    for x in [1e16, 1.0, -1e16, 1.0]:
+        stats.add(x)
+    assert stats.total == 2.0
+
+
+def test_merge_combines_moments():
+    data = np.arange(100, dtype=float)
+    left, right = RunningStats(seed=1), RunningStats(seed=2)
+    left.add_array(data[:30])
+    right.add_array(data[30:])
+    left.merge(right)
+    assert left.n == 100
+    assert left.mean == pytest.approx(49.5)
+    assert left.variance == pytest.approx(np.var(data, ddof=1))
+    assert left.quantile(0.5) == pytest.approx(49.5)
+
+
+def test_quantiles_are_exact_below_reservoir_size():
+    stats = RunningStats(reservoir_size=16)
+    stats.add_array(range(10))
+    assert stats.is_exact_quantiles
+    assert stats.quantile(0) == 0 and stats.quantile(1) == 9
+    stats.add_array(range(10))
+    assert not stats.is_exact_quantiles
+
+
+@pytest.mark.parametrize('values', [[1.0, math.nan], [math.inf]])
+def test_rejects_non_finite(values):
+    with pytest.raises(ValueError, match="finite"):
+        RunningStats().add_array(values)
+    with pytest.raises(ValueError, match="finite"):
+        RunningStats().add(values[-1])
+
+
+def test_errors_without_enough_data():
+    stats = RunningStats()
+    with pytest.raises(ValueError, match="No data"):
+        stats.quantile(0.5)
+    stats.add(1)
+    with pytest.raises(ValueError, match="two data points"):
+        stats.variance
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        stats.quantile(1.5)
+
+
+def test_text_file_with_header(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_text("name,value\n# comment\na,1.5\nb,2.5\n\nc,3.5\n")
+    stats = RunningStats()
+    assert stats.add_file(str(path), column=1, chunk_size=2) == 3
+    assert stats.mean == pytest.approx(2.5)
+
+
+def test_binary_and_npy_files(tmp_path):
+    data = np.linspace(0, 1, 11)
+    raw, npy = tmp_path / 'data.f64', tmp_path / 'data.npy'
+    data.tofile(str(raw))
+    np.save(str(npy), np.column_stack([data, data * 2]))
+    chunks = list(iter_file_chunks(str(raw), chunk_size=4))
+    assert [c.size for c in chunks] == [4, 4, 3]
+    stats = RunningStats()
+    stats.add_file(str(npy), column=1)
+    assert stats.maximum == 2.0
@@ -0,0 +1,79 @@
+import math
+
+import numpy as np
+import pytest
+
+import trig_kernels
+
+
+@pytest.mark.parametrize('degrees, expected', [
+    (0, 0.0), (30, 0.5), (90, 1.0), (150, 0.5), (180, 0.0), (210, -0.5),
+    (270, -1.0), (360, 0.0), (-30, -0.5), (390, 0.5), (720 + 180, 0.0)
+])
+def test_sin_exact_angles(degrees, expected):
+    assert trig_kernels.sin_deg(degrees) == expected
+
+
+@pytest.mark.parametrize('degrees, expected', [
+    (0, 1.0), (60, 0.5), (90, 0.0), (120, -0.5), (180, -1.0), (270, 0.0), (-60, 0.5)
+])
+def test_cos_exact_angles(degrees, expected):
+    assert trig_kernels.cos_deg(degrees) == expected
+
+
+def test_no_negative_zero():
+    assert math.copysign(1, trig_kernels.sin_deg(-180)) == 1
+    assert math.copysign(1, trig_kernels.cos_deg(-90)) == 1
+
+
+def test_matches_radians_elsewhere():
+    for degrees in np.linspace(-1000, 1000, 997):
+        assert trig_kernels.sin_deg(degrees) == pytest.approx(math.sin(math.radians(degrees)), abs=1e-12)
+        assert trig_kernels.cos_deg(degrees) == pytest.approx(math.cos(math.radians(degrees)), abs=1e-12)
+
+
+@pytest.mark.parametrize('func, degrees', [
+    (trig_kernels.tan_deg, 90), (trig_kernels.tan_deg, -270),
+    (trig_kernels.csc_deg, 180), (trig_kernels.sec_deg, 270), (trig_kernels.cot_deg, 0)
+])
+def test_poles_raise(func, degrees):
+    with pytest.raises(ValueError, match="undefined"):
+        func(degrees)
+
+
+def test_reciprocals():
+    assert trig_kernels.tan_deg(45) == pytest.approx(1)
+    assert trig_kernels.csc_deg(30) == 2
+    assert trig_kernels.sec_deg(60) == 2
+    assert trig_kernels.cot_deg(45) == pytest.approx(1)
+
+
+@pytest.mark.parametrize('name', ['sin', 'cos', 'tan', 'csc', 'sec', 'cot'])
+def test_array_kernels_match_scalar(name):
+    angles = np.concatenate([np.arange(-720, 721, 15.0), np.linspace(-400, 400, 101)])
+    scalar = trig_kernels.DEGREE_FUNCTIONS[name]
+    result = trig_kernels.DEGREE_ARRAY_FUNCTIONS[name](angles)
+    for degrees, value in zip(angles, result):
+        try:
+            expected = scalar(degrees)
+        except ValueError:
+            assert math.isnan(value)
+        else:
+            assert value == pytest.approx(expected, rel=1e-12, abs=1e-15)
+
+
+def test_fast_path_boundaries():
+    near = math.nextafter(30.0, 31.0)
+    assert trig_kernels.sin_deg(near) == math.sin(near * trig_kernels.DEG)
+    assert trig_kernels.sin_deg(720.0) == 0.0
+    assert trig_kernels.sin_deg(-720.0 - 30.0) == -0.5
+    assert trig_kernels.cos_deg(7.5) == pytest.approx(math.cos(math.radians(7.5)), abs=1e-15)
+    assert trig_kernels.sin_deg(3.6e12 + 30.0) == 0.5
+
+
+def test_array_fast_path_matches_reduction():
+    angles = np.array([-705.0, -30.0, 0.0, math.nextafter(45.0, 0.0), 45.0, 600.0, 719.0])
+    fast = trig_kernels.sin_deg_array(angles)
+    reduced = trig_kernels.sin_deg_array(np.append(angles, 1e6))[:-1]
+    assert fast == pytest.approx(reduced, rel=1e-12, abs=1e-15)
+    assert fast[1] == -0.5 and fast[4] == trig_kernels.SQRT_HALF and fast[5] == -trig_kernels.SQRT3_HALF
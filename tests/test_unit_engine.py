@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+import unit_engine
+from calculator_engine import HeadlessEngine
+
+
+@pytest.mark.parametrize('value, from_unit, to_unit, expected', [
+    (1, 'km', 'm', 1000),
+    (1, 'mi', 'km', 1.609344),
+    (1, 'ft', 'cm', 30.48),
+    (100, '°C', '°F', 212),
+    (32, '°F', 'K', 273.15),
+    (0, 'K', '°R', 0),
+    (1, 'kWh', 'J', 3.6e6),
+    (1, 'GiB', 'MB', 1073.741824),
+    (1, 'lb', 'oz', 16),
+])
+def test_convert(value, from_unit, to_unit, expected):
+    assert unit_engine.convert(value, from_unit, to_unit) == pytest.approx(expected, rel=1e-12)
+
+
+def test_every_pair_round_trips():
+    for category in unit_engine.categories():
+        names = unit_engine.units(category)
+        for a in names:
+            for b in names:
+                there = unit_engine.convert(12.5, a, b)
+                assert unit_engine.convert(there, b, a) == pytest.approx(12.5, rel=1e-9)
+
+
+def test_convert_array_matches_scalar():
+    values = np.array([-40.0, 0.0, 37.5])
+    np.testing.assert_allclose(unit_engine.convert_array(values, '°C', '°F'), [-40, 32, 99.5])
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="Unknown unit: parsec"):
+        unit_engine.conversion('parsec', 'm')
+    with pytest.raises(ValueError, match="Cannot convert km to kg"):
+        unit_engine.conversion('km', 'kg')
+    with pytest.raises(ValueError, match="Unknown unit category"):
+        unit_engine.units('volume')
+
+
+@pytest.mark.parametrize('value, expected', [
+    (0.0, "0"),
+    (1000.0, "1000"),
+    (1.609344, "1.609344"),
+    (1 / 3, "0.3333333333"),
+    (6.241509074460763e18, "6.241509074e+18"),
+    (1.602176634e-19, "1.602176634e-19"),
+    (2.5e15, "2.5e+15"),
+])
+def test_format_value_uses_significant_digits(value, expected):
+    assert unit_engine.format_value(value) == expected
+
+
+def test_format_value_rejects_overflow():
+    with pytest.raises(OverflowError, match="Number too large"):
+        unit_engine.format_value(float('inf'))
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_engine_conversions():
+    engine = HeadlessEngine()
+    assert engine.compute_conversion(1, 'J', 'eV') == "6.241509074e+18"
+    assert engine.compute_conversion_batch([1, 1e308], 'ly', 'nm') == [
+        (True, "9.460730473e+24"), (False, "Number too large")]
@@ -0,0 +1,103 @@
+import pytest
+
+from variables_engine import DependencyGraph
+
+
+@pytest.fixture
+def graph():
+    g = DependencyGraph()
+    g.define('a = 2')
+    g.define('b = a * 3')
+    g.define('f(x) = x * b + a')
+    g.define('c = f(2)')
+    return g
+
+
+def test_values_and_functions(graph):
+    assert graph.get('b') == 6
+    assert graph.get('c') == 14
+    assert graph.evaluate('f(1) + pi * 0') == 8
+    assert graph.describe('f') == "f(x) = x * b + a"
+
+
+def test_change_recomputes_only_dependents(graph):
+    graph.define('unrelated = 5')
+    counts = dict(graph.recompute_counts)
+    assert graph.define('a = 1') == ['b', 'c']
+    assert graph.get('c') == 7
+    assert graph.recompute_counts['unrelated'] == counts['unrelated']
+    assert graph.recompute_counts['b'] == counts['b'] + 1
+
+
+def test_unchanged_value_stops_propagation():
+    g = DependencyGraph()
+    g.define('a = 2')
+    g.define('b = a * 0')
+    g.define('c = b + 1')
+    assert g.define('a = 3') == ['b']
+
+
+def test_errors_recover(graph):
+    graph.define('d = 1 / (a - 2)')
+    assert "divide by zero" in graph.describe('d')
+    with pytest.raises(ValueError, match="divide by zero"):
+        graph.get('d')
+    graph.define('g = d + 1')
+    with pytest.raises(ValueError, match="Undefined: d"):
+        graph.get('g')
+    graph.define('a = 3')
+    assert graph.get('d') == 1
+    assert graph.get('g') == 2
+
+
+def test_redefining_function_updates_callers(graph):
+    graph.define('f(x) = x + a')
+    assert graph.get('c') == 4
+    graph.define('f = 5')
+    with pytest.raises(ValueError):
+        graph.get('c')
+    graph.define('f(x) = x')
+    assert graph.get('c') == 2
+
+
+def test_remove(graph):
+    assert graph.remove('b') == ['c']
+    assert 'b' not in graph.namespace
+    with pytest.raises(ValueError, match="Undefined: b"):
+        graph.get('c')
+    with pytest.raises(ValueError, match="Unknown name"):
+        graph.remove('b')
+
+
+@pytest.mark.parametrize('text, message', [
+    ('pi = 3', "Cannot redefine pi"),
+    ('__builtins__ = 3', "Cannot redefine"),
+    ('a = a + 1', "Circular reference"),
+    ('x = 2 +', "Invalid expression"),
+    ('x = a.real', "Invalid expression"),
+    ('x = [1]', "Invalid expression"),
+    ('1x = 2', "Use name = expression"),
+    ('g(1) = 2', "Invalid parameter name"),
+])
+def test_rejected_definitions(graph, text, message):
+    with pytest.raises(ValueError, match=message):
+        graph.define(text)
+
+
+def test_indirect_cycle(graph):
+    with pytest.raises(ValueError, match="a → b → a"):
+        graph.define('a = b + 1')
+    assert graph.get('a') == 2
+
+
+def test_function_arity(graph):
+    with pytest.raises(ValueError, match="expects 1 argument"):
+        graph.evaluate('f(1, 2)')
+
+
+def test_namespace_tracks_incrementally(graph):
+    graph.define('a = 10')
+    assert graph.namespace['b'] == 30
+    assert graph.namespace['c'] == 70
+    graph.define('b = 1 / 0')
+    assert 'b' not in graph.namespace
@@ -0,0 +1,225 @@
+import math
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+SQRT_HALF = math.sqrt(0.5)
+SQRT3_HALF = math.sqrt(3.0) / 2
+DEG = math.pi / 180
+FAST_RANGE = 720.0
+TABLE_STEP = 15
+ROUNDING = 1.5 * 2 ** 52
+
+_sin = math.sin
+_cos = math.cos
+
+EXACT_SIN = {
+    30.0: 0.5, -30.0: -0.5,
+    45.0: SQRT_HALF, -45.0: -SQRT_HALF,
+    60.0: SQRT3_HALF, -60.0: -SQRT3_HALF
+}
+EXACT_COS = {
+    30.0: SQRT3_HALF, -30.0: SQRT3_HALF,
+    45.0: SQRT_HALF, -45.0: SQRT_HALF,
+    60.0: 0.5, -60.0: 0.5,
+    90.0: 0.0, -90.0: 0.0
+}
+
+
+def sin_deg(degrees: float) -> float:
+    if -FAST_RANGE < degrees < FAST_RANGE:
+        if degrees != (degrees + ROUNDING) - ROUNDING:
+            return _sin(degrees * DEG)
+        value = SIN_TABLE.get(degrees)
+        if value is not None:
+            return value
+    return _sin_reduced(degrees)
+
+
+def cos_deg(degrees: float) -> float:
+    if -FAST_RANGE < degrees < FAST_RANGE:
+        if degrees != (degrees + ROUNDING) - ROUNDING:
+            return _cos(degrees * DEG)
+        value = COS_TABLE.get(degrees)
+        if value is not None:
+            return value
+    return _cos_reduced(degrees)
+
+
+def _sin_reduced(degrees: float) -> float:
+    r = math.fmod(degrees, 360.0)
+    half_turns = math.floor(r * (1 / 180) + 0.5)
+    d = r - 180.0 * half_turns
+    value = EXACT_SIN.get(d)
+    if value is None:
+        value = math.sin(d * DEG)
+    return (-value if half_turns & 1 else value) + 0.0
+
+
+def _cos_reduced(degrees: float) -> float:
+    r = math.fmod(degrees, 360.0)
+    half_turns = math.floor(r * (1 / 180) + 0.5)
+    d = r - 180.0 * half_turns
+    value = EXACT_COS.get(d)
+    if value is None:
+        value = math.cos(d * DEG)
+    return (-value if half_turns & 1 else value) + 0.0
+
+
+TABLE_ANGLES = np.arange(-FAST_RANGE, FAST_RANGE + TABLE_STEP, TABLE_STEP)
+SIN_TABLE = {float(a): _sin_reduced(float(a)) for a in TABLE_ANGLES}
+COS_TABLE = {float(a): _cos_reduced(float(a)) for a in TABLE_ANGLES}
+SIN_TABLE_ARRAY = np.array(list(SIN_TABLE.values()))
+COS_TABLE_ARRAY = np.array(list(COS_TABLE.values()))
+
+
+def sincos_deg(degrees: float) -> Tuple[float, float]:
+    return sin_deg(degrees), cos_deg(degrees)
+
+
+def tan_deg(degrees: float) -> float:
+    s, c = sincos_deg(degrees)
+    if c == 0:
+        raise ValueError("Math error: tan undefined")
+    return s / c
+
+
+def csc_deg(degrees: float) -> float:
+    s = sin_deg(degrees)
+    if s == 0:
+        raise ValueError("Math error: csc undefined")
+    return 1 / s
+
+
+def sec_deg(degrees: float) -> float:
+    c = cos_deg(degrees)
+    if c == 0:
+        raise ValueError("Math error: sec undefined")
+    return 1 / c
+
+
+def cot_deg(degrees: float) -> float:
+    s, c = sincos_deg(degrees)
+    if s == 0:
+        raise ValueError("Math error: cot undefined")
+    return c / s
+
+
+def _reduce_array(x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    r = x
+    if x.size and (x.max() >= 360.0 or x.min() <= -360.0):
+        r = np.fmod(x, 360.0)
+    half_turns = r * (1 / 180)
+    half_turns += 0.5
+    np.floor(half_turns, out=half_turns)
+    d = half_turns * -180.0
+    d += r
+    return half_turns, d
+
+
+def _finish_array(value: np.ndarray, half_turns: np.ndarray, d: np.ndarray,
+                  exact_values: Dict[float, float]) -> np.ndarray:
+    for angle, exact in exact_values.items():
+        hit = d == angle
+        if hit.any():
+            value[hit] = exact
+    odd = (half_turns == 1.0) | (half_turns == -1.0)
+    value *= 1.0 - 2.0 * odd
+    value += 0.0
+    return value
+
+
+def _in_fast_range(x: np.ndarray) -> bool:
+    return not x.size or (x.max() < FAST_RANGE and x.min() > -FAST_RANGE)
+
+
+def _table_hits(x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    steps = x / TABLE_STEP
+    nearest = np.rint(steps)
+    candidates = np.flatnonzero(nearest == steps)
+    index = nearest[candidates]
+    exact = x[candidates] == index * TABLE_STEP
+    return candidates[exact], (index[exact] + FAST_RANGE / TABLE_STEP).astype(np.intp)
+
+
+def _fast_array(func: Callable, x: np.ndarray, table: np.ndarray) -> np.ndarray:
+    values = x * DEG
+    func(values, out=values)
+    positions, index = _table_hits(x)
+    values[positions] = table[index]
+    return values
+
+
+def sin_deg_array(degrees) -> np.ndarray:
+    x = np.asarray(degrees, dtype=np.float64)
+    if _in_fast_range(x):
+        return _fast_array(np.sin, x, SIN_TABLE_ARRAY)
+    half_turns, d = _reduce_array(x)
+    return _finish_array(np.sin(d * DEG), half_turns, d, EXACT_SIN)
+
+
+def cos_deg_array(degrees) -> np.ndarray:
+    x = np.asarray(degrees, dtype=np.float64)
+    if _in_fast_range(x):
+        return _fast_array(np.cos, x, COS_TABLE_ARRAY)
+    half_turns, d = _reduce_array(x)
+    return _finish_array(np.cos(d * DEG), half_turns, d, EXACT_COS)
+
+
+def sincos_deg_array(degrees) -> Tuple[np.ndarray, np.ndarray]:
+    x = np.asarray(degrees, dtype=np.float64)
+    if _in_fast_range(x):
+        rad = x * DEG
+        positions, index = _table_hits(x)
+        s, c = np.sin(rad), np.cos(rad, out=rad)
+        s[positions] = SIN_TABLE_ARRAY[index]
+        c[positions] = COS_TABLE_ARRAY[index]
+        return s, c
+    half_turns, d = _reduce_array(x)
+    rad = d * DEG
+    return (_finish_array(np.sin(rad), half_turns, d, EXACT_SIN),
+            _finish_array(np.cos(rad), half_turns, d, EXACT_COS))
+
+
+def tan_deg_array(degrees) -> np.ndarray:
+    s, c = sincos_deg_array(degrees)
+    return _safe_divide(s, c)
+
+
+def csc_deg_array(degrees) -> np.ndarray:
+    s = sin_deg_array(degrees)
+    return _safe_divide(np.ones_like(s), s)
+
+
+def sec_deg_array(degrees) -> np.ndarray:
+    c = cos_deg_array(degrees)
+    return _safe_divide(np.ones_like(c), c)
+
+
+def cot_deg_array(degrees) -> np.ndarray:
+    s, c = sincos_deg_array(degrees)
+    return _safe_divide(c, s)
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    pole = denominator == 0
+    return np.where(pole, np.nan, numerator / np.where(pole, 1.0, denominator))
+
+
+DEGREE_FUNCTIONS: Dict[str, Callable[[float], float]] = {
+    'sin': sin_deg,
+    'cos': cos_deg,
+    'tan': tan_deg,
+    'csc': csc_deg,
+    'sec': sec_deg,
+    'cot': cot_deg
+}
+
+DEGREE_ARRAY_FUNCTIONS: Dict[str, Callable] = {
+    'sin': sin_deg_array,
+    'cos': cos_deg_array,
+    'tan': tan_deg_array,
+    'csc': csc_deg_array,
+    'sec': sec_deg_array,
+    'cot': cot_deg_array
+}
@@ -0,0 +1,144 @@
+import math
+import threading
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+Values = Union[float, np.ndarray]
+
+SIGNIFICANT_DIGITS = 10
+
+
+class Conversion(NamedTuple):
+    scale: float
+    offset: float
+    category: str
+
+    def apply(self, values: Values) -> Values:
+        if self.offset:
+            return values * self.scale + self.offset
+        return values * self.scale
+
+
+UNIT_GRAPH: Dict[str, List[Tuple[str, float, str, float]]] = {
+    'length': [
+        ('km', 1000, 'm', 0), ('cm', 0.01, 'm', 0), ('mm', 0.1, 'cm', 0), ('µm', 0.001, 'mm', 0),
+        ('nm', 0.001, 'µm', 0), ('in', 2.54, 'cm', 0), ('ft', 12, 'in', 0), ('yd', 3, 'ft', 0),
+        ('mi', 1760, 'yd', 0), ('nmi', 1852, 'm', 0), ('au', 149597870700, 'm', 0),
+        ('ly', 9460730472580800, 'm', 0), ('pc', 648000 / math.pi, 'au', 0)
+    ],
+    'mass': [
+        ('g', 0.001, 'kg', 0), ('mg', 0.001, 'g', 0), ('µg', 0.001, 'mg', 0), ('t', 1000, 'kg', 0),
+        ('lb', 0.45359237, 'kg', 0), ('oz', 1 / 16, 'lb', 0), ('st', 14, 'lb', 0),
+        ('ton', 2000, 'lb', 0), ('ct', 200, 'mg', 0)
+    ],
+    'time': [
+        ('ms', 0.001, 's', 0), ('µs', 0.001, 'ms', 0), ('ns', 0.001, 'µs', 0), ('min', 60, 's', 0),
+        ('h', 60, 'min', 0), ('d', 24, 'h', 0), ('wk', 7, 'd', 0), ('yr', 365.25, 'd', 0)
+    ],
+    'energy': [
+        ('kJ', 1000, 'J', 0), ('MJ', 1000, 'kJ', 0), ('cal', 4.184, 'J', 0), ('kcal', 1000, 'cal', 0),
+        ('Wh', 3600, 'J', 0), ('kWh', 1000, 'Wh', 0), ('eV', 1.602176634e-19, 'J', 0),
+        ('BTU', 1055.05585262, 'J', 0), ('erg', 1e-7, 'J', 0)
+    ],
+    'pressure': [
+        ('kPa', 1000, 'Pa', 0), ('MPa', 1000, 'kPa', 0), ('bar', 100000, 'Pa', 0), ('mbar', 0.001, 'bar', 0),
+        ('atm', 101325, 'Pa', 0), ('torr', 1 / 760, 'atm', 0), ('mmHg', 133.322387415, 'Pa', 0),
+        ('psi', 6894.757293168361, 'Pa', 0)
+    ],
+    'data': [
+        ('bit', 0.125, 'B', 0), ('KB', 1000, 'B', 0), ('MB', 1000, 'KB', 0), ('GB', 1000, 'MB', 0),
+        ('TB', 1000, 'GB', 0), ('KiB', 1024, 'B', 0), ('MiB', 1024, 'KiB', 0), ('GiB', 1024, 'MiB', 0),
+        ('TiB', 1024, 'GiB', 0)
+    ],
+    'temperature': [
+        ('°C', 1, 'K', 273.15), ('°F', 5 / 9, '°C', -160 / 9), ('°R', 5 / 9, 'K', 0)
+    ]
+}
+
+_lock = threading.Lock()
+_units: Optional[Dict[str, List[str]]] = None
+_index: Optional[Dict[Tuple[str, str], Conversion]] = None
+
+
+def categories() -> List[str]:
+    return list(UNIT_GRAPH)
+
+
+def units(category: str) -> List[str]:
+    _build_index()
+    if category not in _units:
+        raise ValueError(f"Unknown unit category: {category}")
+    return _units[category]
+
+
+def conversion(from_unit: str, to_unit: str) -> Conversion:
+    index = _index if _index is not None else _build_index()
+    found = index.get((from_unit, to_unit))
+    if found is None:
+        for unit in (from_unit, to_unit):
+            if (unit, unit) not in index:
+                raise ValueError(f"Unknown unit: {unit}")
+        raise ValueError(f"Cannot convert {from_unit} to {to_unit}")
+    return found
+
+
+def convert(value: float, from_unit: str, to_unit: str) -> float:
+    return conversion(from_unit, to_unit).apply(value)
+
+
+def convert_array(values: Sequence[float], from_unit: str, to_unit: str) -> np.ndarray:
+    return conversion(from_unit, to_unit).apply(np.asarray(values, dtype=np.float64))
+
+
+def format_value(value: float) -> str:
+    if not math.isfinite(value):
+        raise OverflowError("Number too large")
+    if value == 0:
+        return "0"
+    return f"{value:.{SIGNIFICANT_DIGITS}g}"
+
+
+def _build_index() -> Dict[Tuple[str, str], Conversion]:
+    global _units, _index
+    with _lock:
+        if _index is not None:
+            return _index
+
+        unit_lists: Dict[str, List[str]] = {}
+        index: Dict[Tuple[str, str], Conversion] = {}
+        for category, edges in UNIT_GRAPH.items():
+            to_root = _resolve(category, edges)
+            unit_lists[category] = list(to_root)
+            for source, (source_scale, source_offset) in to_root.items():
+                for target, (target_scale, target_offset) in to_root.items():
+                    scale = source_scale / target_scale
+                    offset = (source_offset - target_offset) / target_scale
+                    index[source, target] = Conversion(scale, offset, category)
+
+        _units = unit_lists
+        _index = index
+        return index
+
+
+def _resolve(category: str, edges: List[Tuple[str, float, str, float]]) -> Dict[str, Tuple[float, float]]:
+    references = {unit: (scale, reference, offset) for unit, scale, reference, offset in edges}
+    roots = {reference for _, _, reference, _ in edges} - set(references)
+    if len(roots) != 1:
+        raise ValueError(f"Unit graph for {category} must have exactly one base unit")
+
+    to_root: Dict[str, Tuple[float, float]] = {roots.pop(): (1.0, 0.0)}
+    pending = list(references)
+    while pending:
+        unresolved = []
+        for unit in pending:
+            scale, reference, offset = references[unit]
+            if reference in to_root:
+                reference_scale, reference_offset = to_root[reference]
+                to_root[unit] = (scale * reference_scale, offset * reference_scale + reference_offset)
+            else:
+                unresolved.append(unit)
+        if len(unresolved) == len(pending):
+            raise ValueError(f"Unit graph for {category} has a cycle or a dangling unit")
+        pending = unresolved
+    return to_root
@@ -0,0 +1,243 @@
+import ast
+import math
+import re
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+DEFINITION_PATTERN = re.compile(r'^\s*([A-Za-z_]\w*)\s*(?:\(\s*([^)]*)\))?\s*=(.*)$')
+NAME_PATTERN = re.compile(r'^[A-Za-z_]\w*$')
+
+DEFAULT_BUILTINS: Dict[str, object] = {
+    'pi': math.pi,
+    'e': math.e,
+    'sqrt': math.sqrt,
+    'ln': math.log,
+    'log': math.log10,
+    'exp': math.exp,
+    'abs': abs,
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan
+}
+
+ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant, ast.Name, ast.Load, ast.Call,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.USub, ast.UAdd
+)
+
+
+class Node:
+    def __init__(self, name: str, source: str, code, dependencies: Set[str],
+                 params: Tuple[str, ...] = (), is_function: bool = False):
+        self.name = name
+        self.source = source
+        self.code = code
+        self.dependencies = dependencies
+        self.params = params
+        self.is_function = is_function
+        self.value: Optional[float] = None
+        self.error: Optional[str] = None
+
+
+class DependencyGraph:
+    def __init__(self, builtins: Optional[Dict[str, object]] = None):
+        self.builtins = dict(DEFAULT_BUILTINS)
+        if builtins:
+            self.builtins.update(builtins)
+        self.nodes: Dict[str, Node] = {}
+        self.namespace: Dict[str, object] = {'__builtins__': {}, **self.builtins}
+        self.dependents: Dict[str, Set[str]] = {}
+        self.recompute_counts: Dict[str, int] = {}
+        self.last_recomputed: List[str] = []
+
+    def define(self, text: str) -> List[str]:
+        match = DEFINITION_PATTERN.match(text)
+        if not match:
+            raise ValueError("Use name = expression or f(x) = expression")
+
+        name, params_text, body = match.group(1), match.group(2), match.group(3).strip()
+        if name in self.namespace and name not in self.nodes:
+            raise ValueError(f"Cannot redefine {name}")
+
+        if params_text is None:
+            return self.set_formula(name, body)
+
+        params = tuple(p.strip() for p in params_text.split(',') if p.strip())
+        if not all(NAME_PATTERN.match(p) for p in params):
+            raise ValueError("Invalid parameter name")
+        return self.set_function(name, params, body)
+
+    def set_variable(self, name: str, value: float) -> List[str]:
+        return self.set_formula(name, repr(float(value)))
+
+    def set_formula(self, name: str, expr: str) -> List[str]:
+        code, names = self._compile(expr)
+        return self._replace_node(Node(name, expr, code, names))
+
+    def set_function(self, name: str, params: Tuple[str, ...], expr: str) -> List[str]:
+        code, names = self._compile(expr)
+        node = Node(name, expr, code, names - set(params), params=params, is_function=True)
+        return self._replace_node(node)
+
+    def remove(self, name: str) -> List[str]:
+        if name not in self.nodes:
+            raise ValueError(f"Unknown name: {name}")
+        self._unlink(self.nodes.pop(name))
+        self.namespace.pop(name, None)
+        self.recompute_counts.pop(name, None)
+        return self._propagate(name)
+
+    def get(self, name: str) -> float:
+        node = self.nodes.get(name)
+        if node is None or node.is_function:
+            raise ValueError(f"Unknown variable: {name}")
+        if node.error is not None:
+            raise ValueError(node.error)
+        return node.value
+
+    def evaluate(self, expr: str) -> float:
+        code, names = self._compile(expr)
+        return self._run(code)
+
+    def describe(self, name: str) -> str:
+        node = self.nodes[name]
+        if node.is_function:
+            return f"{name}({', '.join(node.params)}) = {node.source}"
+        if node.error is not None:
+            return f"{name} = {node.source}  → {node.error}"
+        return f"{name} = {node.source}  → {node.value!r}"
+
+    def _replace_node(self, node: Node) -> List[str]:
+        cycle = self._find_path(node.dependencies, node.name)
+        if cycle is not None:
+            raise ValueError("Circular reference: " + " → ".join([node.name] + cycle))
+
+        old = self.nodes.get(node.name)
+        if old is not None:
+            self._unlink(old)
+        self.nodes[node.name] = node
+        for dep in node.dependencies:
+            self.dependents.setdefault(dep, set()).add(node.name)
+
+        self.recompute_counts.setdefault(node.name, 0)
+        if node.is_function:
+            self.namespace[node.name] = self._make_function(node)
+        else:
+            self._recompute(node)
+        return self._propagate(node.name)
+
+    def _unlink(self, node: Node):
+        for dep in node.dependencies:
+            users = self.dependents.get(dep)
+            if users is not None:
+                users.discard(node.name)
+                if not users:
+                    del self.dependents[dep]
+
+    def _find_path(self, starts: Set[str], target: str) -> Optional[List[str]]:
+        stack = [(name, [name]) for name in starts]
+        seen: Set[str] = set()
+        while stack:
+            name, path = stack.pop()
+            if name == target:
+                return path
+            if name in seen or name not in self.nodes:
+                continue
+            seen.add(name)
+            stack.extend((dep, path + [dep]) for dep in self.nodes[name].dependencies)
+        return None
+
+    def _propagate(self, changed_name: str) -> List[str]:
+        affected = self._collect_dependents(changed_name)
+        order = self._topological_order(affected)
+
+        changed = {changed_name}
+        recomputed: List[str] = []
+        for name in order:
+            node = self.nodes[name]
+            if not node.dependencies & changed:
+                continue
+            if node.is_function:
+                changed.add(name)
+                continue
+            before = (node.value, node.error)
+            self._recompute(node)
+            recomputed.append(name)
+            if (node.value, node.error) != before:
+                changed.add(name)
+
+        self.last_recomputed = recomputed
+        return recomputed
+
+    def _collect_dependents(self, name: str) -> Set[str]:
+        affected: Set[str] = set()
+        stack = list(self.dependents.get(name, ()))
+        while stack:
+            current = stack.pop()
+            if current in affected:
+                continue
+            affected.add(current)
+            stack.extend(self.dependents.get(current, ()))
+        return affected
+
+    def _topological_order(self, names: Set[str]) -> List[str]:
+        indegree = {name: len(self.nodes[name].dependencies & names) for name in names}
+        ready = sorted(name for name, degree in indegree.items() if degree == 0)
+        order: List[str] = []
+        while ready:
+            name = ready.pop()
+            order.append(name)
+            for user in self.dependents.get(name, ()):
+                if user in indegree:
+                    indegree[user] -= 1
+                    if indegree[user] == 0:
+                        ready.append(user)
+        return order
+
+    def _recompute(self, node: Node):
+        self.recompute_counts[node.name] = self.recompute_counts.get(node.name, 0) + 1
+        try:
+            node.value = self._run(node.code)
+            node.error = None
+            self.namespace[node.name] = node.value
+        except ValueError as e:
+            node.value, node.error = None, str(e)
+            self.namespace.pop(node.name, None)
+
+    def _make_function(self, node: Node) -> Callable:
+        def call(*args):
+            if len(args) != len(node.params):
+                raise ValueError(f"{node.name} expects {len(node.params)} argument(s)")
+            return self._run(node.code, dict(zip(node.params, args)))
+        return call
+
+    def _compile(self, expr: str):
+        expr = expr.replace('^', '**').replace('×', '*').replace('÷', '/').replace('−', '-')
+        try:
+            tree = ast.parse(expr, mode='eval')
+        except SyntaxError:
+            raise ValueError("Invalid expression")
+
+        names: Set[str] = set()
+        for sub in ast.walk(tree):
+            if not isinstance(sub, ALLOWED_NODES):
+                raise ValueError("Invalid expression")
+            if isinstance(sub, ast.Call) and not isinstance(sub.func, ast.Name):
+                raise ValueError("Invalid expression")
+            if isinstance(sub, ast.Name) and sub.id not in self.builtins:
+                names.add(sub.id)
+        return compile(tree, '<variable>', 'eval'), names
+
+    def _run(self, code, params: Optional[Dict[str, object]] = None) -> float:
+        try:
+            result = eval(code, self.namespace, params)
+        except NameError as e:
+            raise ValueError(f"Undefined: {e.name}")
+        except ZeroDivisionError:
+            raise ValueError("Cannot divide by zero")
+        except RecursionError:
+            raise ValueError("Recursion too deep")
+        except (ArithmeticError, TypeError):
+            raise ValueError("Math Error")
+        if not isinstance(result, (int, float)):
+            raise ValueError("Invalid result type")
+        return result